@@ -1,6 +1,6 @@
 from .core.alignment import align, broadcast_arrays, concat
 from .core.variable import Variable, Coordinate
-from .core.dataset import Dataset, open_dataset
+from .core.dataset import Dataset, open_dataset, open_mfdataset
 from .core.dataarray import DataArray
 
 from .conventions import decode_cf
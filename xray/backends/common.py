@@ -1,11 +1,13 @@
 import numpy as np
 import itertools
+import re
 
 from collections import Mapping
 
-from ..core.utils import FrozenOrderedDict
-from ..core.pycompat import iteritems
-from ..core.variable import Coordinate
+from ..core import indexing
+from ..core.utils import FrozenOrderedDict, LRUCache, NDArrayMixin
+from ..core.pycompat import iteritems, range
+from ..core.variable import Coordinate, NumpyArrayAdapter
 
 
 NONE_VAR_NAME = '__values__'
@@ -45,7 +47,191 @@ def is_trivial_index(var):
     return True
 
 
+# default maximum number of bytes of variable data to load at once when
+# writing variables to a data store
+WRITE_BUFFER_SIZE = 2 ** 26
+
+
+def _slab_shape(shape, itemsize, chunksizes=None, buffer_size=None):
+    """Shape of the slabs in which to write an array of the given shape, such
+    that each slab consists of whole chunks and (if possible) takes up no more
+    than buffer_size bytes.
+    """
+    if buffer_size is None:
+        buffer_size = WRITE_BUFFER_SIZE
+    if chunksizes is None:
+        chunksizes = (1,) * len(shape)
+    units = [max(min(c, s), 1) for c, s in zip(chunksizes, shape)]
+    slab = list(shape)
+    # divide the slowest varying axes first, so slabs are contiguous on disk
+    # for arrays without chunks
+    for n in range(len(shape)):
+        slab_bytes = itemsize * int(np.prod(slab))
+        if slab_bytes <= buffer_size:
+            break
+        bytes_per_row = slab_bytes // slab[n]
+        rows = max(buffer_size // (bytes_per_row * units[n]), 1) * units[n]
+        slab[n] = min(slab[n], rows)
+    return tuple(slab)
+
+
+def iter_slabs(shape, itemsize, chunksizes=None, buffer_size=None):
+    """Iterate over tuples of slices dividing an array of the given shape into
+    slabs for writing.
+    """
+    if 0 in shape:
+        return
+    slab = _slab_shape(shape, itemsize, chunksizes, buffer_size)
+    slices = [[slice(start, min(start + step, size))
+               for start in range(0, size, step)]
+              for size, step in zip(shape, slab)]
+    for key in itertools.product(*slices):
+        yield key
+
+
+# cache shared by all remote data stores of blocks of variable data that have
+# already been downloaded, holding at most 256 MB
+BLOCK_CACHE = LRUCache(maxsize=2 ** 28, sizeof=lambda block: block.nbytes)
+
+# default maximum size (in bytes) of each cached block
+BLOCK_CACHE_BLOCK_SIZE = 2 ** 20
+
+
+def is_remote_uri(path):
+    return bool(re.search(r'^https?://', path))
+
+
+class BlockCachedArray(NDArrayMixin):
+    """Wrap an array to cache its values in fixed size blocks.
+
+    Indexing this array only reads blocks that are not already in the cache
+    from the wrapped array, so repeatedly indexing overlapping regions of a
+    remote variable is served from memory. Strided slices that would touch
+    most of the blocks along an axis (e.g., ``array[::1000]``) are instead
+    read directly, without caching. The wrapped array need only support
+    indexing with tuples of slices.
+    """
+    def __init__(self, array, cache_key, cache=None, block_size=None):
+        """
+        Parameters
+        ----------
+        array : array_like
+            Array to wrap.
+        cache_key : hashable
+            Key identifying this array in the cache, e.g., the URL of its
+            dataset and its variable name.
+        cache : MutableMapping, optional
+            Cache in which to store blocks. Defaults to BLOCK_CACHE.
+        block_size : int, optional
+            Maximum number of bytes in each block. Defaults to
+            BLOCK_CACHE_BLOCK_SIZE.
+        """
+        self.array = array
+        self.cache_key = cache_key
+        self.cache = BLOCK_CACHE if cache is None else cache
+        if block_size is None:
+            block_size = BLOCK_CACHE_BLOCK_SIZE
+        self.block_shape = _slab_shape(array.shape, array.dtype.itemsize,
+                                       buffer_size=block_size)
+
+    def _get_block(self, index):
+        key = (self.cache_key, index)
+        try:
+            return self.cache[key]
+        except KeyError:
+            block_key = tuple(slice(i * b, min((i + 1) * b, s))
+                              for i, b, s in zip(index, self.block_shape,
+                                                 self.shape))
+            block = np.asarray(self.array[block_key])
+            self.cache[key] = block
+            return block
+
+    def _read_uncached(self, key):
+        # read integers as slices of length one, then drop those axes
+        sliced = []
+        local_key = []
+        for k, size in zip(key, self.shape):
+            if isinstance(k, slice):
+                sliced.append(k)
+                local_key.append(slice(None))
+            else:
+                k = int(k) + size if k < 0 else int(k)
+                sliced.append(slice(k, k + 1))
+                local_key.append(0)
+        return np.asarray(self.array[tuple(sliced)])[tuple(local_key)]
+
+    def __getitem__(self, key):
+        if self.ndim == 0:
+            return np.asarray(self.array[key])
+        key = indexing.canonicalize_indexer(key, self.ndim)
+
+        positions = []
+        for k, size in zip(key, self.shape):
+            if isinstance(k, slice):
+                p = np.arange(*k.indices(size))
+            else:
+                p = np.atleast_1d(k)
+                p = np.where(p < 0, p + size, p)
+            positions.append(p)
+        if any(p.size == 0 for p in positions):
+            shape = [p.size for k, p in zip(key, positions)
+                     if not isinstance(k, (int, np.integer))]
+            return np.empty(shape, self.dtype)
+
+        # the blocks containing requested values along each axis
+        blocks = [np.unique(p // b)
+                  for p, b in zip(positions, self.block_shape)]
+
+        if all(isinstance(k, (slice, int, np.integer)) for k in key):
+            for k, u, b, s in zip(key, blocks, self.block_shape, self.shape):
+                num_blocks = -(-s // b)
+                if (isinstance(k, slice) and abs(k.indices(s)[2]) > 1
+                        and 2 * u.size > num_blocks):
+                    # reading most blocks to pick out a few values is
+                    # slower than a single strided read
+                    return self._read_uncached(key)
+
+        # offset of each selected block in the region assembled from them
+        lengths = [np.minimum((u + 1) * b, s) - u * b for u, b, s
+                   in zip(blocks, self.block_shape, self.shape)]
+        offsets = [np.concatenate([[0], np.cumsum(n)[:-1]]) for n in lengths]
+
+        if all(u.size == 1 for u in blocks):
+            region = self._get_block(tuple(int(u[0]) for u in blocks))
+        else:
+            region = np.empty([int(n.sum()) for n in lengths],
+                              dtype=self.dtype)
+            for selected in itertools.product(*[enumerate(u)
+                                                for u in blocks]):
+                block = self._get_block(tuple(int(i) for _, i in selected))
+                region_key = tuple(
+                    slice(o[j], o[j] + n) for (j, _), o, n
+                    in zip(selected, offsets, block.shape))
+                region[region_key] = block
+
+        local_key = []
+        for k, p, u, b, o in zip(key, positions, blocks, self.block_shape,
+                                 offsets):
+            local = o[np.searchsorted(u, p // b)] + p % b
+            if isinstance(k, (int, np.integer)):
+                local_key.append(int(local[0]))
+            elif (isinstance(k, slice) and k.indices(1)[2] > 0
+                    and u[-1] - u[0] + 1 == u.size):
+                # the blocks are contiguous, so the slice can be a view
+                local_key.append(slice(int(local[0]), int(local[-1]) + 1,
+                                       k.indices(1)[2]))
+            else:
+                local_key.append(local)
+        result = NumpyArrayAdapter(region)[tuple(local_key)]
+        if np.may_share_memory(result, region):
+            # don't hand out views of blocks stored in the shared cache
+            result = result.copy()
+        return result
+
+
 class AbstractDataStore(Mapping):
+    # cached result of load(), shared by the variables and attrs properties
+    _cached_load = None
 
     def __iter__(self):
         return iter(self.variables)
@@ -80,8 +266,9 @@ class AbstractDataStore(Mapping):
                                   for k, v in iteritems(attributes)}
                     return variables, attributes
 
-        This function will be called anytime variables or attributes
-        are requested, so care should be taken to make sure its fast.
+        The result of this function is cached for the variables and attrs
+        properties, so subclasses that modify the underlying store must call
+        `invalidate_cache` afterwards.
         """
         variables = FrozenOrderedDict((_decode_variable_name(k), v)
                                       for k, v in iteritems(self.get_variables()))
@@ -92,22 +279,28 @@ class AbstractDataStore(Mapping):
         return list(itertools.chain(*[x.dims
                                       for x in self.variables.values()]))
 
+    def _load_cached(self):
+        # Because encoding/decoding might happen which may require both the
+        # attributes and the variables, we load both the attributes and
+        # variables together, but only once until the cache is invalidated.
+        if self._cached_load is None:
+            self._cached_load = self.load()
+        return self._cached_load
+
+    def invalidate_cache(self):
+        """Discard the cached result of `load`, so that the next access of
+        variables or attributes reads them from the underlying store again.
+        """
+        self._cached_load = None
+
     @property
     def variables(self):
-        # Because encoding/decoding might happen which may require both the
-        # attributes and the variables, and because a store may be updated
-        # we need to load both the attributes and variables
-        # anytime either one is requested.
-        variables, _ = self.load()
+        variables, _ = self._load_cached()
         return variables
 
     @property
     def attrs(self):
-        # Because encoding/decoding might happen which may require both the
-        # attributes and the variables, and because a store may be updated
-        # we need to load both the attributes and variables
-        # anytime either one is requested.
-        _, attributes = self.load()
+        _, attributes = self._load_cached()
         return attributes
 
     @property
@@ -115,7 +308,7 @@ class AbstractDataStore(Mapping):
         return self.get_dimensions()
 
     def close(self):
-        pass
+        self.invalidate_cache()
 
     def __enter__(self):
         return self
@@ -125,6 +318,9 @@ class AbstractDataStore(Mapping):
 
 
 class AbstractWritableDataStore(AbstractDataStore):
+    # maximum number of bytes of each variable's data to load at once while
+    # writing; if None, use WRITE_BUFFER_SIZE
+    buffer_size = None
 
     def set_dimension(self, d, l):
         raise NotImplementedError
@@ -136,7 +332,7 @@ class AbstractWritableDataStore(AbstractDataStore):
         raise NotImplementedError
 
     def sync(self):
-        pass
+        self.invalidate_cache()
 
     def store_dataset(self, dataset):
         # in stores variables are all variables AND coordinates
@@ -167,6 +363,15 @@ class AbstractWritableDataStore(AbstractDataStore):
             self.set_variable(_encode_variable_name(vn), v)
             self.set_necessary_dimensions(v)
 
+    def write_values(self, target, variable, chunksizes=None):
+        """Write the values of an xray.Variable into a netCDF-like target
+        array, one slab at a time, so that lazily loaded or computed
+        variables need not be loaded into memory all at once.
+        """
+        for key in iter_slabs(variable.shape, variable.dtype.itemsize,
+                              chunksizes, self.buffer_size):
+            target[key] = variable[key].values
+
     def set_necessary_dimensions(self, variable):
         for d, l in zip(variable.dims, variable.shape):
             if d not in self.dimensions:
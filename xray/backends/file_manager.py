@@ -0,0 +1,165 @@
+import contextlib
+import threading
+
+from ..core.pycompat import OrderedDict
+
+
+class FilePool(object):
+    """Bounded pool of open file handles with least-recently-used eviction.
+
+    Handles are opened on demand by the FileManager objects that are
+    registered with the pool. When more than `maxsize` handles are open, the
+    least recently used handle is closed; its manager transparently reopens
+    it the next time it is acquired.
+
+    Handles that are leased (see `FileManager.lease`) are never closed by the
+    pool while the lease is held, so the pool may temporarily hold more than
+    `maxsize` handles.
+    """
+    def __init__(self, maxsize=128):
+        self._open = OrderedDict()
+        self._leases = {}
+        self._closing = {}
+        self._lock = threading.RLock()
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        if value < 1:
+            raise ValueError('maxsize must be at least 1')
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def __len__(self):
+        return len(self._open)
+
+    def __contains__(self, manager):
+        return manager in self._open
+
+    def acquire(self, manager, lease=False):
+        with self._lock:
+            if manager in self._open:
+                # move to the most recently used position
+                handle = self._open.pop(manager)
+            else:
+                handle = manager.open()
+            self._open[manager] = handle
+            if lease:
+                self._leases[manager] = self._leases.get(manager, 0) + 1
+            self._evict()
+        return handle
+
+    def release(self, manager):
+        with self._lock:
+            count = self._leases.pop(manager) - 1
+            if count:
+                self._leases[manager] = count
+            elif manager in self._closing:
+                # the manager was closed while its handle was leased
+                manager.close_handle(self._closing.pop(manager))
+            self._evict()
+
+    def discard(self, manager):
+        with self._lock:
+            handle = self._open.pop(manager, None)
+            if handle is not None and manager in self._leases:
+                # close it once the last lease is released
+                self._closing[manager] = handle
+                handle = None
+        if handle is not None:
+            manager.close_handle(handle)
+
+    def _evict(self):
+        excess = len(self._open) - self._maxsize
+        if excess > 0:
+            unleased = [m for m in self._open if m not in self._leases]
+            for manager in unleased[:excess]:
+                manager.close_handle(self._open.pop(manager))
+
+
+FILE_POOL = FilePool()
+
+
+def set_max_open_files(maxsize):
+    """Set the maximum number of files that data stores keep open at once.
+
+    Files opened read-only from a path on disk share a pool of open file
+    handles. When the pool is full, the least recently used file is closed
+    and later reopened on demand.
+    """
+    FILE_POOL.maxsize = maxsize
+
+
+class FileManager(object):
+    """Manage the lifetime of an open file handle for a data store.
+
+    Parameters
+    ----------
+    opener : callable
+        Function called with no arguments that returns a newly opened handle.
+    closer : callable, optional
+        Function called with the handle to close it. By default, call the
+        handle's ``close`` method.
+    pooled : bool, optional
+        If True, the handle is opened lazily and may be closed and reopened
+        by the shared FilePool. Only files that can be reopened without side
+        effects (e.g., read-only files on disk) should be pooled. Otherwise,
+        the handle is opened immediately and kept open until `close` is
+        called.
+    pool : FilePool, optional
+        Pool to use for pooled handles. Defaults to the global pool.
+    """
+    def __init__(self, opener, closer=None, pooled=False, pool=None):
+        self._opener = opener
+        self._closer = closer
+        self._pool = FILE_POOL if pool is None else pool
+        self._pooled = pooled
+        self._handle = None if pooled else opener()
+
+    def open(self):
+        return self._opener()
+
+    def close_handle(self, handle):
+        if self._closer is None:
+            handle.close()
+        else:
+            self._closer(handle)
+
+    @property
+    def pooled(self):
+        return self._pooled
+
+    def acquire(self):
+        """Return an open handle, reopening the file if necessary."""
+        if self._pooled:
+            return self._pool.acquire(self)
+        if self._handle is None:
+            raise ValueError('I/O operation on closed file')
+        return self._handle
+
+    @contextlib.contextmanager
+    def lease(self):
+        """Context manager yielding an open handle that the pool does not
+        close until the block exits.
+        """
+        if not self._pooled:
+            yield self.acquire()
+        else:
+            handle = self._pool.acquire(self, lease=True)
+            try:
+                yield handle
+            finally:
+                self._pool.release(self)
+
+    def close(self):
+        if self._pooled:
+            self._pool.discard(self)
+        elif self._handle is not None:
+            handle = self._handle
+            self._handle = None
+            self.close_handle(handle)
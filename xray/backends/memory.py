@@ -27,10 +27,12 @@ class InMemoryDataStore(AbstractWritableDataStore):
         new_var.attrs.update(new_var.encoding)
         new_var.encoding.clear()
         self._variables[k] = new_var
+        self.invalidate_cache()
 
     def set_attribute(self, k, v):
         # copy to imitate writing to disk.
         self._attributes[k] = copy.deepcopy(v)
+        self.invalidate_cache()
 
     def set_dimension(self, d, l):
         # in this model, dimensions are accounted for in the variables
@@ -1,3 +1,4 @@
+import contextlib
 import warnings
 
 import numpy as np
@@ -8,32 +9,52 @@ from ..core import indexing
 from ..core.utils import FrozenOrderedDict, NDArrayMixin
 from ..core.pycompat import iteritems, basestring, OrderedDict
 
-from .common import AbstractWritableDataStore
+from .common import (AbstractWritableDataStore, BlockCachedArray,
+                     is_remote_uri)
+from .file_manager import FileManager
 from .netcdf3 import encode_nc3_variable, maybe_convert_to_char_array
 
 
 class NetCDF4ArrayWrapper(NDArrayMixin):
-    def __init__(self, array):
-        self.array = array
-
-    @property
-    def dtype(self):
-        dtype = self.array.dtype
+    def __init__(self, variable_name, datastore):
+        self.datastore = datastore
+        self.variable_name = variable_name
+        array = self.get_array(datastore.ds)
+        self._shape = array.shape
+        dtype = array.dtype
         if dtype is str:
             # return object dtype because that's the only way in numpy to
             # represent variable length strings; it also prevents automatic
             # string concatenation via conventions.decode_cf_variable
             dtype = np.dtype('O')
-        return dtype
+        self._dtype = dtype
+
+    def get_array(self, ds):
+        # look up the variable on every access, because the underlying file
+        # may have been closed and reopened by the file pool in the meantime
+        array = ds.variables[self.variable_name]
+        array.set_auto_maskandscale(False)
+        return array
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def shape(self):
+        return self._shape
 
     def __getitem__(self, key):
-        if self.ndim == 0:
-            # work around for netCDF4-python's broken handling of 0-d
-            # arrays (slicing them always returns a 1-dimensional array):
-            # https://github.com/Unidata/netcdf4-python/pull/220
-            data = np.asscalar(self.array[key])
-        else:
-            data = self.array[key]
+        # hold a lease, so the file pool can't close the file mid-read
+        with self.datastore.lease() as ds:
+            array = self.get_array(ds)
+            if self.ndim == 0:
+                # work around for netCDF4-python's broken handling of 0-d
+                # arrays (slicing them always returns a 1-dimensional array):
+                # https://github.com/Unidata/netcdf4-python/pull/220
+                data = np.asscalar(array[key])
+            else:
+                data = array[key]
         return data
 
 
@@ -43,12 +64,14 @@ def _nc4_values_and_dtype(var):
         if len(var) > 0:
             var = var.astype('O')
         dtype = str
-    elif var.dtype.kind in ['i', 'u', 'f', 'S']:
+    elif var.dtype.kind == 'S':
         # use character arrays instead of unicode, because unicode suppot in
         # netCDF4 is still rather buggy
         data, dims = maybe_convert_to_char_array(var.values, var.dims)
         var = Variable(dims, data, var.attrs, var.encoding)
         dtype = var.dtype
+    elif var.dtype.kind in ['i', 'u', 'f']:
+        dtype = var.dtype
     else:
         raise ValueError('cannot infer dtype for netCDF4 variable')
     return var, dtype
@@ -83,17 +106,39 @@ def _ensure_fill_value_valid(data, attributes):
 class NetCDF4DataStore(AbstractWritableDataStore):
     """Store for reading and writing data via the Python-NetCDF4 library.
 
-    This store supports NetCDF3, NetCDF4 and OpenDAP datasets.
+    This store supports NetCDF3, NetCDF4 and OpenDAP datasets. Unless `cache`
+    is False, blocks of data read from OpenDAP datasets are kept in
+    `backends.common.BLOCK_CACHE`, so repeatedly indexing the same region of
+    a remote variable only downloads it once.
     """
     def __init__(self, filename, mode='r', clobber=True, diskless=False,
-                 persist=False, format='NETCDF4', group=None):
+                 persist=False, format='NETCDF4', group=None, cache=True):
         import netCDF4 as nc4
-        ds = nc4.Dataset(filename, mode=mode, clobber=clobber,
-                         diskless=diskless, persist=persist,
-                         format=format)
-        self.ds = _nc4_group(ds, group)
+
+        def opener():
+            return nc4.Dataset(filename, mode=mode, clobber=clobber,
+                               diskless=diskless, persist=persist,
+                               format=format)
+
+        # only files opened read-only from disk can be safely closed and
+        # reopened on demand; everything else keeps its handle open
+        pooled = mode == 'r' and not diskless
+        self._manager = FileManager(opener, pooled=pooled)
+        self._group = group
         self.format = format
         self._filename = filename
+        self._cache = cache and mode == 'r' and is_remote_uri(filename)
+        # raise any errors from opening the file or group immediately
+        self.ds
+
+    @property
+    def ds(self):
+        return _nc4_group(self._manager.acquire(), self._group)
+
+    @contextlib.contextmanager
+    def lease(self):
+        with self._manager.lease() as handle:
+            yield _nc4_group(handle, self._group)
 
     def store(self, variables, attributes):
         # All NetCDF files get CF encoded by default, without this attempting
@@ -101,10 +146,13 @@ class NetCDF4DataStore(AbstractWritableDataStore):
         cf_variables, cf_attrs = cf_encoder(variables, attributes)
         AbstractWritableDataStore.store(self, cf_variables, cf_attrs)
 
-    def open_store_variable(self, var):
+    def open_store_variable(self, name, var):
         var.set_auto_maskandscale(False)
         dimensions = var.dimensions
-        data = indexing.LazilyIndexedArray(NetCDF4ArrayWrapper(var))
+        data = NetCDF4ArrayWrapper(name, self)
+        if self._cache:
+            data = BlockCachedArray(data, (self._filename, self._group, name))
+        data = indexing.LazilyIndexedArray(data)
         attributes = OrderedDict((k, var.getncattr(k))
                                  for k in var.ncattrs())
         _ensure_fill_value_valid(data, attributes)
@@ -130,7 +178,7 @@ class NetCDF4DataStore(AbstractWritableDataStore):
         return Variable(dimensions, data, attributes, encoding)
 
     def get_variables(self):
-        return FrozenOrderedDict((k, self.open_store_variable(v))
+        return FrozenOrderedDict((k, self.open_store_variable(k, v))
                                  for k, v in iteritems(self.ds.variables))
 
     def get_attrs(self):
@@ -143,9 +191,11 @@ class NetCDF4DataStore(AbstractWritableDataStore):
 
     def set_dimension(self, name, length):
         self.ds.createDimension(name, size=length)
+        self.invalidate_cache()
 
     def set_attribute(self, key, value):
         self.ds.setncattr(key, value)
+        self.invalidate_cache()
 
     def set_variable(self, name, variable):
         attrs = variable.attrs.copy()
@@ -178,21 +228,26 @@ class NetCDF4DataStore(AbstractWritableDataStore):
             least_significant_digit=encoding.get('least_significant_digit'),
             fill_value=fill_value)
         nc4_var.set_auto_maskandscale(False)
-        nc4_var[:] = variable.values
+        if variable.ndim == 0 or datatype is str:
+            nc4_var[:] = variable.values
+        else:
+            self.write_values(nc4_var, variable, encoding.get('chunksizes'))
         for k, v in iteritems(attrs):
             # set attributes one-by-one since netCDF4<1.0.10 can't handle
             # OrderedDict as the input to setncatts
             nc4_var.setncattr(k, v)
+        self.invalidate_cache()
 
     def del_attribute(self, key):
         self.ds.delncattr(key)
+        self.invalidate_cache()
 
     def sync(self):
         self.ds.sync()
+        self.invalidate_cache()
 
     def close(self):
-        ds = self.ds
-        # netCDF4 only allows closing the root group
-        while ds.parent is not None:
-            ds = ds.parent
-        ds.close()
+        self.invalidate_cache()
+        # the manager holds the root group, which is the only group that
+        # netCDF4 allows closing
+        self._manager.close()
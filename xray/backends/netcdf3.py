@@ -23,6 +23,24 @@ _nc3_dtype_coercions = {'int64': 'int32', 'float64': 'float32',
                         'bool': 'int8'}
 
 
+def _check_nc3_range(arr, new_dtype):
+    """Raise an error if any values of an array are out of the range of the
+    data type they will be coerced to.
+    """
+    new_dtype = np.dtype(new_dtype)
+    if arr.dtype.kind not in 'iuf' or arr.size == 0:
+        return
+    info = np.iinfo if new_dtype.kind in 'iu' else np.finfo
+    values = arr
+    if arr.dtype.kind == 'f':
+        # missing and infinite values are preserved by casting
+        values = arr[np.isfinite(arr)]
+    if values.size and (values.min() < info(new_dtype).min
+                        or values.max() > info(new_dtype).max):
+        raise ValueError('could not safely cast array from dtype %s to %s'
+                         % (arr.dtype, new_dtype))
+
+
 def coerce_nc3_dtype(arr):
     """Coerce an array to a data type that can be stored in a netCDF-3 file
 
@@ -38,6 +56,7 @@ def coerce_nc3_dtype(arr):
     dtype = str(arr.dtype)
     if dtype in _nc3_dtype_coercions:
         new_dtype = _nc3_dtype_coercions[dtype]
+        _check_nc3_range(arr, new_dtype)
         # TODO: raise a warning whenever casting the data-type instead?
         cast_arr = arr.astype(new_dtype)
         if ((('int' in dtype or 'U' in dtype) and
@@ -60,9 +79,19 @@ def maybe_convert_to_char_array(data, dims):
 
 
 def encode_nc3_variable(var):
-    data = coerce_nc3_dtype(var.values)
-    data, dims = maybe_convert_to_char_array(data, var.dims)
-    return Variable(dims, data, var.attrs, var.encoding)
+    dtype = str(var.dtype)
+    if dtype in _nc3_dtype_coercions:
+        new_dtype = _nc3_dtype_coercions[dtype]
+        # coerce (and check) values lazily, one slab at a time as they are
+        # written, so they are only read once
+        return conventions.lazily_encode_variable(
+            var, coerce_nc3_dtype, new_dtype)
+    elif var.dtype.kind in ['S', 'U']:
+        data = coerce_nc3_dtype(var.values)
+        data, dims = maybe_convert_to_char_array(data, var.dims)
+        return Variable(dims, data, var.attrs, var.encoding)
+    else:
+        return var
 
 
 def _isalnumMUTF8(c):
@@ -4,7 +4,7 @@ from .. import Variable
 from ..core.utils import FrozenOrderedDict, Frozen, NDArrayMixin
 from ..core import indexing
 
-from .common import AbstractDataStore
+from .common import AbstractDataStore, BlockCachedArray
 
 
 class PydapArrayWrapper(NDArrayMixin):
@@ -40,14 +40,22 @@ class PydapDataStore(AbstractDataStore):
     """Store for accessing OpenDAP datasets with pydap.
 
     This store provides an alternative way to access OpenDAP datasets that may
-    be useful if the netCDF4 library is not available.
+    be useful if the netCDF4 library is not available. Unless `cache` is
+    False, blocks of downloaded data are kept in `backends.common.BLOCK_CACHE`
+    so that repeatedly indexing the same region of a variable only downloads
+    it once.
     """
-    def __init__(self, url):
+    def __init__(self, url, cache=True):
         import pydap.client
         self.ds = pydap.client.open_url(url)
+        self._url = url
+        self._cache = cache
 
     def open_store_variable(self, var):
-        data = indexing.LazilyIndexedArray(PydapArrayWrapper(var))
+        data = PydapArrayWrapper(var)
+        if self._cache:
+            data = BlockCachedArray(data, (self._url, var.name))
+        data = indexing.LazilyIndexedArray(data)
         return Variable(var.dimensions, data, var.attributes)
 
     def get_variables(self):
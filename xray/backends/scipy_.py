@@ -6,9 +6,12 @@ import warnings
 from .. import Variable
 from ..conventions import cf_encoder
 from ..core.pycompat import iteritems, basestring, unicode_type, OrderedDict
-from ..core.utils import Frozen, FrozenOrderedDict
+from ..core import indexing
+from ..core.utils import Frozen, FrozenOrderedDict, NDArrayMixin
+from ..core.variable import NumpyArrayAdapter
 
 from .common import AbstractWritableDataStore
+from .file_manager import FileManager
 from .netcdf3 import is_valid_nc3_name, coerce_nc3_dtype, encode_nc3_variable
 from xray.conventions import cf_decoder
 
@@ -26,6 +29,37 @@ def _decode_attrs(d):
                        for (k, v) in iteritems(d))
 
 
+class ScipyArrayWrapper(NDArrayMixin):
+    def __init__(self, variable_name, datastore):
+        self.datastore = datastore
+        self.variable_name = variable_name
+        array = self.get_array(datastore.ds)
+        self._shape = array.shape
+        self._dtype = array.dtype
+
+    def get_array(self, ds):
+        # look up the variable on every access, because the underlying file
+        # may have been closed and reopened by the file pool in the meantime
+        return ds.variables[self.variable_name].data
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def shape(self):
+        return self._shape
+
+    def __getitem__(self, key):
+        with self.datastore.lease() as ds:
+            data = NumpyArrayAdapter(self.get_array(ds))[key]
+            if ds.use_mmap and self.datastore.pooled:
+                # copy the data, so it remains valid if the file pool closes
+                # the file (and the memory map onto it)
+                data = np.array(data, copy=True)
+        return data
+
+
 class ScipyDataStore(AbstractWritableDataStore):
     """Store for reading and writing data via scipy.io.netcdf.
 
@@ -50,8 +84,28 @@ class ScipyDataStore(AbstractWritableDataStore):
             # TODO: this check has the unfortunate side-effect that
             # paths to files cannot start with 'CDF'.
             filename_or_obj = BytesIO(filename_or_obj)
-        self.ds = scipy.io.netcdf.netcdf_file(
-            filename_or_obj, mode=mode, mmap=mmap, version=version)
+
+        def opener():
+            return scipy.io.netcdf.netcdf_file(
+                filename_or_obj, mode=mode, mmap=mmap, version=version)
+
+        # only files opened read-only from disk can be safely closed and
+        # reopened on demand; everything else keeps its handle open
+        pooled = mode == 'r' and isinstance(filename_or_obj, basestring)
+        self._manager = FileManager(opener, pooled=pooled)
+        # raise any errors from opening the file immediately
+        self.ds
+
+    @property
+    def ds(self):
+        return self._manager.acquire()
+
+    @property
+    def pooled(self):
+        return self._manager.pooled
+
+    def lease(self):
+        return self._manager.lease()
 
     def store(self, variables, attributes):
         # All Scipy objects get CF encoded by default, without this attempting
@@ -59,12 +113,13 @@ class ScipyDataStore(AbstractWritableDataStore):
         cf_variables, cf_attrs = cf_encoder(variables, attributes)
         AbstractWritableDataStore.store(self, cf_variables, cf_attrs)
 
-    def open_store_variable(self, var):
-        return Variable(var.dimensions, var.data,
+    def open_store_variable(self, name, var):
+        data = indexing.LazilyIndexedArray(ScipyArrayWrapper(name, self))
+        return Variable(var.dimensions, data,
                         _decode_attrs(var._attributes))
 
     def get_variables(self):
-        return FrozenOrderedDict((k, self.open_store_variable(v))
+        return FrozenOrderedDict((k, self.open_store_variable(k, v))
                                  for k, v in iteritems(self.ds.variables))
 
     def get_attrs(self):
@@ -78,6 +133,7 @@ class ScipyDataStore(AbstractWritableDataStore):
             raise ValueError('%s does not support modifying dimensions'
                              % type(self).__name__)
         self.ds.createDimension(name, length)
+        self.invalidate_cache()
 
     def _validate_attr_key(self, key):
         if not is_valid_nc3_name(key):
@@ -96,30 +152,34 @@ class ScipyDataStore(AbstractWritableDataStore):
     def set_attribute(self, key, value):
         self._validate_attr_key(key)
         setattr(self.ds, key, self._cast_attr_value(value))
+        self.invalidate_cache()
 
     def set_variable(self, name, variable):
         # TODO, create a netCDF3 encoder
         variable = encode_nc3_variable(variable)
         self.set_necessary_dimensions(variable)
-        data = variable.values
-        self.ds.createVariable(name, data.dtype, variable.dims)
+        self.ds.createVariable(name, variable.dtype, variable.dims)
         scipy_var = self.ds.variables[name]
-        if data.ndim == 0:
-            scipy_var.assignValue(data)
+        if variable.ndim == 0:
+            scipy_var.assignValue(variable.values)
         else:
-            scipy_var[:] = data[:]
+            self.write_values(scipy_var, variable)
         for k, v in iteritems(variable.attrs):
             self._validate_attr_key(k)
             setattr(scipy_var, k, self._cast_attr_value(v))
+        self.invalidate_cache()
 
     def del_attribute(self, key):
         delattr(self.ds, key)
+        self.invalidate_cache()
 
     def sync(self):
         self.ds.flush()
+        self.invalidate_cache()
 
     def close(self):
-        self.ds.close()
+        self.invalidate_cache()
+        self._manager.close()
 
     def __exit__(self, type, value, tb):
         self.close()
@@ -1,3 +1,4 @@
+import hashlib
 import re
 import warnings
 import numpy as np
@@ -200,21 +201,36 @@ def _cleanup_netcdf_time_units(units):
     return units
 
 
+def _encode_datetime_with_netcdf4(dates, units, calendar):
+    """Fallback method for encoding dates using netCDF4-python.
+
+    This method is more flexible than xray's parsing using datetime64[ns]
+    arrays but also slower because it loops over each element.
+    """
+    import netCDF4 as nc4
+
+    if np.issubdtype(dates.dtype, np.datetime64):
+        # numpy's broken datetime conversion only works for us precision
+        dates = dates.astype('M8[us]').astype(datetime)
+
+    def encode_datetime(d):
+        return np.nan if d is None else nc4.date2num(d, units, calendar)
+
+    return np.array([encode_datetime(d) for d in dates.flat])
+
 
 def encode_cf_datetime(dates, units=None, calendar=None):
     """Given an array of datetime objects, returns the tuple `(num, units,
     calendar)` suitable for a CF complient time variable.
 
-    Unlike encode_cf_datetime, this function does not (yet) speedup encoding
-    of datetime64 arrays. However, unlike `date2num`, it can handle datetime64
-    arrays.
+    For datetime64 arrays in standard (Gregorian) calendars, this function
+    uses vectorized integer arithmetic, which makes it much faster than
+    netCDF4.date2num. Otherwise, it falls back to using netCDF4.
 
     See also
     --------
     netCDF4.date2num
     """
-    import netCDF4 as nc4
-
     dates = np.asarray(dates)
 
     if units is None:
@@ -225,16 +241,37 @@ def encode_cf_datetime(dates, units=None, calendar=None):
     if calendar is None:
         calendar = 'proleptic_gregorian'
 
-    if np.issubdtype(dates.dtype, np.datetime64):
-        # for now, don't bother doing any trickery like decode_cf_datetime to
-        # convert dates to numbers faster
-        # note: numpy's broken datetime conversion only works for us precision
-        dates = dates.astype('M8[us]').astype(datetime)
+    delta, ref_date = _unpack_netcdf_time_units(units)
+    try:
+        if (calendar not in _STANDARD_CALENDARS
+                or not np.issubdtype(dates.dtype, np.datetime64)):
+            # datetime objects may be outside the range of datetime64[ns]
+            raise OutOfBoundsDatetime
 
-    def encode_datetime(d):
-        return np.nan if d is None else nc4.date2num(d, units, calendar)
+        delta_ns = np.timedelta64(1, _netcdf_to_numpy_timeunit(delta))
+        delta_ns = int(delta_ns.astype('timedelta64[ns]').view(np.int64))
+        ref_date_ns = pd.Timestamp(ref_date).value
+
+        # work in integer nanoseconds to avoid losing precision, and only
+        # convert to floats for the fractional part of each offset
+        flat_dates = dates.astype('M8[ns]').ravel()
+        if dates.dtype != flat_dates.dtype:
+            # numpy silently overflows when casting dates outside the range
+            # of datetime64[ns], so check that they survive the round trip
+            original = dates.ravel()
+            if not ((flat_dates.astype(dates.dtype) == original)
+                    | pd.isnull(original)).all():
+                raise OutOfBoundsDatetime
+        offsets = flat_dates.view(np.int64) - ref_date_ns
+        num = offsets // delta_ns + (offsets % delta_ns) / float(delta_ns)
+        missing = pd.isnull(flat_dates)
+        if missing.any():
+            num[missing] = np.nan
+    # ValueError is raised by pd.Timestamp for non-ISO timestamp strings,
+    # in which case we fall back to using netCDF4
+    except (OutOfBoundsDatetime, KeyError, ValueError):
+        num = _encode_datetime_with_netcdf4(dates, units, calendar)
 
-    num = np.array([encode_datetime(d) for d in dates.flat])
     num = num.reshape(dates.shape)
     return (num, units, calendar)
 
@@ -312,10 +349,40 @@ class MaskedAndScaledArray(utils.NDArrayMixin):
                  self.scale_factor, self.add_offset, self._dtype))
 
 
+# cache of recently decoded time values, keyed by units, calendar and a hash
+# of the encoded values, so repeatedly accessing the same time axis (e.g., the
+# time coordinate of each file in a collection) doesn't decode it again. It
+# holds at most 64 MB of decoded values.
+DECODED_TIMES_CACHE = utils.LRUCache(maxsize=2 ** 26,
+                                     sizeof=lambda dates: dates.nbytes)
+
+
+def _cached_decode_cf_datetime(num_dates, units, calendar):
+    num_dates = np.asarray(num_dates)
+    # decoded values are datetime64[ns], with 8 bytes each
+    if (num_dates.dtype.kind not in 'iuf'
+            or 8 * num_dates.size > DECODED_TIMES_CACHE.maxsize):
+        return decode_cf_datetime(num_dates, units, calendar)
+    digest = hashlib.sha1(
+        np.ascontiguousarray(num_dates).ravel().view(np.uint8))
+    key = (units, calendar, num_dates.dtype.str, num_dates.shape,
+           digest.hexdigest())
+    try:
+        dates = DECODED_TIMES_CACHE[key]
+    except KeyError:
+        dates = decode_cf_datetime(num_dates, units, calendar)
+        DECODED_TIMES_CACHE[key] = dates
+    # return a copy, so modifying the result doesn't modify the cache
+    return dates.copy()
+
+
 class DecodedCFDatetimeArray(utils.NDArrayMixin):
     """Wrapper around array-like objects to create a new indexable object where
     values, when accessesed, are automatically converted into datetime objects
     using decode_cf_datetime.
+
+    Decoded values are cached (see DECODED_TIMES_CACHE), so accessing the same
+    values again does not require decoding them again.
     """
     def __init__(self, array, units, calendar=None):
         self.array = array
@@ -327,8 +394,8 @@ class DecodedCFDatetimeArray(utils.NDArrayMixin):
         return np.dtype('datetime64[ns]')
 
     def __getitem__(self, key):
-        return decode_cf_datetime(self.array[key], units=self.units,
-                                  calendar=self.calendar)
+        return _cached_decode_cf_datetime(self.array[key], units=self.units,
+                                          calendar=self.calendar)
 
 
 class DecodedCFTimedeltaArray(utils.NDArrayMixin):
@@ -396,6 +463,62 @@ class CharToStringArray(utils.NDArrayMixin):
         return values
 
 
+class LazilyEncodedArray(utils.NDArrayMixin):
+    """Wrapper around array-like objects to create a new indexable object where
+    values, when accessed, are encoded by applying an element-wise function.
+
+    This is the counterpart of the lazy decoding wrappers (like
+    MaskedAndScaledArray) for writing data: values are encoded one slab at a
+    time as they are written to disk, instead of all at once in memory.
+
+    >>> x = LazilyEncodedArray(np.array([1.0, 2.0]), lambda x: 10 * x)
+    >>> x[:]
+    array([ 10.,  20.])
+    """
+    def __init__(self, array, func, dtype=None):
+        """
+        Parameters
+        ----------
+        array : array-like
+            Original array of values to wrap.
+        func : callable
+            Element-wise function mapping a numpy.ndarray of original values
+            to an array of encoded values. It should not modify its argument.
+        dtype : np.dtype, optional
+            Data type of the encoded values. By default, the same as the
+            original array.
+        """
+        self.array = array
+        self.func = func
+        self._dtype = array.dtype if dtype is None else np.dtype(dtype)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def __getitem__(self, key):
+        return np.asarray(self.func(np.asarray(self.array[key])),
+                          dtype=self._dtype)
+
+    def __repr__(self):
+        return ('%s(%r, func=%r, dtype=%r)'
+                % (type(self).__name__, self.array, self.func, self._dtype))
+
+
+def lazily_encode_variable(var, func, dtype=None, attrs=None, encoding=None):
+    """Return a new Variable whose data is lazily encoded from the data of the
+    given variable by the element-wise function `func`.
+    """
+    # use _data instead of data so as not to trigger loading data
+    data = indexing.LazilyIndexedArray(
+        LazilyEncodedArray(var._data, func, dtype))
+    if attrs is None:
+        attrs = var.attrs
+    if encoding is None:
+        encoding = var.encoding
+    return Variable(var.dims, data, attrs, encoding)
+
+
 def string_to_char(arr):
     """Like netCDF4.stringtochar, but faster and more flexible.
     """
@@ -463,48 +586,66 @@ def maybe_encode_timedelta(var):
     return var
 
 
-def maybe_encode_offset_and_scale(var, needs_copy=True):
+def _var_attrs_and_encoding(var):
+    return var.attrs.copy(), var.encoding.copy()
+
+
+def maybe_encode_offset_and_scale(var):
     if any(k in var.encoding for k in ['add_offset', 'scale_factor']):
-        dims, values, attrs, encoding = _var_as_tuple(var)
-        values = np.array(values, dtype=float, copy=needs_copy)
-        needs_copy = False
-        if 'add_offset' in encoding:
-            values -= pop_to(encoding, attrs, 'add_offset')
-        if 'scale_factor' in encoding:
-            values /= pop_to(encoding, attrs, 'scale_factor')
-        var = Variable(dims, values, attrs, encoding)
-    return var, needs_copy
+        attrs, encoding = _var_attrs_and_encoding(var)
+        add_offset = pop_to(encoding, attrs, 'add_offset')
+        scale_factor = pop_to(encoding, attrs, 'scale_factor')
+
+        def encode(values):
+            values = np.array(values, dtype=float)
+            if add_offset is not None:
+                values -= add_offset
+            if scale_factor is not None:
+                values /= scale_factor
+            return values
+
+        var = lazily_encode_variable(var, encode, float, attrs, encoding)
+    return var
 
 
-def maybe_encode_fill_value(var, needs_copy=True):
+def maybe_encode_fill_value(var):
     # replace NaN with the fill value
     if '_FillValue' in var.encoding:
-        dims, values, attrs, encoding = _var_as_tuple(var)
+        attrs, encoding = _var_attrs_and_encoding(var)
         fill_value = pop_to(encoding, attrs, '_FillValue')
         if not pd.isnull(fill_value):
-            missing = pd.isnull(values)
-            if missing.any():
-                if needs_copy:
+            def encode(values):
+                missing = pd.isnull(values)
+                if missing.any():
                     values = values.copy()
-                    needs_copy = False
-                values[missing] = fill_value
-        var = Variable(dims, values, attrs, encoding)
-    return var, needs_copy
+                    values[missing] = fill_value
+                return values
+
+            var = lazily_encode_variable(var, encode, None, attrs, encoding)
+        else:
+            var = Variable(var.dims, var._data, attrs, encoding)
+    return var
 
 
-def maybe_encode_dtype(var, needs_copy=True):
+def maybe_encode_dtype(var):
     if 'dtype' in var.encoding:
-        dims, values, attrs, encoding = _var_as_tuple(var)
+        attrs, encoding = _var_attrs_and_encoding(var)
         dtype = np.dtype(encoding.pop('dtype'))
         if dtype.kind != 'O':
-            if np.issubdtype(dtype, int):
-                out = np.empty_like(values) if needs_copy else values
-                np.around(values, out=out)
-            if dtype == 'S1' and values.dtype != 'S1':
-                values = string_to_char(np.asarray(values, 'S'))
-                dims = dims + ('string%s' % values.shape[-1],)
-            values = np.asarray(values, dtype=dtype)
-            var = Variable(dims, values, attrs, encoding)
+            if dtype == 'S1' and var.dtype != 'S1':
+                # converting to characters adds a dimension, so do it eagerly
+                values = string_to_char(np.asarray(var.values, 'S'))
+                dims = var.dims + ('string%s' % values.shape[-1],)
+                values = np.asarray(values, dtype=dtype)
+                var = Variable(dims, values, attrs, encoding)
+            else:
+                def encode(values):
+                    if np.issubdtype(dtype, int):
+                        values = np.around(values)
+                    return values
+
+                var = lazily_encode_variable(var, encode, dtype, attrs,
+                                             encoding)
     return var
 
 
@@ -569,6 +710,9 @@ def encode_cf_variable(var, needs_copy=True):
     ----------
     var : xray.Variable
         A variable holding un-encoded data.
+    needs_copy : bool, optional
+        Ignored; encoding is applied lazily and never modifies `var`. Kept
+        for backwards compatibility.
 
     Returns
     -------
@@ -577,9 +721,9 @@ def encode_cf_variable(var, needs_copy=True):
     """
     var = maybe_encode_datetime(var)
     var = maybe_encode_timedelta(var)
-    var, needs_copy = maybe_encode_offset_and_scale(var, needs_copy)
-    var, needs_copy = maybe_encode_fill_value(var, needs_copy)
-    var = maybe_encode_dtype(var, needs_copy)
+    var = maybe_encode_offset_and_scale(var)
+    var = maybe_encode_fill_value(var)
+    var = maybe_encode_dtype(var)
     var = ensure_dtype_not_object(var)
     return var
 
@@ -29,6 +29,22 @@ class ImplementsArrayReduce(object):
             and 'axis' arguments can be supplied. If neither are supplied, then
             `{name}` is calculated over axes."""
 
+    @classmethod
+    def _cum_method(cls, func):
+        def wrapped_func(self, dim=None, axis=None, skipna=None,
+                         keep_attrs=False, **kwargs):
+            return self.accumulate(func, dim, axis, keep_attrs, skipna=skipna,
+                                   **kwargs)
+        return wrapped_func
+
+    _cum_extra_args_docstring = \
+        """dim : str or sequence of str, optional
+            Dimension(s) along which to apply `{name}`.
+        axis : int or sequence of int, optional
+            Axis(es) along which to apply `{name}`. Only one of the 'dim'
+            and 'axis' arguments can be supplied. If neither are supplied, then
+            `{name}` is applied along each axis in turn."""
+
 
 class ImplementsDatasetReduce(object):
     @classmethod
@@ -49,6 +65,21 @@ class ImplementsDatasetReduce(object):
             Dimension(s) over which to apply `func`.  By default `func` is
             applied over all dimensions."""
 
+    @classmethod
+    def _cum_method(cls, func):
+        numeric_only = getattr(func, 'numeric_only', False)
+
+        def wrapped_func(self, dim=None, skipna=None, keep_attrs=False,
+                         **kwargs):
+            return self.accumulate(func, dim, keep_attrs, skipna=skipna,
+                                   numeric_only=numeric_only, **kwargs)
+        return wrapped_func
+
+    _cum_extra_args_docstring = \
+        """dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func`. By default `func` is
+            applied along each dimension in turn."""
+
 
 class AbstractArray(ImplementsArrayReduce):
     def __nonzero__(self):
@@ -123,11 +154,14 @@ class AttrAccessMixin(object):
         return [self, self.attrs]
 
     def __getattr__(self, name):
-        for source in self.__attr_sources__:
-            try:
-                return source[name]
-            except KeyError:
-                pass
+        if name != '__setstate__':
+            # this avoids an infinite loop when pickle looks for the
+            # __setstate__ attribute before the xray object is initialized
+            for source in self.__attr_sources__:
+                try:
+                    return source[name]
+                except KeyError:
+                    pass
         raise AttributeError("%r object has no attribute %r" %
                              (type(self).__name__, name))
 
@@ -5,6 +5,7 @@ import pandas as pd
 
 from . import indexing
 from . import groupby
+from . import rolling
 from . import ops
 from . import utils
 from . import variable
@@ -120,6 +121,8 @@ class DataArray(AbstractArray, AttrAccessMixin):
     attrs : OrderedDict
         Dictionary for holding arbitrary metadata.
     """
+    groupby_cls = groupby.ArrayGroupBy
+
     def __init__(self, data, coords=None, dims=None, name=None,
                  attrs=None, encoding=None):
         """
@@ -420,6 +423,27 @@ class DataArray(AbstractArray, AttrAccessMixin):
             coord.variable.load_data()
         return self
 
+    def chunk(self, chunks):
+        """Return a new array whose data is divided into blocks.
+
+        Reductions such as ``mean`` or ``sum`` over a chunked array load and
+        combine one block at a time, so they can be applied to arrays that
+        are larger than memory.
+
+        Parameters
+        ----------
+        chunks : int or dict
+            Block size along each dimension, given as an integer for all
+            dimensions or a dictionary mapping dimension names to block sizes.
+            Dimensions not included in a dictionary are not divided.
+
+        Returns
+        -------
+        chunked : DataArray
+        """
+        ds = self._dataset.chunk(chunks)
+        return self._with_replaced_dataset(ds)
+
     def copy(self, deep=True):
         """Returns a copy of this array.
 
@@ -453,7 +477,7 @@ class DataArray(AbstractArray, AttrAccessMixin):
         ds = self._dataset.isel(**indexers)
         return self._with_replaced_dataset(ds)
 
-    def sel(self, **indexers):
+    def sel(self, method=None, tolerance=None, **indexers):
         """Return a new DataArray whose dataset is given by selecting
         index labels along the specified dimension(s).
 
@@ -462,7 +486,35 @@ class DataArray(AbstractArray, AttrAccessMixin):
         Dataset.sel
         DataArray.isel
         """
-        return self.isel(**indexing.remap_label_indexers(self, indexers))
+        pos_indexers = indexing.remap_label_indexers(self, indexers, method,
+                                                     tolerance)
+        return self.isel(**pos_indexers)
+
+    def isel_points(self, dim='points', **indexers):
+        """Return a new DataArray whose dataset is given by pointwise integer
+        indexing along the specified dimension(s).
+
+        See Also
+        --------
+        Dataset.isel_points
+        DataArray.sel_points
+        """
+        ds = self._dataset.isel_points(dim=dim, **indexers)
+        return self._with_replaced_dataset(ds)
+
+    def sel_points(self, dim='points', method=None, tolerance=None,
+                   **indexers):
+        """Return a new DataArray whose dataset is given by pointwise selection
+        of index labels along the specified dimension(s).
+
+        See Also
+        --------
+        Dataset.sel_points
+        DataArray.isel_points
+        """
+        pos_indexers = indexing.remap_label_indexers(self, indexers, method,
+                                                     tolerance)
+        return self.isel_points(dim=dim, **pos_indexers)
 
     def reindex_like(self, other, method=None, copy=True):
         """Conform this object onto the indexes of another object, filling
@@ -583,7 +635,50 @@ class DataArray(AbstractArray, AttrAccessMixin):
         """
         if isinstance(group, basestring):
             group = self.coords[group]
-        return groupby.ArrayGroupBy(self, group, squeeze=squeeze)
+        return self.groupby_cls(self, group, squeeze=squeeze)
+
+    def resample(self, freq, dim, how='mean', skipna=None, closed=None,
+                 label=None, base=0):
+        """Resample this DataArray to a new temporal resolution.
+
+        See `Dataset.resample` for a description of the arguments.
+
+        Returns
+        -------
+        resampled : DataArray
+            This array resampled.
+
+        See Also
+        --------
+        Dataset.resample
+        """
+        return groupby.resample(self, freq, dim, how, skipna, closed, label,
+                                base)
+
+    def rolling(self, min_periods=None, center=False, **windows):
+        """Returns a Rolling object for computing moving window aggregations
+        along a dimension, e.g., ``array.rolling(time=3).mean()``.
+
+        Parameters
+        ----------
+        min_periods : int, optional
+            Minimum number of valid (non-NaN) values in a window for its
+            aggregation to be computed; otherwise, the result is NaN. By
+            default, this is the size of the window.
+        center : bool, optional
+            If True, label each window by its central position instead of by
+            its last position.
+        **windows : {dim: window}
+            Name of the dimension to roll along and the number of consecutive
+            values in each window.
+
+        Returns
+        -------
+        rolling : Rolling
+            A `Rolling` object with methods ``sum``, ``mean``, ``std``,
+            ``var``, ``max``, ``min`` and ``count``.
+        """
+        return rolling.Rolling(self, min_periods, center, **windows)
 
     def transpose(self, *dims):
         """Return a new DataArray object with transposed dimensions.
@@ -702,6 +797,44 @@ class DataArray(AbstractArray, AttrAccessMixin):
 
         return self._with_replaced_dataset(ds)
 
+    def accumulate(self, func, dim=None, axis=None, keep_attrs=False,
+                   **kwargs):
+        """Accumulate this array by applying `func` along some dimension(s).
+
+        Parameters
+        ----------
+        func : function
+            Function which can be called in the form
+            `func(x, axis=axis, **kwargs)` to return the result of
+            accumulating an np.ndarray along an integer valued axis, with the
+            same shape as `x`.
+        dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func`.
+        axis : int or sequence of int, optional
+            Axis(es) along which to apply `func`. Only one of the 'dim'
+            and 'axis' arguments can be supplied. If neither are supplied, then
+            `func` is applied along each axis in turn.
+        keep_attrs : bool, optional
+            If True, the variable's attributes (`attrs`) will be copied from
+            the original object to the new one.  If False (default), the new
+            object will be returned without attributes.
+        **kwargs : dict
+            Additional keyword arguments passed on to `func`.
+
+        Returns
+        -------
+        accumulated : DataArray
+            DataArray with this object's array replaced with the accumulated
+            data, and the same coordinates.
+        """
+        var = self.variable.accumulate(func, dim, axis, keep_attrs, **kwargs)
+        return self._replace_variable(var)
+
+    def _replace_variable(self, variable):
+        ds = self.coords.to_dataset()
+        ds[self.name] = variable
+        return self._new_from_dataset_no_copy(ds, self.name)
+
     @classmethod
     def _concat(cls, arrays, dim='concat_dim', indexers=None,
                 mode='different', concat_over=None, compat='equals'):
@@ -2,6 +2,7 @@ import sys
 import gzip
 import warnings
 import functools
+from glob import glob
 from io import BytesIO
 from collections import Mapping
 
@@ -12,6 +13,7 @@ from . import ops
 from . import utils
 from . import common
 from . import groupby
+from . import rolling
 from . import indexing
 from . import variable
 from . import alignment
@@ -26,7 +28,7 @@ from .pycompat import iteritems, itervalues, basestring, OrderedDict
 
 def open_dataset(filename_or_obj, decode_cf=True, mask_and_scale=True,
                  decode_times=True, concat_characters=True, decode_coords=True,
-                 group=None):
+                 group=None, chunks=None):
     """Load and decode a dataset from a file or file-like object.
 
     Parameters
@@ -58,6 +60,10 @@ def open_dataset(filename_or_obj, decode_cf=True, mask_and_scale=True,
         the resulting dataset.
     group : str, optional
         NetCDF4 group in the given file to open (only works for netCDF4).
+    chunks : int or dict, optional
+        If provided, divide the data variables into blocks of this size along
+        each dimension (see `Dataset.chunk`), so that reductions over them
+        are computed one block at a time with bounded memory.
 
     Returns
     -------
@@ -86,12 +92,121 @@ def open_dataset(filename_or_obj, decode_cf=True, mask_and_scale=True,
         store = backends.ScipyDataStore(filename_or_obj)
 
     if decode_cf:
-        return conventions.decode_cf(
+        ds = conventions.decode_cf(
             store, mask_and_scale=mask_and_scale,
             decode_times=decode_times, concat_characters=concat_characters,
             decode_coords=decode_coords)
     else:
-        return Dataset.load_store(store)
+        ds = Dataset.load_store(store)
+
+    if chunks is not None:
+        ds = ds.chunk(chunks)
+    return ds
+
+
+class _MultipleFileCloser(object):
+    """Close several data stores at once"""
+    def __init__(self, file_objs):
+        self.file_objs = file_objs
+
+    def close(self):
+        for f in self.file_objs:
+            f.close()
+
+
+def _lazy_concat_variables(variables, dim):
+    """Concatenate variables along an existing dimension without loading their
+    data into memory.
+    """
+    first_var = variables[0]
+    for var in variables[1:]:
+        if var.dims != first_var.dims:
+            raise ValueError('inconsistent dimensions for concatenation: %s '
+                             'and %s' % (first_var.dims, var.dims))
+    axis = first_var.get_axis_num(dim)
+    data = indexing.LazilyIndexedArray(indexing.ConcatenatedArray(
+        [var._data for var in variables], axis=axis))
+    return variable.Variable(first_var.dims, data, first_var.attrs,
+                             first_var.encoding)
+
+
+def open_mfdataset(paths, dim, **kwargs):
+    """Open multiple files as a single dataset, lazily concatenated along an
+    existing (record) dimension.
+
+    Unlike ``xray.concat``, no data is loaded into memory when opening the
+    files: indexing the combined dataset only reads the files (and the
+    portions of those files) which overlap the requested selection.
+
+    Parameters
+    ----------
+    paths : str or sequence of str
+        Either a string glob in the form "path/to/my/files/*.nc" or an explicit
+        list of files to open, in the order in which they should be
+        concatenated.
+    dim : str
+        Name of the dimension along which to concatenate the files. This
+        dimension must already exist in every file.
+    **kwargs : optional
+        Additional arguments passed on to :py:func:`xray.open_dataset`.
+
+    Returns
+    -------
+    dataset : Dataset
+        The combined dataset. Variables without the dimension ``dim`` and
+        global attributes are taken from the first file without checking
+        that they match in the others.
+
+    See Also
+    --------
+    open_dataset
+    concat
+    """
+    if isinstance(paths, basestring):
+        paths = sorted(glob(paths))
+    if not paths:
+        raise IOError('no files to open')
+
+    datasets = [open_dataset(p, **kwargs) for p in paths]
+    file_objs = [ds._file_obj for ds in datasets]
+
+    try:
+        first = datasets[0]
+        if dim not in first.dims:
+            raise ValueError('dimension %r not found in %r' % (dim, paths[0]))
+
+        variables = OrderedDict()
+        for name, var in iteritems(first._variables):
+            if dim not in var.dims:
+                variables[name] = var
+                continue
+            try:
+                to_concat = [ds._variables[name] for ds in datasets]
+            except KeyError:
+                raise ValueError('variable %r not found in all files' % name)
+            if name == dim:
+                if all(isinstance(v._data, indexing.LazyIntegerRange)
+                       for v in to_concat):
+                    # there is no coordinate on disk; the dataset will create
+                    # a new default one
+                    continue
+                # load index coordinates, since we need a pandas.Index
+                coord = variable.Coordinate.concat(to_concat, dim)
+                coord.encoding = var.encoding
+                variables[name] = coord
+            else:
+                variables[name] = _lazy_concat_variables(to_concat, dim)
+
+        combined = Dataset(variables, attrs=first.attrs)
+        combined = combined.set_coords(
+            [k for k in first.coords if k in combined._variables])
+    except:
+        for f in file_objs:
+            f.close()
+        raise
+
+    combined._file_obj = _MultipleFileCloser(file_objs)
+    return combined
 
 
 # list of attributes of pd.DatetimeIndex that are ndarrays of time info
@@ -358,6 +473,8 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
     _attrs = None
     _variables = Frozen({})
 
+    groupby_cls = groupby.DatasetGroupBy
+
     def __init__(self, variables=None, coords=None, attrs=None,
                  compat='broadcast_equals'):
         """To load data from a file or file-like object, use the `open_dataset`
@@ -531,6 +648,38 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
             v.load_data()
         return self
 
+    def chunk(self, chunks):
+        """Return a new dataset whose data variables are divided into blocks.
+
+        Reductions such as ``mean`` or ``sum`` over chunked variables load
+        and combine one block at a time, so they can be applied to datasets
+        that are larger than memory.
+
+        Parameters
+        ----------
+        chunks : int or dict
+            Block size along each dimension, given as an integer for all
+            dimensions or a dictionary mapping dimension names to block sizes.
+            Dimensions not included in a dictionary are not divided.
+
+        Returns
+        -------
+        chunked : Dataset
+        """
+        if utils.is_dict_like(chunks):
+            invalid = [k for k in chunks if k not in self.dims]
+            if invalid:
+                raise ValueError('chunks keys %r do not match any dimensions'
+                                 % invalid)
+        variables = OrderedDict()
+        for k, v in iteritems(self._variables):
+            if k not in self.dims and v.ndim > 0:
+                v = v.chunk(chunks)
+            variables[k] = v
+        return self._construct_direct(variables, self._coord_names.copy(),
+                                      self._dims.copy(), self._attrs_copy(),
+                                      file_obj=self._file_obj)
+
     @classmethod
     def _construct_direct(cls, variables, coord_names, dims, attrs,
                           file_obj=None):
@@ -859,11 +1008,28 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
         store.store(variables, attrs)
         store.sync()
 
-    def to_netcdf(self, filepath, **kwdargs):
+    def to_netcdf(self, filepath, buffer_size=None, **kwdargs):
         """Dump dataset contents to a location on disk using the netCDF4
         package.
+
+        Variables are written one slab at a time, aligned to the chunk sizes
+        given by each variable's 'chunksizes' encoding, so that variables
+        which have not been loaded into memory (e.g., from another file) are
+        copied with bounded memory.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to which to save this dataset.
+        buffer_size : int, optional
+            Maximum number of bytes of each variable to load into memory at
+            once while writing. Defaults to 64 MB.
+        **kwdargs : optional
+            Additional keyword arguments passed on to the
+            backends.NetCDF4DataStore constructor (e.g., ``format``).
         """
         with backends.NetCDF4DataStore(filepath, mode='w', **kwdargs) as store:
+            store.buffer_size = buffer_size
             self.dump_to_store(store)
 
     dump = to_netcdf
@@ -914,18 +1080,37 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
             raise ValueError("dimensions %r do not exist" % invalid)
 
         # all indexers should be int, slice or np.ndarrays
-        indexers = [(k, (np.asarray(v)
-                         if not isinstance(v, (int, np.integer, slice))
-                         else v))
-                    for k, v in iteritems(indexers)]
+        indexers = dict((k, (np.asarray(v)
+                             if not isinstance(v, (int, np.integer, slice))
+                             else v))
+                        for k, v in iteritems(indexers))
 
         variables = OrderedDict()
         for name, var in iteritems(self._variables):
-            var_indexers = dict((k, v) for k, v in indexers if k in var.dims)
-            variables[name] = var.isel(**var_indexers)
-        return self._replace_vars_and_dims(variables)
+            if any(dim in indexers for dim in var.dims):
+                var = var[tuple(indexers.get(dim, slice(None))
+                                for dim in var.dims)]
+            else:
+                # variables that aren't indexed share their data with this
+                # dataset, like a shallow copy
+                var = var.copy(deep=False)
+            variables[name] = var
 
-    def sel(self, **indexers):
+        # only the sizes of indexed dimensions change, and they can be read
+        # off the indexed coordinates
+        dims = self._dims.copy()
+        for dim, indexer in iteritems(indexers):
+            if isinstance(indexer, (int, np.integer)):
+                del dims[dim]
+            elif dim in variables:
+                dims[dim] = variables[dim].shape[0]
+            else:
+                dims = _calculate_dims(variables)
+                break
+        return self._construct_direct(variables, self._coord_names.copy(),
+                                      dims, self._attrs_copy())
+
+    def sel(self, method=None, tolerance=None, **indexers):
         """Returns a new dataset with each array indexed by tick labels
         along the specified dimension(s).
 
@@ -940,13 +1125,33 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
         indexing. This means you can use string shortcuts for datetime indexes
         (e.g., '2000-01' to select all values in January 2000). It also means
         that slices are treated as inclusive of both the start and stop values,
-        unlike normal Python indexing.
+        unlike normal Python indexing. Arrays of labels are looked up by binary
+        search if the index is sorted.
+
+        To select values at many individual points, use `Dataset.sel_points`,
+        which looks up the labels for all points at once, rather than calling
+        this method for each point.
 
         Parameters
         ----------
+        method : {None, 'nearest', 'pad'/'ffill', 'backfill'/'bfill'}, optional
+            Method to use for inexact matches (requires a monotonic index):
+              * default: only exact matches
+              * pad / ffill: use the closest index value at an earlier
+                position
+              * backfill / bfill: use the closest index value at a later
+                position
+              * nearest: use the nearest index value
+            Labels are matched for all points at once by binary search.
+        tolerance : optional
+            Maximum distance between labels and the index values they match
+            with an inexact method. For datetime and timedelta indexes, it
+            may be given by anything that can be converted by
+            ``pandas.to_timedelta``, e.g., '1 hour'.
         **indexers : {dim: indexer, ...}
             Keyword arguments with names matching dimensions and values given
-            by individual, slices or arrays of tick labels.
+            by individual, slices or arrays of tick labels. Slices cannot be
+            used with `method`.
 
         Returns
         -------
@@ -960,10 +1165,145 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
         See Also
         --------
         Dataset.isel
+        Dataset.sel_points
         DataArray.isel
         DataArray.sel
         """
-        return self.isel(**indexing.remap_label_indexers(self, indexers))
+        pos_indexers = indexing.remap_label_indexers(self, indexers, method,
+                                                     tolerance)
+        return self.isel(**pos_indexers)
+
+    def isel_points(self, dim='points', **indexers):
+        """Returns a new dataset with each array indexed pointwise along the
+        specified dimension(s).
+
+        This method selects pointwise values from each array and is akin to
+        the NumPy indexing behavior of `arr[[0, 1], [0, 1]]`, except this
+        method does not require knowing the order of each array's dimensions.
+        All points are selected at once, so extracting the values at many
+        points (e.g., at weather stations from a gridded dataset) requires
+        only a single pass over each array.
+
+        Parameters
+        ----------
+        dim : str, DataArray, Coordinate or pandas.Index, optional
+            Name of the new dimension along the selected points, which
+            replaces the indexed dimensions. If a DataArray, Coordinate or
+            pandas.Index with a name is given, its values are also used as
+            the coordinate along the new dimension. By default, the new
+            dimension is named 'points'.
+        **indexers : {dim: indexer, ...}
+            Keyword arguments with names matching dimensions and values given
+            by 1d arrays of integers, all of the same length.
+
+        Returns
+        -------
+        obj : Dataset
+            A new Dataset with the same contents as this dataset, except each
+            array indexed along the specified dimensions is indexed at the
+            selected points. Arrays on disk are not loaded until their values
+            are needed, and then only the part spanned by the points is read.
+
+        See Also
+        --------
+        Dataset.sel_points
+        Dataset.isel
+        DataArray.isel_points
+        """
+        if not indexers:
+            raise ValueError('at least one indexer must be given')
+        invalid = [k for k in indexers if k not in self.dims]
+        if invalid:
+            raise ValueError("dimensions %r do not exist" % invalid)
+
+        if isinstance(dim, basestring):
+            dim_name, dim_values = dim, None
+        else:
+            dim_name = getattr(dim, 'name', None)
+            if dim_name is None:
+                raise ValueError('the new dimension must be given by a name '
+                                 'or by an object with a name, like a '
+                                 'DataArray')
+            dim_values = getattr(dim, 'values', dim)
+        if dim_name in self.dims:
+            raise ValueError('the new dimension %r already exists' % dim_name)
+
+        indexers = dict((k, np.asarray(v)) for k, v in iteritems(indexers))
+        num_points = set(v.size for v in itervalues(indexers))
+        if len(num_points) > 1:
+            raise ValueError('indexers must all have the same length')
+        num_points, = num_points
+        if dim_values is None:
+            dim_values = indexing.LazyIntegerRange(num_points)
+        elif len(dim_values) != num_points:
+            raise ValueError('the new dimension has length %s, but indexers '
+                             'have length %s' % (len(dim_values), num_points))
+
+        variables = OrderedDict()
+        for name, var in iteritems(self._variables):
+            var_indexers = dict((k, v) for k, v in iteritems(indexers)
+                                if k in var.dims)
+            if var_indexers:
+                if dim_name not in variables:
+                    variables[dim_name] = variable.Coordinate(dim_name,
+                                                              dim_values)
+                var = var.isel_points(dim_name, **var_indexers)
+            else:
+                var = var.copy(deep=False)
+            variables[name] = var
+        coord_names = self._coord_names | set([dim_name])
+        return self._replace_vars_and_dims(variables, coord_names)
+
+    def sel_points(self, dim='points', method=None, tolerance=None,
+                   **indexers):
+        """Returns a new dataset with each array indexed pointwise by tick
+        labels along the specified dimension(s).
+
+        In contrast to `Dataset.isel_points`, indexers for this method should
+        use labels instead of integers.
+
+        Parameters
+        ----------
+        dim : str, DataArray, Coordinate or pandas.Index, optional
+            Name of the new dimension along the selected points, which
+            replaces the indexed dimensions. If a DataArray, Coordinate or
+            pandas.Index with a name is given, its values are also used as
+            the coordinate along the new dimension. By default, the new
+            dimension is named 'points'.
+        method : {None, 'nearest', 'pad'/'ffill', 'backfill'/'bfill'}, optional
+            Method to use for inexact matches (requires a monotonic index):
+              * default: only exact matches
+              * pad / ffill: use the closest index value at an earlier
+                position
+              * backfill / bfill: use the closest index value at a later
+                position
+              * nearest: use the nearest index value
+            Labels are matched for all points at once by binary search.
+        tolerance : optional
+            Maximum distance between labels and the index values they match
+            with an inexact method. For datetime and timedelta indexes, it
+            may be given by anything that can be converted by
+            ``pandas.to_timedelta``, e.g., '1 hour'.
+        **indexers : {dim: indexer, ...}
+            Keyword arguments with names matching dimensions and values given
+            by arrays of tick labels, all of the same length.
+
+        Returns
+        -------
+        obj : Dataset
+            A new Dataset with the same contents as this dataset, except each
+            array indexed along the specified dimensions is indexed at the
+            selected points.
+
+        See Also
+        --------
+        Dataset.isel_points
+        Dataset.sel
+        DataArray.sel_points
+        """
+        pos_indexers = indexing.remap_label_indexers(self, indexers, method,
+                                                     tolerance)
+        return self.isel_points(dim=dim, **pos_indexers)
 
     def reindex_like(self, other, method=None, copy=True):
         """Conform this object onto the indexes of another object, filling
@@ -1238,7 +1578,96 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
         """
         if isinstance(group, basestring):
             group = self[group]
-        return groupby.DatasetGroupBy(self, group, squeeze=squeeze)
+        return self.groupby_cls(self, group, squeeze=squeeze)
+
+    def resample(self, freq, dim, how='mean', skipna=None, closed=None,
+                 label=None, base=0):
+        """Resample this Dataset to a new temporal resolution.
+
+        Handles both downsampling and upsampling. Upsampling with filling is
+        not yet supported; if any intervals contain no values in the original
+        object, they will be given the value ``NaN`` (or ``0`` for
+        ``how='count'``).
+
+        Values are divided into contiguous bins with pandas, so each bin is
+        reduced without copying or fancy indexing, and the built-in
+        reductions (e.g., ``'mean'`` or ``'sum'``) are computed for all bins
+        at once.
+
+        Parameters
+        ----------
+        freq : str
+            String in the '#offset' to specify the step-size along the
+            resampled dimension, where '#' is an (optional) integer multipler
+            (default 1) and 'offset' is any pandas date offset alias. Examples
+            of valid offsets include:
+
+            * 'AS': year start
+            * 'QS-DEC': quarterly, starting on December 1
+            * 'MS': month start
+            * 'D': day
+            * 'H': hour
+            * 'Min': minute
+
+            The full list of these offset aliases is documented in pandas [1]_.
+        dim : str
+            Name of the dimension to resample along (e.g., 'time').
+        how : str or func, optional
+            Used for downsampling. If a string, ``how`` must be a valid
+            aggregation operation supported by xray (e.g., ``'mean'``,
+            ``'sum'``), or ``'first'`` or ``'last'`` for the first or last
+            non-missing value in each bin. Otherwise, ``how`` must be a
+            function that can be called like ``how(values, axis)`` to reduce
+            ndarray values along the given axis.
+        skipna : bool, optional
+            Whether to skip missing values when aggregating in downsampling.
+        closed : 'left' or 'right', optional
+            Side of each interval to treat as closed.
+        label : 'left' or 'right', optional
+            Side of each interval to use for labeling.
+        base : int, optional
+            For frequencies that evenly subdivide 1 day, the "origin" of the
+            aggregated intervals. For example, for '24H' frequency, base could
+            range from 0 through 23.
+
+        Returns
+        -------
+        resampled : same type as caller
+            This object resampled.
+
+        References
+        ----------
+
+        .. [1] "Offset Aliases" in
+           http://pandas.pydata.org/pandas-docs/stable/timeseries.html
+        """
+        return groupby.resample(self, freq, dim, how, skipna, closed, label,
+                                base)
+
+    def rolling(self, min_periods=None, center=False, **windows):
+        """Returns a Rolling object for computing moving window aggregations
+        along a dimension, e.g., ``ds.rolling(time=3).mean()``.
+
+        Parameters
+        ----------
+        min_periods : int, optional
+            Minimum number of valid (non-NaN) values in a window for its
+            aggregation to be computed; otherwise, the result is NaN. By
+            default, this is the size of the window.
+        center : bool, optional
+            If True, label each window by its central position instead of by
+            its last position.
+        **windows : {dim: window}
+            Name of the dimension to roll along and the number of consecutive
+            values in each window.
+
+        Returns
+        -------
+        rolling : Rolling
+            A `Rolling` object with methods ``sum``, ``mean``, ``std``,
+            ``var``, ``max``, ``min`` and ``count``.
+        """
+        return rolling.Rolling(self, min_periods, center, **windows)
 
     def transpose(self, *dims):
         """Return a new Dataset object with all array dimensions transposed.
@@ -1427,6 +1856,61 @@ class Dataset(Mapping, ImplementsDatasetReduce, AttrAccessMixin):
         attrs = self.attrs if keep_attrs else None
         return self._replace_vars_and_dims(variables, coord_names, attrs)
 
+    def accumulate(self, func, dim=None, keep_attrs=False, numeric_only=False,
+                   **kwargs):
+        """Accumulate this dataset by applying `func` along some
+        dimension(s).
+
+        Parameters
+        ----------
+        func : function
+            Function which can be called in the form
+            `f(x, axis=axis, **kwargs)` to return the result of accumulating
+            an np.ndarray along an integer valued axis, with the same shape as
+            `x`.
+        dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func`.  By default `func` is
+            applied along each dimension in turn.
+        keep_attrs : bool, optional
+            If True, the datasets's attributes (`attrs`) will be copied from
+            the original object to the new one.  If False (default), the new
+            object will be returned without attributes.
+        numeric_only : bool, optional
+            If True, only apply ``func`` to variables with a numeric dtype.
+            Other data variables along the indicated dimension(s) are dropped.
+        **kwargs : dict
+            Additional keyword arguments passed on to ``func``.
+
+        Returns
+        -------
+        accumulated : Dataset
+            Dataset with this object's data variables along the indicated
+            dimension(s) replaced with accumulated data, and the same
+            coordinates.
+        """
+        if isinstance(dim, basestring):
+            dims = set([dim])
+        elif dim is None:
+            dims = set(self.dims)
+        else:
+            dims = set(dim)
+
+        _assert_empty([dim for dim in dims if dim not in self.dims],
+                      'Dataset does not contain the dimensions: %s')
+
+        variables = OrderedDict()
+        for name, var in iteritems(self._variables):
+            accumulate_dims = [dim for dim in var.dims if dim in dims]
+            if accumulate_dims and name not in self.coords:
+                if not numeric_only or var.dtype.kind in 'ifc':
+                    variables[name] = var.accumulate(func, dim=accumulate_dims,
+                                                     **kwargs)
+            else:
+                variables[name] = var
+
+        attrs = self.attrs if keep_attrs else None
+        return self._replace_vars_and_dims(variables, attrs=attrs)
+
     def apply(self, func, keep_attrs=False, args=(), **kwargs):
         """Apply a function over the variables in this dataset.
 
@@ -3,9 +3,12 @@ import numpy as np
 import pandas as pd
 
 from . import ops
+from . import utils
 from .alignment import concat
-from .common import ImplementsArrayReduce, ImplementsDatasetReduce
-from .pycompat import zip
+from .common import (ImplementsArrayReduce, ImplementsDatasetReduce,
+                     _maybe_promote)
+from .parallel import imap as parallel_imap
+from .pycompat import zip, iteritems, basestring, OrderedDict
 from .utils import peek_at
 from .variable import Variable, Coordinate
 
@@ -22,19 +25,125 @@ def unique_value_groups(ar):
     -------
     values : np.ndarray
         Sorted, unique values as returned by `np.unique`.
-    indices : list of lists of int
+    indices : list of slices or integer arrays
         Each element provides the integer indices in `ar` with values given by
-        the corresponding value in `unique_values`.
+        the corresponding value in `unique_values`. Groups that are contiguous
+        in `ar` are given by a slice instead of an array.
     """
     inverse, values = pd.factorize(ar, sort=True)
-    groups = [[] for _ in range(len(values))]
-    for n, g in enumerate(inverse):
-        if g >= 0:
-            # pandas uses -1 to mark NaN, but doesn't include them in values
-            groups[g].append(n)
+    if len(values) == 0:
+        return values, []
+    # pandas uses -1 to mark NaN, but doesn't include them in values
+    valid = np.flatnonzero(inverse >= 0)
+    inverse = inverse[valid]
+    order = valid[np.argsort(inverse, kind='mergesort')]
+    counts = np.bincount(inverse, minlength=len(values))
+    stops = np.cumsum(counts)
+    starts = stops - counts
+
+    groups = []
+    for start, stop in zip(starts, stops):
+        first = order[start]
+        last = order[stop - 1]
+        if last - first + 1 == stop - start:
+            # the indices are sorted and unique, so they must be contiguous
+            groups.append(slice(int(first), int(last) + 1))
+        else:
+            groups.append(order[start:stop])
     return values, groups
 
 
+def _fill_missing(data, missing, axis):
+    """Replace the elements of an array along `axis` that are flagged in
+    `missing` (e.g., because they do not belong to any group) with a missing
+    value, promoting the dtype if necessary.
+    """
+    dtype, fill_value = _maybe_promote(data.dtype)
+    key = [np.newaxis] * data.ndim
+    key[axis] = slice(None)
+    return np.where(missing[tuple(key)], fill_value, data.astype(dtype))
+
+
+RESAMPLE_DIM = '__resample_dim__'
+
+
+def _replace_data_vars(obj, func):
+    """Apply `func(name, variable)` to each data variable of a Dataset or
+    DataArray (but not its coordinates), returning a new object of the same
+    type with the replaced variables.
+    """
+    from .dataarray import DataArray
+    ds = obj._dataset if isinstance(obj, DataArray) else obj
+    variables = OrderedDict()
+    for k, v in iteritems(ds._variables):
+        variables[k] = v if k in ds._coord_names else func(k, v)
+    ds = ds._replace_vars_and_dims(variables)
+    return obj._with_replaced_dataset(ds) if isinstance(obj, DataArray) else ds
+
+
+def _restore_dim_order(result, obj):
+    """Transpose each data variable of `result` to match the dimension order
+    of the variable with the same name in `obj`, if they have the same
+    dimensions.
+    """
+    original = getattr(obj, '_dataset', obj)._variables
+
+    def transpose(name, var):
+        if name in original:
+            dims = original[name].dims
+            if var.dims != dims and set(var.dims) == set(dims):
+                return var.transpose(*dims)
+        return var
+    return _replace_data_vars(result, transpose)
+
+
+def _fill_empty_counts(result, dim):
+    # like pandas, bins without any values have a count of zero
+    def fill(name, var):
+        if dim in var.dims and var.dtype.kind == 'f':
+            values = var.values
+            data = np.where(pd.isnull(values), 0, values).astype(int)
+            var = Variable(var.dims, data, var.attrs, var.encoding)
+        return var
+    return _replace_data_vars(result, fill)
+
+
+def resample(obj, freq, dim, how='mean', skipna=None, closed=None,
+             label=None, base=0):
+    """Implementation of `Dataset.resample` and `DataArray.resample`"""
+    from .dataarray import DataArray
+
+    if isinstance(dim, basestring):
+        dim = obj[dim]
+    # group along a copy of the dimension with a different name, so that it is
+    # not treated as a dimension of obj
+    group = DataArray(dim.values, [(dim.name, dim.values)], name=RESAMPLE_DIM)
+    grouper = pd.TimeGrouper(freq=freq, closed=closed, label=label,
+                             base=base)
+    grouped = obj.groupby_cls(obj, group, grouper=grouper)
+
+    kwargs = {} if skipna is None else {'skipna': skipna}
+    if how in ['first', 'last']:
+        # like pandas, select the first or last non-missing value in each bin
+        result = grouped.reduce(getattr(ops, how), dim=dim.name,
+                                keep_attrs=True, **kwargs)
+    elif isinstance(how, basestring):
+        result = getattr(grouped, how)(dim=dim.name, keep_attrs=True,
+                                       **kwargs)
+    else:
+        result = grouped.reduce(how, dim=dim.name, keep_attrs=True)
+    result = result.rename({RESAMPLE_DIM: dim.name})
+    # the binned dimension was stacked first
+    result = _restore_dim_order(result, obj)
+
+    if grouped._full_index is not None:
+        # restore bins without any values
+        result = result.reindex(**{dim.name: grouped._full_index})
+        if how == 'count':
+            result = _fill_empty_counts(result, dim.name)
+    return result
+
+
 class GroupBy(object):
     """A object that implements the split-apply-combine pattern.
 
@@ -51,7 +160,7 @@ class GroupBy(object):
     Dataset.groupby
     DataArray.groupby
     """
-    def __init__(self, obj, group, squeeze=True):
+    def __init__(self, obj, group, squeeze=True, grouper=None):
         """Create a GroupBy object
 
         Parameters
@@ -64,6 +173,9 @@ class GroupBy(object):
             If "group" is a coordinate of object, `squeeze` controls whether
             the subarrays have a dimension of length 1 along that coordinate or
             if the dimension is squeezed out.
+        grouper : pd.Grouper, optional
+            Used for grouping values along the `group` array into contiguous
+            bins, e.g., a `pandas.TimeGrouper` for resampling.
         """
         if group.ndim != 1:
             # TODO: remove this limitation?
@@ -84,7 +196,23 @@ class GroupBy(object):
                              'match the length of this variable along its '
                              'dimension')
 
-        if group.name in obj.dims:
+        full_index = None
+        if grouper is not None:
+            index = utils.safe_cast_to_index(group)
+            if not index.is_monotonic:
+                raise ValueError('index must be monotonic for resampling')
+            positions = pd.Series(np.arange(index.size), index)
+            first_items = positions.groupby(grouper).first()
+            if first_items.isnull().any():
+                # bins without any values are left out of the groups
+                full_index = first_items.index
+                first_items = first_items.dropna()
+            starts = first_items.values.astype(int)
+            stops = np.append(starts[1:], index.size)
+            group_indices = [slice(int(start), int(stop))
+                             for start, stop in zip(starts, stops)]
+            unique_coord = Coordinate(group.name, first_items.index)
+        elif group.name in obj.dims:
             # assume that group already has sorted, unique values
             if group.dims != (group.name,):
                 raise ValueError('`group` is required to be a coordinate if '
@@ -102,7 +230,9 @@ class GroupBy(object):
 
         self.group_indices = group_indices
         self.unique_coord = unique_coord
+        self._full_index = full_index
         self._groups = None
+        self._group_order = None
 
     @property
     def groups(self):
@@ -123,6 +253,99 @@ class GroupBy(object):
         for indices in self.group_indices:
             yield self.obj.isel(**{self.group_dim: indices})
 
+    def _get_group_order(self):
+        """Return (order, starts), where taking `order` along the group
+        dimension arranges each group contiguously beginning at the positions
+        in `starts`, or order is None if the groups are already arranged so.
+        """
+        if self._group_order is None:
+            indices = [np.arange(i.start, i.stop) if isinstance(i, slice)
+                       else np.atleast_1d(i) for i in self.group_indices]
+            sizes = [len(i) for i in indices]
+            order = np.concatenate(indices)
+            starts = np.cumsum([0] + sizes[:-1])
+            if (order.size == self.group.size
+                    and (order == np.arange(order.size)).all()):
+                order = None
+            self._group_order = (order, starts)
+        return self._group_order
+
+    def _get_group_codes(self):
+        """Return the position of each element's group in `unique_coord`, or
+        -1 for elements that do not belong to any group.
+        """
+        order, starts = self._get_group_order()
+        if order is None:
+            order = np.arange(self.group.size)
+        sizes = np.diff(np.append(starts, order.size))
+        codes = np.empty(self.group.size, dtype=int)
+        codes.fill(-1)
+        codes[order] = np.repeat(np.arange(len(starts)), sizes)
+        return codes
+
+    def _fused_reduce_dims(self, func, dim, kwargs):
+        """Return the dimensions to reduce over if `func` can be applied to all
+        groups at once, or None if it must be applied group by group.
+        """
+        if (not hasattr(func, 'grouped')
+                or not set(kwargs) <= set(['skipna', 'ddof'])
+                or len(self.group_indices) == 0
+                or isinstance(self.group_indices[0], (int, np.integer))):
+            return None
+        if dim is None:
+            dims = set(self.obj.dims)
+        elif isinstance(dim, basestring):
+            dims = set([dim])
+        else:
+            dims = set(dim)
+        if self.group_dim not in dims or not dims <= set(self.obj.dims):
+            return None
+        return dims
+
+    def _fused_reduce_variable(self, func, var, dims, **kwargs):
+        """Reduce all groups of a Variable at once with `func.grouped`"""
+        order, starts = self._get_group_order()
+        axis = var.get_axis_num(self.group_dim)
+        other_axes = [var.get_axis_num(d) for d in var.dims
+                      if d in dims and d != self.group_dim]
+        values = var.values
+        if order is not None:
+            values = values.take(order, axis=axis)
+        data = func.grouped(values, starts, axis, other_axes, **kwargs)
+        new_dims = ((self.group.name,)
+                    + tuple(d for d in var.dims if d not in dims))
+        return Variable(new_dims, data)
+
+    def _fused_accumulate(self, func, dim, kwargs):
+        """Whether `func` can be applied to all groups at once, along the
+        grouped dimension.
+        """
+        return (hasattr(func, 'grouped')
+                and set(kwargs) <= set(['skipna'])
+                and dim in [None, self.group_dim, [self.group_dim]])
+
+    def _accumulate_variable(self, func, var, **kwargs):
+        """Accumulate all groups of a Variable at once with `func.grouped`"""
+        codes = self._get_group_codes()
+        axis = var.get_axis_num(self.group_dim)
+        data = func.grouped(var.values, codes, axis, **kwargs)
+        missing = codes < 0
+        if missing.any():
+            # elements that are not in any group get a missing value
+            data = _fill_missing(data, missing, axis)
+        return Variable(var.dims, data)
+
+    def _apply_to_groups(self, func, grouped, kwargs, parallel=False,
+                         executor=None):
+        """Lazily apply `func` to each group, in order"""
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+        if executor is not None:
+            return iter(executor.map(func, grouped))
+        if parallel:
+            return parallel_imap(func, grouped)
+        return (func(obj) for obj in grouped)
+
     def _infer_concat_args(self, applied_example):
         if self.group_dim in applied_example.dims:
             concat_dim = self.group
@@ -137,19 +360,55 @@ class GroupBy(object):
         @functools.wraps(f)
         def func(self, other):
             g = f if not reflexive else lambda x, y: f(y, x)
-            applied = self._yield_binary_applied(g, other)
-            return self._concat(applied)
-        return func
-
-    def _yield_binary_applied(self, func, other):
-        for group_value, obj in self:
             try:
-                other_sel = other.sel(**{self.group.name: group_value})
+                expanded = self._expand_by_group(other)
             except AttributeError:
                 raise TypeError('GroupBy objects only support arithmetic '
                                 'when the other argument is a Dataset or '
                                 'DataArray')
-            yield func(obj, other_sel)
+            return self._finalize_binary_op(g(self.obj, expanded))
+        return func
+
+    def _expand_by_group(self, other):
+        """Index a Dataset or DataArray along the dimension named after the
+        group so that each element of the grouped dimension lines up with the
+        value for its group.
+        """
+        from .dataarray import DataArray
+        from .variable import as_variable
+
+        name = self.group.name
+        other_sel = other.sel(**{name: self.unique_coord.values})
+        ds = getattr(other_sel, '_dataset', other_sel)
+
+        codes = self._get_group_codes()
+        missing = codes < 0
+
+        variables = OrderedDict()
+        for k, v in iteritems(ds._variables):
+            if k == name:
+                continue
+            if name in v.dims:
+                axis = v.get_axis_num(name)
+                data = v.values.take(codes, axis=axis)
+                if missing.any():
+                    data = _fill_missing(data, missing, axis)
+                dims = tuple(self.group_dim if d == name else d
+                             for d in v.dims)
+                v = Variable(dims, data, v.attrs, v.encoding)
+            variables[k] = v
+        variables[self.group_dim] = as_variable(
+            self.obj[self.group_dim]).to_coord()
+        variables[name] = as_variable(self.group)
+
+        coord_names = set(ds._coord_names) | set([self.group_dim, name])
+        expanded = ds._replace_vars_and_dims(variables, coord_names)
+        if isinstance(other_sel, DataArray):
+            expanded = other_sel._with_replaced_dataset(expanded)
+        return expanded
+
+    def _finalize_binary_op(self, result):
+        return result
 
 
 class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
@@ -180,6 +439,9 @@ class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
     def _concat_shortcut(self, applied, concat_dim, indexers):
         stacked = Variable.concat(
             applied, concat_dim, indexers, shortcut=True)
+        return self._combine_stacked(stacked, concat_dim)
+
+    def _combine_stacked(self, stacked, concat_dim):
         stacked.attrs.update(self.obj.attrs)
 
         name = self.obj.name
@@ -192,6 +454,14 @@ class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
         ds[name] = stacked
         return ds[name]
 
+    def _finalize_binary_op(self, result):
+        if (type(result) is not type(self.obj)
+                or result.dims[:self.obj.ndim] == self.obj.dims):
+            return result
+        new_order = (self.obj.dims
+                     + tuple(d for d in result.dims if d not in self.obj.dims))
+        return result.transpose(*new_order)
+
     def _restore_dim_order(self, stacked, concat_dim):
         def lookup_order(dimension):
             if dimension == self.group.name:
@@ -205,7 +475,8 @@ class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
         new_order = sorted(stacked.dims, key=lookup_order)
         return stacked.transpose(*new_order)
 
-    def apply(self, func, shortcut=False, **kwargs):
+    def apply(self, func, shortcut=False, parallel=False, executor=None,
+              **kwargs):
         """Apply a function over each array in the group and concatenate them
         together into a new array.
 
@@ -234,6 +505,17 @@ class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
             If these conditions are satisfied `shortcut` provides significant
             speedup. This should be the case for many common groupby operations
             (e.g., applying numpy ufuncs).
+        parallel : bool, optional
+            If True, apply `func` to the groups in parallel on the thread pool
+            used by xray for blockwise operations. This only speeds things up
+            if `func` releases the GIL and more than one thread has been
+            enabled with `xray.core.parallel.set_num_threads`.
+        executor : object, optional
+            Object with a `map` method (e.g., a
+            `concurrent.futures.ProcessPoolExecutor` or a
+            `multiprocessing.Pool`) with which to apply `func` to the groups.
+            When using a process pool, `func` must be picklable and each group
+            is loaded into memory and pickled to be sent to a worker.
         **kwargs
             Used to call `func(ar, **kwargs)` for each array `ar`.
 
@@ -246,7 +528,8 @@ class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
             grouped = self._iter_grouped_shortcut()
         else:
             grouped = self._iter_grouped()
-        applied = (func(arr, **kwargs) for arr in grouped)
+        applied = self._apply_to_groups(func, grouped, kwargs, parallel,
+                                        executor)
         return self._concat(applied, shortcut=shortcut)
 
     def _concat(self, applied, shortcut=False):
@@ -293,16 +576,117 @@ class ArrayGroupBy(GroupBy, ImplementsArrayReduce):
             Array with summarized data and the indicated dimension(s)
             removed.
         """
+        if axis is None:
+            dims = self._fused_reduce_dims(func, dim, kwargs)
+            if (dims is not None
+                    and self.obj.dtype.kind in ['b', 'i', 'u', 'f']):
+                # compute the reduction for all groups in a single pass
+                from .variable import as_variable
+                stacked = self._fused_reduce_variable(
+                    func, as_variable(self.obj), dims, **kwargs)
+                combined = self._combine_stacked(stacked, self.unique_coord)
+                return self._restore_dim_order(combined, self.unique_coord)
+
         def reduce_array(ar):
             return ar.reduce(func, dim, axis, keep_attrs=keep_attrs, **kwargs)
         return self.apply(reduce_array, shortcut=shortcut)
 
+    _cum_extra_args_docstring = \
+        """dim : str or sequence of str, optional
+            Dimension(s) along which to apply `{name}` to each group. By
+            default, `{name}` is applied along the grouped dimension.
+        axis : int or sequence of int, optional
+            Axis(es) along which to apply `{name}` to each group. Only one of
+            the 'dim' and 'axis' arguments can be supplied."""
+
+    def accumulate(self, func, dim=None, axis=None, keep_attrs=False,
+                   **kwargs):
+        """Accumulate the items in this group by applying `func` along some
+        dimension(s).
+
+        Parameters
+        ----------
+        func : function
+            Function which can be called in the form
+            `func(x, axis=axis, **kwargs)` to return the result of
+            accumulating an np.ndarray along an integer valued axis, with the
+            same shape as `x`.
+        dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func` to each group. By
+            default, `func` is applied along the grouped dimension.
+        axis : int or sequence of int, optional
+            Axis(es) along which to apply `func` to each group. Only one of
+            the 'dimension' and 'axis' arguments can be supplied.
+        keep_attrs : bool, optional
+            If True, the datasets's attributes (`attrs`) will be copied from
+            the original object to the new one.  If False (default), the new
+            object will be returned without attributes.
+        **kwargs : dict
+            Additional keyword arguments passed on to `func`.
+
+        Returns
+        -------
+        accumulated : Array
+            Array with the same dimensions and coordinates as the grouped
+            array.
+        """
+        if axis is None and self._fused_accumulate(func, dim, kwargs):
+            # accumulate all groups in a single pass
+            from .variable import as_variable
+            var = self._accumulate_variable(func, as_variable(self.obj),
+                                            **kwargs)
+            if keep_attrs:
+                var.attrs.update(self.obj.attrs)
+            return self.obj._replace_variable(var)
+
+        if dim is None and axis is None:
+            dim = self.group_dim
+
+        def accumulate_array(ar):
+            return ar.accumulate(func, dim, axis, keep_attrs=keep_attrs,
+                                 **kwargs)
+        return self.apply(accumulate_array, shortcut=True)
+
 ops.inject_reduce_methods(ArrayGroupBy)
+ops.inject_cum_methods(ArrayGroupBy)
 ops.inject_binary_ops(ArrayGroupBy)
 
 
 class DatasetGroupBy(GroupBy, ImplementsDatasetReduce):
-    def apply(self, func, **kwargs):
+    def _iter_grouped_shortcut(self):
+        """Fast version of `_iter_grouped` that builds each Dataset directly
+        from indexed Variables, loading each variable into memory only once
+        """
+        obj = self.obj
+        dim = self.group_dim
+        grouped_vars = [(k, v, v.get_axis_num(dim), v.values)
+                        for k, v in iteritems(obj._variables) if dim in v.dims]
+
+        for indices in self.group_indices:
+            squeezed = isinstance(indices, (int, np.integer))
+            variables = obj._variables.copy()
+            for k, v, axis, values in grouped_vars:
+                key = [slice(None)] * v.ndim
+                key[axis] = indices
+                data = values[tuple(key)]
+                if squeezed:
+                    dims = v.dims[:axis] + v.dims[axis + 1:]
+                    cls = Variable
+                else:
+                    dims = v.dims
+                    cls = type(v)
+                variables[k] = cls(dims, data, v._attrs, v._encoding,
+                                   fastpath=True)
+            dims = dict(obj._dims)
+            if squeezed:
+                del dims[dim]
+            else:
+                dims[dim] = variables[dim].size
+            yield type(obj)._construct_direct(
+                variables, obj._coord_names.copy(), dims, obj._attrs_copy())
+
+    def apply(self, func, shortcut=False, parallel=False, executor=None,
+              **kwargs):
         """Apply a function over each Dataset in the group and concatenate them
         together into a new Dataset.
 
@@ -321,6 +705,28 @@ class DatasetGroupBy(GroupBy, ImplementsDatasetReduce):
         ----------
         func : function
             Callable to apply to each sub-dataset.
+        shortcut : bool, optional
+            Whether or not to shortcut evaluation under the assumptions that:
+            (1) The action of `func` on each variable does not depend on the
+                dataset metadata (attributes or coordinates), and variables
+                that do not depend on the grouped dimension are the same in
+                each applied dataset.
+            (2) The action of `func` creates datasets with homogeneous
+                metadata, that is, with the same variables, dimensions and
+                attributes.
+            If these conditions are satisfied `shortcut` provides significant
+            speedup, especially for datasets with many variables.
+        parallel : bool, optional
+            If True, apply `func` to the groups in parallel on the thread pool
+            used by xray for blockwise operations. This only speeds things up
+            if `func` releases the GIL and more than one thread has been
+            enabled with `xray.core.parallel.set_num_threads`.
+        executor : object, optional
+            Object with a `map` method (e.g., a
+            `concurrent.futures.ProcessPoolExecutor` or a
+            `multiprocessing.Pool`) with which to apply `func` to the groups.
+            When using a process pool, `func` must be picklable and each group
+            is loaded into memory and pickled to be sent to a worker.
         **kwargs
             Used to call `func(ds, **kwargs)` for each sub-dataset `ar`.
 
@@ -329,16 +735,48 @@ class DatasetGroupBy(GroupBy, ImplementsDatasetReduce):
         applied : Dataset
             The result of splitting, applying and combining this dataset.
         """
-        kwargs.pop('shortcut', None) # ignore shortcut if set (for now)
-        applied = (func(ds, **kwargs) for ds in self._iter_grouped())
-        return self._concat(applied)
+        if shortcut:
+            grouped = self._iter_grouped_shortcut()
+        else:
+            grouped = self._iter_grouped()
+        applied = self._apply_to_groups(func, grouped, kwargs, parallel,
+                                        executor)
+        return self._concat(applied, shortcut=shortcut)
 
-    def _concat(self, applied):
+    def _concat(self, applied, shortcut=False):
         applied_example, applied = peek_at(applied)
         concat_dim, indexers = self._infer_concat_args(applied_example)
-        combined = concat(applied, concat_dim, indexers=indexers)
+        if shortcut:
+            combined = self._concat_shortcut(applied, concat_dim, indexers)
+        else:
+            combined = concat(applied, concat_dim, indexers=indexers)
         return combined
 
+    def _concat_shortcut(self, applied, concat_dim, indexers):
+        from .variable import as_variable
+
+        applied = list(applied)
+        first = applied[0]
+        dim_name, = concat_dim.dims
+
+        variables = OrderedDict()
+        for k, v in iteritems(first._variables):
+            if dim_name in v.dims or (
+                    k in self.obj._variables
+                    and self.group_dim in self.obj._variables[k].dims):
+                variables[k] = Variable.concat(
+                    [ds._variables[k] for ds in applied], concat_dim,
+                    indexers, shortcut=True)
+            else:
+                # this variable is assumed to be the same in every group
+                variables[k] = v
+        variables[concat_dim.name] = as_variable(concat_dim)
+        if concat_dim.name == dim_name:
+            variables[dim_name] = variables[dim_name].to_coord()
+
+        coord_names = first._coord_names | set([concat_dim.name])
+        return first._replace_vars_and_dims(variables, coord_names)
+
     def reduce(self, func, dim=None, keep_attrs=False, **kwargs):
         """Reduce the items in this group by applying `func` along some
         dimension(s).
@@ -368,9 +806,142 @@ class DatasetGroupBy(GroupBy, ImplementsDatasetReduce):
             Array with summarized data and the indicated dimension(s)
             removed.
         """
+        fused = self._fused_reduce(func, dim, keep_attrs, **kwargs)
+        if fused is not None:
+            return fused
+
         def reduce_dataset(ds):
             return ds.reduce(func, dim, keep_attrs, **kwargs)
         return self.apply(reduce_dataset)
 
+    _cum_extra_args_docstring = \
+        """dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func` to each group. By
+            default, `func` is applied along the grouped dimension."""
+
+    def accumulate(self, func, dim=None, keep_attrs=False, numeric_only=False,
+                   **kwargs):
+        """Accumulate the items in this group by applying `func` along some
+        dimension(s).
+
+        Parameters
+        ----------
+        func : function
+            Function which can be called in the form
+            `func(x, axis=axis, **kwargs)` to return the result of
+            accumulating an np.ndarray along an integer valued axis, with the
+            same shape as `x`.
+        dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func` to each group. By
+            default, `func` is applied along the grouped dimension.
+        keep_attrs : bool, optional
+            If True, the datasets's attributes (`attrs`) will be copied from
+            the original object to the new one.  If False (default), the new
+            object will be returned without attributes.
+        numeric_only : bool, optional
+            If True, only apply ``func`` to variables with a numeric dtype.
+        **kwargs : dict
+            Additional keyword arguments passed on to `func`.
+
+        Returns
+        -------
+        accumulated : Dataset
+            Dataset with the same dimensions and coordinates as the grouped
+            dataset.
+        """
+        if self._fused_accumulate(func, dim, kwargs):
+            # accumulate all groups in a single pass
+            obj = self.obj
+            variables = OrderedDict()
+            for name, var in iteritems(obj._variables):
+                if self.group_dim in var.dims and name not in obj.coords:
+                    if not numeric_only or var.dtype.kind in 'ifc':
+                        variables[name] = self._accumulate_variable(
+                            func, var, **kwargs)
+                else:
+                    variables[name] = var
+            attrs = obj.attrs if keep_attrs else None
+            return obj._replace_vars_and_dims(variables, attrs=attrs)
+
+        if dim is None:
+            dim = self.group_dim
+
+        def accumulate_dataset(ds):
+            return ds.accumulate(func, dim, keep_attrs, numeric_only, **kwargs)
+        return self.apply(accumulate_dataset)
+
+    def _fused_reduce(self, func, dim, keep_attrs, numeric_only=False,
+                      **kwargs):
+        """Reduce all groups at once, like the result of applying
+        `Dataset.reduce` to each group and concatenating the results, or
+        return None if that is not possible.
+        """
+        dims = self._fused_reduce_dims(func, dim, kwargs)
+        if dims is None:
+            return None
+
+        variables = OrderedDict()
+        for name, var in iteritems(self.obj._variables):
+            reduce_dims = [d for d in var.dims if d in dims]
+            if reduce_dims or not var.dims:
+                if name in self.obj.coords or (
+                        numeric_only and var.dtype.kind not in 'ifc'):
+                    continue
+                if self.group_dim in var.dims:
+                    if var.dtype.kind not in ['b', 'i', 'u', 'f']:
+                        return None
+                    reduced = self._fused_reduce_variable(
+                        func, var, dims, **kwargs)
+                    first = reduced.values[:1]
+                    if utils.array_equiv(reduced.values,
+                                         np.repeat(first, len(self), 0)):
+                        # like concat, don't stack variables that are the
+                        # same for every group
+                        reduced = Variable(reduced.dims[1:], first[0])
+                    variables[name] = reduced
+                else:
+                    # this variable is the same for each group
+                    if len(reduce_dims) == var.ndim:
+                        reduce_dims = None
+                    elif len(reduce_dims) == 1:
+                        reduce_dims, = reduce_dims
+                    variables[name] = var.reduce(func, dim=reduce_dims,
+                                                 **kwargs)
+            else:
+                variables[name] = var
+        from .variable import as_variable
+        variables[self.unique_coord.name] = \
+            as_variable(self.unique_coord).to_coord()
+
+        coord_names = set(k for k in self.obj.coords if k in variables)
+        coord_names.add(self.unique_coord.name)
+        attrs = self.obj.attrs if keep_attrs else None
+        return self.obj._replace_vars_and_dims(variables, coord_names, attrs)
+
+    def _finalize_binary_op(self, result):
+        # like concatenating the result for each group, don't stack variables
+        # that did not depend on the grouped dimension and are the same for
+        # every group
+        dim = self.group_dim
+        variables = OrderedDict()
+        for k, v in iteritems(result._variables):
+            if (dim in v.dims and k in self.obj._variables
+                    and dim not in self.obj._variables[k].dims):
+                first = v.isel(**{dim: 0})
+                values = v.values
+                axis = v.get_axis_num(dim)
+                if utils.array_equiv(values, np.expand_dims(
+                        first.values, axis).repeat(v.shape[axis], axis)):
+                    v = first
+            if k in self.obj._variables:
+                # keep the original dimension order, as ArrayGroupBy does
+                dims = self.obj._variables[k].dims
+                if set(dims) <= set(v.dims) and v.dims[:len(dims)] != dims:
+                    v = v.transpose(*(dims + tuple(d for d in v.dims
+                                                   if d not in dims)))
+            variables[k] = v
+        return result._replace_vars_and_dims(variables)
+
 ops.inject_reduce_methods(DatasetGroupBy)
+ops.inject_cum_methods(DatasetGroupBy)
 ops.inject_binary_ops(DatasetGroupBy)
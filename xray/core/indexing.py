@@ -1,4 +1,8 @@
+import itertools
+import threading
+
 import numpy as np
+import pandas as pd
 
 from . import utils
 from .pycompat import iteritems, range
@@ -16,6 +20,9 @@ def expanded_indexer(key, ndim):
     if not isinstance(key, tuple):
         # numpy treats non-tuple keys equivalent to tuples of length 1
         key = (key,)
+    elif len(key) == ndim and not any(k is Ellipsis for k in key):
+        # already expanded
+        return key
     new_key = []
     # handling Ellipsis right is a little tricky, see:
     # http://docs.scipy.org/doc/numpy/reference/arrays.indexing.html#advanced-indexing
@@ -108,6 +115,32 @@ def orthogonal_indexer(key, shape):
     return tuple(key)
 
 
+def orthogonally_index(array, key):
+    """Index a numpy.ndarray with a key for orthogonal array indexing.
+
+    Integers and slices are applied first with basic indexing, which returns
+    a view, so only the remaining values are copied by array indexers. A
+    single array indexer is then applied along its own axis, without
+    building index arrays for the other axes. Several array indexers are
+    combined with `orthogonal_indexer` into a single fancy indexing operation
+    on the view, which in testing was faster than indexing along one axis at
+    a time.
+    """
+    key = canonicalize_indexer(key, array.ndim)
+    array = array[tuple(slice(None) if isinstance(k, np.ndarray) else k
+                        for k in key)]
+    # key for the remaining axes, once integers have collapsed their axes
+    key = [k if isinstance(k, np.ndarray) else slice(None)
+           for k in key if not isinstance(k, (int, np.integer))]
+    array_axes = [n for n, k in enumerate(key) if isinstance(k, np.ndarray)]
+    if len(array_axes) == 1:
+        axis, = array_axes
+        return array[(slice(None),) * axis + (key[axis],)]
+    elif array_axes:
+        return array[orthogonal_indexer(tuple(key), array.shape)]
+    return array
+
+
 def _try_get_item(x):
     try:
         return x.item()
@@ -115,36 +148,169 @@ def _try_get_item(x):
         return x
 
 
-def convert_label_indexer(index, label, index_name=''):
+# kinds of labels that can be looked up by binary search in an index with
+# values of each kind
+_SEARCHABLE_KINDS = {'i': 'iuf', 'u': 'iuf', 'f': 'iuf'}
+
+
+def _get_indexer(index, labels):
+    """Equivalent to ``index.get_indexer(labels)``, except that labels are
+    looked up by binary search if the index is sorted and unique, which is
+    fast even on the first lookup, when pandas would first have to build a
+    hash table of the entire index.
+    """
+    index = utils.safe_cast_to_index(index)
+    values = index.values
+    if values.dtype.kind == 'M':
+        searchable = labels.dtype == values.dtype
+    else:
+        searchable = (labels.dtype.kind
+                      in _SEARCHABLE_KINDS.get(values.dtype.kind, ''))
+    if (searchable and len(index) and labels.ndim == 1
+            and index.is_monotonic and index.is_unique):
+        indexer = np.searchsorted(values, labels)
+        found = values[np.minimum(indexer, len(values) - 1)] == labels
+        return np.where(found, indexer, -1)
+    return index.get_indexer(labels)
+
+
+def _as_index_labels(index, labels):
+    """Cast labels to the dtype of a datetime or timedelta index, so that
+    they can be compared with its values.
+    """
+    kind = index.dtype.kind
+    if kind == 'M' and labels.dtype != index.dtype:
+        labels = np.asarray(pd.to_datetime(labels), dtype=index.dtype)
+    elif kind == 'm' and labels.dtype != index.dtype:
+        labels = np.asarray(pd.to_timedelta(labels), dtype=index.dtype)
+    return labels
+
+
+def _distance(values, labels):
+    if values.dtype.kind in 'iu':
+        values = values.astype(float)
+    return abs(values - labels)
+
+
+def _get_fill_indexer(index, labels, method, tolerance=None):
+    """Given a pandas.Index and 1d array of labels, return the positions of
+    the matching values in the index, or of the closest values according to
+    `method` where there is no exact match, using binary search.
+
+    Positions for labels without a match (e.g., labels before the first
+    value with method='pad', or further from any value than `tolerance`) are
+    -1, like pandas.Index.get_indexer. The index must be monotonic
+    (increasing or decreasing); 'pad' and 'backfill' select the closest value
+    at an earlier or later position, respectively.
+    """
+    if method in ['ffill', 'bfill']:
+        method = {'ffill': 'pad', 'bfill': 'backfill'}[method]
+    if method not in ['pad', 'backfill', 'nearest']:
+        raise ValueError("invalid method %r: must be 'nearest', 'pad' "
+                         "('ffill') or 'backfill' ('bfill')" % method)
+    values = index.values
+    if ((method == 'nearest' or tolerance is not None)
+            and values.dtype.kind not in 'iufMm'):
+        raise TypeError("method 'nearest' and tolerance are only supported "
+                        "for numeric, datetime and timedelta indexes")
+    labels = _as_index_labels(index, labels)
+
+    size = len(values)
+    if size == 0:
+        indexer = np.empty(labels.shape, dtype=int)
+        indexer.fill(-1)
+        return indexer
+    # the position at which each label would be inserted
+    if index.is_monotonic:
+        increasing = True
+        positions = np.searchsorted(values, labels, side='left')
+    elif index.is_monotonic_decreasing:
+        increasing = False
+        positions = size - np.searchsorted(values[::-1], labels,
+                                           side='right')
+    else:
+        raise ValueError('index must be monotonic increasing or decreasing '
+                         'to select with method %r' % method)
+    exact = values[np.minimum(positions, size - 1)] == labels
+
+    previous = np.where(exact, positions, positions - 1)
+    following = np.where(positions < size, positions, -1)
+    if method == 'pad':
+        indexer = previous
+    elif method == 'backfill':
+        indexer = following
+    else:
+        previous_distance = _distance(values[previous], labels)
+        following_distance = _distance(values[following], labels)
+        # like pandas, break ties in favor of the larger value
+        closer = (previous_distance < following_distance if increasing
+                  else previous_distance <= following_distance)
+        use_previous = (previous >= 0) & (closer | (following < 0))
+        indexer = np.where(use_previous, previous, following)
+
+    if tolerance is not None:
+        if values.dtype.kind in 'Mm':
+            tolerance = pd.to_timedelta(tolerance).to_timedelta64()
+        too_far = _distance(values[indexer], labels) > tolerance
+        indexer = np.where(too_far, -1, indexer)
+    return indexer
+
+
+def convert_label_indexer(index, label, index_name='', method=None,
+                          tolerance=None):
     """Given a pandas.Index (or xray.Coordinate) and labels (e.g., from
     __getitem__) for one dimension, return an indexer suitable for indexing an
-    ndarray along that dimension
+    ndarray along that dimension.
+
+    If `method` is given, labels without an exact match select the closest
+    value in the index instead (see `_get_fill_indexer`).
     """
+    if tolerance is not None and method is None:
+        raise ValueError('tolerance can only be used with method')
     if isinstance(label, slice):
+        if method is not None:
+            raise NotImplementedError('cannot use method with slice '
+                                      'indexers')
         indexer = index.slice_indexer(_try_get_item(label.start),
                                       _try_get_item(label.stop),
                                       _try_get_item(label.step))
     else:
         label = np.asarray(label)
         if label.ndim == 0:
-            indexer = index.get_loc(np.asscalar(label))
+            if method is None:
+                indexer = index.get_loc(np.asscalar(label))
+            else:
+                index = utils.safe_cast_to_index(index)
+                indexer, = _get_fill_indexer(index, label.reshape(1), method,
+                                             tolerance)
+                if indexer < 0:
+                    raise KeyError('no value found in index %r for label %r '
+                                   'with method %r'
+                                   % (index_name, np.asscalar(label), method))
+                indexer = int(indexer)
         elif label.dtype.kind == 'b':
             indexer, = np.nonzero(label)
         else:
-            indexer = index.get_indexer(label)
+            if method is None:
+                indexer = _get_indexer(index, label)
+            else:
+                index = utils.safe_cast_to_index(index)
+                indexer = _get_fill_indexer(index, label, method, tolerance)
             if np.any(indexer < 0):
                 raise ValueError('not all values found in index %r'
                                  % index_name)
     return indexer
 
 
-def remap_label_indexers(data_obj, indexers):
+def remap_label_indexers(data_obj, indexers, method=None, tolerance=None):
     """Given an xray data object and label based indexers, return a mapping
     of equivalent location based indexers.
     """
-    return dict((dim, convert_label_indexer(data_obj[dim].to_index(), label, dim))
+    return dict((dim, convert_label_indexer(data_obj[dim].to_index(), label,
+                                            dim, method, tolerance))
                 for dim, label in iteritems(indexers))
 
+
 def slice_slice(old_slice, applied_slice, size):
     """Given a slice and the size of the dimension to which it will be applied,
     index it with another slice to return a new slice equivalent to applying
@@ -223,6 +389,205 @@ class LazyIntegerRange(utils.NDArrayMixin):
                 (type(self).__name__, self.array))
 
 
+# estimated overhead of each separate request to a backend, measured in bytes:
+# for sparse array keys, reading up to this many unneeded bytes to fill a gap
+# is preferred over making another request
+READ_CALL_COST = 2 ** 16
+
+# maximum number of separate requests used to read an orthogonal key
+MAX_READ_CALLS = 256
+
+
+def _strided_runs(positions):
+    """Divide sorted, unique positions into a list of slices, each covering
+    a run of evenly spaced positions.
+    """
+    runs = []
+    start = 0
+    n = len(positions)
+    while start < n:
+        stop = start + 1
+        if stop < n:
+            step = positions[stop] - positions[start]
+            while (stop + 1 < n
+                   and positions[stop + 1] - positions[stop] == step):
+                stop += 1
+            stop += 1
+            if stop - start == 2 and step > 1:
+                # two positions don't make a strided run: the second one may
+                # start a run of its own
+                stop -= 1
+                step = 1
+        else:
+            step = 1
+        runs.append(slice(int(positions[start]),
+                          int(positions[stop - 1]) + 1, int(step)))
+        start = stop
+    return runs
+
+
+def _native_indexer(k):
+    """Convert an integer or slice with numpy integers into one with native
+    Python integers, which are all that some backends (e.g., pydap) accept.
+    """
+    if isinstance(k, slice):
+        return slice(*[None if i is None else int(i)
+                       for i in (k.start, k.stop, k.step)])
+    return int(k)
+
+
+def _slice_size(slice_):
+    return len(range(slice_.start, slice_.stop, slice_.step))
+
+
+def _plan_axis_reads(positions, row_bytes):
+    """Given sorted, unique positions along one axis and the number of bytes
+    read for each position along it, return a list of slices to read from
+    the backend that cover all positions.
+
+    Strided runs of positions are read as separate slices, except that
+    neighbouring runs are coalesced into one contiguous slice when the bytes
+    needlessly read in between cost less than making another request.
+    """
+    pieces = []
+    for run in _strided_runs(positions):
+        if pieces:
+            last = pieces[-1]
+            merged = slice(last.start, run.stop, 1)
+            wasted = (_slice_size(merged) - _slice_size(last)
+                      - _slice_size(run))
+            if wasted * row_bytes <= READ_CALL_COST:
+                pieces[-1] = merged
+                continue
+        pieces.append(run)
+    read_bytes = sum(_slice_size(p) for p in pieces) * row_bytes
+    bounding = slice(int(positions[0]), int(positions[-1]) + 1, 1)
+    if (_slice_size(bounding) * row_bytes
+            <= read_bytes + (len(pieces) - 1) * READ_CALL_COST):
+        pieces = [bounding]
+    return pieces
+
+
+def plan_orthogonal_reads(key, shape, itemsize):
+    """Decompose an orthogonal key into requests supported by every backend.
+
+    Parameters
+    ----------
+    key : tuple
+        Orthogonal indexer in canonical form, as returned by
+        `canonicalize_indexer`.
+    shape : tuple
+        Shape of the array to be indexed.
+    itemsize : int
+        Number of bytes in each item of the array.
+
+    Returns
+    -------
+    pieces : list
+        List with the slices to read along each axis, or the original
+        integer or slice for axes not indexed by an array. Each combination
+        of slices (one for each axis) is a separate request.
+    local_key : tuple
+        Orthogonal indexer selecting the values given by the original key
+        from the concatenation of all requests, omitting axes indexed by
+        integers.
+    """
+    sizes = []
+    uniques = []
+    for k, size in zip(key, shape):
+        if isinstance(k, np.ndarray):
+            positions, inverse = np.unique(np.where(k < 0, k + size, k),
+                                           return_inverse=True)
+            sizes.append(positions.size)
+            uniques.append((positions, inverse))
+        else:
+            if isinstance(k, slice):
+                sizes.append(_slice_size(slice(*k.indices(size))))
+            else:
+                sizes.append(1)
+            uniques.append(None)
+
+    pieces = []
+    for n, (k, unique) in enumerate(zip(key, uniques)):
+        if unique is None:
+            pieces.append(_native_indexer(k))
+        elif unique[0].size == 0:
+            pieces.append([slice(0, 0, 1)])
+        else:
+            row_bytes = itemsize * int(np.prod(sizes[:n] + sizes[n + 1:]))
+            pieces.append(_plan_axis_reads(unique[0], row_bytes))
+
+    # bound the number of requests by reading the bounding slab along the
+    # axes divided into the most pieces
+    def num_reads():
+        return int(np.prod([len(p) for p in pieces if isinstance(p, list)]))
+
+    while num_reads() > MAX_READ_CALLS:
+        n = max(range(len(pieces)), key=lambda n: len(pieces[n])
+                if isinstance(pieces[n], list) else 0)
+        pieces[n] = [slice(pieces[n][0].start, pieces[n][-1].stop, 1)]
+
+    local_key = []
+    for k, p, unique in zip(key, pieces, uniques):
+        if unique is None:
+            if isinstance(k, slice):
+                local_key.append(slice(None))
+            continue
+        positions, inverse = unique
+        local = np.empty(positions.size, dtype=int)
+        offset = 0
+        for piece in p:
+            in_piece = ((positions >= piece.start) & (positions < piece.stop))
+            local[in_piece] = (offset + (positions[in_piece] - piece.start)
+                               // piece.step)
+            offset += _slice_size(piece)
+        local_key.append(local[inverse])
+    return pieces, tuple(local_key)
+
+
+def orthogonal_read(array, key):
+    """Index an array supporting orthogonal indexing with a canonical key,
+    converting any array indexers into as few and as small requests using
+    integers and slices as possible.
+
+    This is cheaper than passing arrays to backends like netCDF4, which read
+    arrays of positions element by element, and necessary for others like
+    pydap, which only support integers and slices.
+    """
+    if not any(isinstance(k, np.ndarray) for k in key):
+        return np.asarray(array[tuple(_native_indexer(k) for k in key)])
+    itemsize = getattr(array.dtype, 'itemsize', 0) or 8
+    pieces, local_key = plan_orthogonal_reads(key, array.shape, itemsize)
+    lists = [p if isinstance(p, list) else [p] for p in pieces]
+    non_int_axes = [n for n, p in enumerate(pieces)
+                    if not isinstance(p, (int, np.integer))]
+
+    if all(len(p) == 1 for p in lists):
+        region = np.asarray(array[tuple(p[0] for p in lists)])
+    else:
+        # concatenate the requests along each axis into a single region
+        offsets = []
+        region_shape = []
+        for n in non_int_axes:
+            p = pieces[n]
+            if isinstance(p, list):
+                sizes = [_slice_size(s) for s in p]
+            else:
+                sizes = [_slice_size(slice(*p.indices(array.shape[n])))]
+            offsets.append(np.cumsum([0] + sizes))
+            region_shape.append(sum(sizes))
+        region = None
+        for index in itertools.product(*[range(len(p)) for p in lists]):
+            block = np.asarray(array[tuple(p[i]
+                                           for p, i in zip(lists, index))])
+            if region is None:
+                region = np.empty(region_shape, dtype=block.dtype)
+            region_key = tuple(slice(o[index[n]], o[index[n] + 1])
+                               for o, n in zip(offsets, non_int_axes))
+            region[region_key] = block
+    return orthogonally_index(region, local_key)
+
+
 class LazilyIndexedArray(utils.NDArrayMixin):
     """Wrap an array that handles orthogonal indexing to make indexing lazy
     """
@@ -262,7 +627,7 @@ class LazilyIndexedArray(utils.NDArrayMixin):
         return tuple(shape)
 
     def __array__(self, dtype=None):
-        return np.asarray(self.array[self.key], dtype=None)
+        return np.asarray(orthogonal_read(self.array, self.key), dtype=dtype)
 
     def __getitem__(self, key):
         return type(self)(self.array, self._updated_key(key))
@@ -274,3 +639,345 @@ class LazilyIndexedArray(utils.NDArrayMixin):
     def __repr__(self):
         return ('%s(array=%r, key=%r)' %
                 (type(self).__name__, self.array, self.key))
+
+
+def canonicalize_points_key(key, shape):
+    """Given a key for pointwise array indexing, return an equivalent key
+    with a 1d integer array of non-negative positions for each selected axis
+    and a full slice for every other axis.
+
+    All arrays in the key must have the same length.
+    """
+    new_key = []
+    num_points = None
+    for k, size in zip(expanded_indexer(key, len(shape)), shape):
+        if not isinstance(k, slice):
+            k = np.asarray(k)
+            if k.size == 0:
+                # empty lists are converted to float arrays by numpy
+                k = k.astype(int)
+            if k.ndim != 1 or k.dtype.kind not in 'iu':
+                raise ValueError('pointwise indexers must be 1d arrays of '
+                                 'integers: %r' % k)
+            if num_points is None:
+                num_points = k.size
+            elif k.size != num_points:
+                raise ValueError('pointwise indexers must all have the same '
+                                 'length')
+            k = np.where(k < 0, k + size, k)
+            if k.size and (k.min() < 0 or k.max() >= size):
+                raise IndexError('pointwise index out of bounds for axis '
+                                 'with size %s' % size)
+        elif not is_full_slice(k):
+            raise ValueError('pointwise indexing only supports full slices '
+                             'for axes that are not selected')
+        new_key.append(k)
+    return tuple(new_key)
+
+
+def gather_points(array, key):
+    """Select points from a numpy.ndarray given a canonical pointwise key.
+
+    The result has a new first axis along the points, followed by each axis
+    that was not selected, in order.
+    """
+    point_axes = [n for n, k in enumerate(key) if not isinstance(k, slice)]
+    other_axes = [n for n, k in enumerate(key) if isinstance(k, slice)]
+    array = np.transpose(array, point_axes + other_axes)
+    return array[tuple(key[n] for n in point_axes)]
+
+
+# default maximum number of bytes to read at once when selecting points from
+# an array that is not in memory
+POINTWISE_BUFFER_SIZE = 2 ** 26
+
+
+class PointwiseIndexedArray(utils.NDArrayMixin):
+    """Wrap an array that handles orthogonal indexing to lazily select points
+    from it.
+
+    Points are given by integer arrays of the same length for some of the
+    axes, like numpy's advanced indexing. When loaded, the orthogonal block
+    spanned by the unique positions along each of these axes is read from the
+    wrapped array (see `orthogonal_read`), and the points are then gathered
+    from this block in memory. If this block would be larger than
+    `buffer_size` bytes, nearby points are read in separate, smaller blocks.
+    """
+    def __init__(self, array, key, buffer_size=None):
+        """
+        Parameters
+        ----------
+        array : array_like
+            Array like object to index, supporting orthogonal indexing.
+        key : tuple
+            Pointwise indexer, as returned by `canonicalize_points_key`.
+        buffer_size : int, optional
+            Maximum number of bytes in each block read from `array` (unless a
+            single point requires more). Defaults to POINTWISE_BUFFER_SIZE.
+        """
+        self.array = array
+        self.key = key
+        if buffer_size is None:
+            buffer_size = POINTWISE_BUFFER_SIZE
+        self.buffer_size = buffer_size
+
+    @property
+    def shape(self):
+        num_points = [k.size for k in self.key if not isinstance(k, slice)]
+        other_sizes = [size for size, k in zip(self.array.shape, self.key)
+                       if isinstance(k, slice)]
+        return tuple(num_points[:1] + other_sizes)
+
+    def _read_points(self, points):
+        block_key = []
+        points_key = []
+        points = iter(points)
+        for k in self.key:
+            if isinstance(k, slice):
+                block_key.append(k)
+                points_key.append(k)
+            else:
+                positions, inverse = np.unique(next(points),
+                                               return_inverse=True)
+                block_key.append(positions)
+                points_key.append(inverse)
+        block = orthogonal_read(self.array, tuple(block_key))
+        return gather_points(block, tuple(points_key))
+
+    def __array__(self, dtype=None):
+        points = [k for k in self.key if not isinstance(k, slice)]
+        itemsize = getattr(self.array.dtype, 'itemsize', 0) or 8
+        point_nbytes = itemsize * int(np.prod(self.shape[1:]))
+
+        # split the points, sorted by position, in half until the block
+        # spanned by each group of points is small enough to read at once
+        pending = [np.lexsort(points[::-1])]
+        result = None
+        while pending:
+            index = pending.pop()
+            group = [p[index] for p in points]
+            nbytes = point_nbytes * int(np.prod([np.unique(p).size
+                                                 for p in group]))
+            if nbytes > self.buffer_size and index.size > 1:
+                half = index.size // 2
+                pending.extend([index[half:], index[:half]])
+                continue
+            values = self._read_points(group)
+            if result is None:
+                result = np.empty(self.shape, dtype=values.dtype)
+            result[index] = values
+        return np.asarray(result, dtype=dtype)
+
+    def __getitem__(self, key):
+        array = np.asarray(self)
+        return orthogonally_index(array, key)
+
+    def __repr__(self):
+        return ('%s(array=%r, key=%r)' %
+                (type(self).__name__, self.array, self.key))
+
+
+def _positions_to_slice(positions):
+    """Convert an array of increasing, evenly spaced integer positions into an
+    equivalent slice object, if possible; otherwise return the array unchanged.
+    """
+    if len(positions) == 1:
+        return slice(positions[0], positions[0] + 1)
+    steps = np.diff(positions)
+    if len(steps) and steps[0] > 0 and (steps == steps[0]).all():
+        return slice(positions[0], positions[-1] + 1, steps[0])
+    return positions
+
+
+class ConcatenatedArray(utils.NDArrayMixin):
+    """Virtual array formed by concatenating other arrays along one axis.
+
+    Indexing this array only indexes the component arrays which overlap the
+    key along the concatenated axis, so it should be wrapped in a
+    LazilyIndexedArray to defer loading data from disk until it is needed.
+    """
+    def __init__(self, arrays, axis=0):
+        """
+        Parameters
+        ----------
+        arrays : sequence of array_like
+            Array like objects supporting orthogonal indexing. Each array must
+            have the same shape, except along the concatenated axis.
+        axis : int, optional
+            Axis along which the arrays are concatenated.
+        """
+        self.arrays = list(arrays)
+        if not self.arrays:
+            raise ValueError('must supply at least one array to concatenate')
+        self.axis = axis
+
+        first_shape = list(self.arrays[0].shape)
+        for array in self.arrays[1:]:
+            shape = list(array.shape)
+            if (len(shape) != len(first_shape)
+                    or shape[:axis] + shape[axis + 1:]
+                    != first_shape[:axis] + first_shape[axis + 1:]):
+                raise ValueError('arrays to concatenate must have matching '
+                                 'shapes except along axis %s' % axis)
+        sizes = [array.shape[axis] for array in self.arrays]
+        self._offsets = np.cumsum([0] + sizes)
+        first_shape[axis] = int(self._offsets[-1])
+        self._shape = tuple(first_shape)
+
+    @property
+    def dtype(self):
+        return np.result_type(*[array.dtype for array in self.arrays])
+
+    @property
+    def shape(self):
+        return self._shape
+
+    def _sub_key(self, key, subkey):
+        key = list(key)
+        key[self.axis] = subkey
+        return tuple(key)
+
+    def __getitem__(self, key):
+        key = canonicalize_indexer(key, self.ndim)
+        size = self.shape[self.axis]
+        k = key[self.axis]
+
+        if isinstance(k, (int, np.integer)):
+            if k < 0:
+                k += size
+            if not 0 <= k < size:
+                raise IndexError('index %s is out of bounds for axis %s with '
+                                 'size %s' % (key[self.axis], self.axis, size))
+            n = np.searchsorted(self._offsets, k, side='right') - 1
+            local_key = self._sub_key(key, int(k - self._offsets[n]))
+            return np.asarray(self.arrays[n][local_key])
+
+        if isinstance(k, slice):
+            positions = np.arange(*k.indices(size))
+        else:
+            positions = np.where(k < 0, k + size, k)
+
+        # the position of the concatenated axis in the result, once integer
+        # keys have collapsed their axes
+        new_axis = self.axis - sum(isinstance(other_k, (int, np.integer))
+                                   for other_k in key[:self.axis])
+        if positions.size == 0:
+            empty_key = self._sub_key(key, slice(0, 0))
+            return np.asarray(self.arrays[0][empty_key])
+
+        # index each component array once for each run of consecutive
+        # positions falling within it, so as to preserve the order of the key
+        sources = np.searchsorted(self._offsets, positions, side='right') - 1
+        run_starts = np.concatenate(
+            [[0], np.flatnonzero(np.diff(sources)) + 1, [positions.size]])
+        pieces = []
+        for start, stop in zip(run_starts[:-1], run_starts[1:]):
+            n = sources[start]
+            local = positions[start:stop] - self._offsets[n]
+            local_key = self._sub_key(key, _positions_to_slice(local))
+            pieces.append(np.asarray(self.arrays[n][local_key]))
+        return np.concatenate(pieces, axis=new_axis)
+
+    def __repr__(self):
+        return ('%s(arrays=%r, axis=%r)'
+                % (type(self).__name__, self.arrays, self.axis))
+
+
+def _normalize_chunks(chunks, shape):
+    """Given a chunk size (int) or a tuple of chunk sizes (int or None) for
+    each axis, return a tuple of positive chunk sizes for each axis.
+    """
+    if isinstance(chunks, (int, np.integer)) or chunks is None:
+        chunks = (chunks,) * len(shape)
+    chunks = tuple(chunks)
+    if len(chunks) != len(shape):
+        raise ValueError('chunks %r must have the same length as the number '
+                         'of dimensions, ndim=%s' % (chunks, len(shape)))
+    normalized = []
+    for c, size in zip(chunks, shape):
+        if c is None or c == -1:
+            c = max(size, 1)
+        if c < 1:
+            raise ValueError('chunk sizes must be positive integers: %r'
+                             % (chunks,))
+        normalized.append(int(c))
+    return tuple(normalized)
+
+
+# libraries for reading files from disk (e.g., netCDF4 and HDF5) are not
+# thread-safe, so blocks that aren't already in memory are loaded one at a time
+_READ_LOCK = threading.RLock()
+
+
+def _is_in_memory(array):
+    while not isinstance(array, (np.ndarray, pd.Index)):
+        array = getattr(array, 'array', None)
+        if array is None:
+            return False
+    return True
+
+
+class BlockedArray(utils.NDArrayMixin):
+    """Wrap a lazily indexed array to divide it into blocks of fixed size.
+
+    Indexing a BlockedArray is lazy and returns another BlockedArray, but
+    operations aware of blocks (like reductions in xray.core.ops) can process
+    it one block at a time with bounded memory.
+    """
+    def __init__(self, array, chunks=None):
+        """
+        Parameters
+        ----------
+        array : array_like
+            Array like object supporting orthogonal indexing. If it is not
+            already lazy, it is wrapped in a LazilyIndexedArray.
+        chunks : int or tuple, optional
+            Block size along each axis. An integer is used for all axes, and
+            None or -1 indicate a single block along an axis. By default, the
+            whole array is one block.
+        """
+        if isinstance(array, BlockedArray):
+            array = array.array
+        if not isinstance(array, LazilyIndexedArray):
+            array = LazilyIndexedArray(array)
+        self.array = array
+        self.chunks = _normalize_chunks(chunks, array.shape)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.array, dtype=dtype)
+
+    def __getitem__(self, key):
+        key = expanded_indexer(key, self.ndim)
+        chunks = tuple(c for k, c in zip(key, self.chunks)
+                       if not isinstance(k, (int, np.integer)))
+        return type(self)(self.array[key], chunks)
+
+    def block_slices(self, axis):
+        """List of slices selecting each block along the given axis."""
+        size = self.shape[axis]
+        chunk = self.chunks[axis]
+        starts = range(0, size, chunk) or [0]
+        return [slice(start, min(start + chunk, size)) for start in starts]
+
+    def load_block(self, key):
+        """Load the block selected by a tuple of slices as a numpy.ndarray.
+
+        This is safe to call from multiple threads: reads from arrays that
+        are not already in memory are serialized.
+        """
+        if _is_in_memory(self.array):
+            return np.asarray(self.array[key])
+        with _READ_LOCK:
+            return np.asarray(self.array[key])
+
+    def iter_blocks(self):
+        """Iterate over (key, block) pairs for each block, where each key is
+        a tuple of slices and each block is loaded as a numpy.ndarray.
+        """
+        for key in itertools.product(*[self.block_slices(n)
+                                       for n in range(self.ndim)]):
+            yield key, self.load_block(key)
+
+    def __repr__(self):
+        return ('%s(array=%r, chunks=%r)'
+                % (type(self).__name__, self.array, self.chunks))
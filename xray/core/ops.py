@@ -1,8 +1,10 @@
+import itertools
 import operator
 
 import numpy as np
 import pandas as pd
 
+from . import parallel
 from . import utils
 from .pycompat import PY3
 
@@ -32,7 +34,9 @@ PANDAS_UNARY_FUNCTIONS = ['isnull', 'notnull']
 NUMPY_REDUCE_METHODS = ['all', 'any']
 NAN_REDUCE_METHODS = ['argmax', 'argmin', 'max', 'min', 'mean', 'sum',
                       'std', 'var', 'median']
-# TODO: wrap cumprod/cumsum, take, dot, sort
+# methods which accumulate values along an axis without changing its shape
+NAN_CUM_METHODS = ['cumsum', 'cumprod']
+# TODO: wrap take, dot, sort
 
 
 def _values_method_wrapper(name):
@@ -98,6 +102,297 @@ def count(values, axis=None):
     return np.sum(~pd.isnull(values), axis=axis)
 
 
+def _skipna_mask(block, skipna):
+    return pd.isnull(block) if skipna else None
+
+
+def _fill_masked(block, mask, value):
+    if mask is not None and mask.any():
+        block = np.where(mask, value, block)
+    return block
+
+
+def _count_partial(block, axes, mask):
+    if mask is None:
+        n = int(np.prod([block.shape[a] for a in axes]))
+        shape = [s for a, s in enumerate(block.shape) if a not in axes]
+        counts = np.empty(shape, dtype=int)
+        counts.fill(n)
+        return counts
+    return np.sum(~mask, axis=axes)
+
+
+def _ufunc_partial(ufunc, nan_ufunc, fill):
+    def partial(block, axes, skipna):
+        if skipna and nan_ufunc is not None:
+            return (nan_ufunc.reduce(block, axis=axes),)
+        mask = _skipna_mask(block, skipna)
+        return (ufunc.reduce(_fill_masked(block, mask, fill), axis=axes),)
+    return partial
+
+
+def _ufunc_combine(ufunc, nan_ufunc=None):
+    def combine(a, b, skipna):
+        f = nan_ufunc if skipna and nan_ufunc is not None else ufunc
+        return (f(a[0], b[0]),)
+    return combine
+
+
+def _first_finalize(state, dtype, ddof):
+    return state[0]
+
+
+def _count_block_partial(block, axes, skipna):
+    return (_count_partial(block, axes, pd.isnull(block)),)
+
+
+def _mean_partial(block, axes, skipna):
+    mask = _skipna_mask(block, skipna)
+    total = np.sum(_fill_masked(block, mask, 0), axis=axes,
+                   dtype=np.result_type(block.dtype, np.float64))
+    return total, _count_partial(block, axes, mask)
+
+
+def _sum_combine(a, b, skipna):
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def _result_dtype(dtype):
+    return dtype if dtype.kind in ['f', 'c'] else np.dtype(float)
+
+
+def _mean_finalize(state, dtype, ddof):
+    total, n = state
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / n
+    return np.asarray(mean, dtype=_result_dtype(dtype))
+
+
+def _moments_partial(block, axes, skipna):
+    mask = _skipna_mask(block, skipna)
+    total, n = _mean_partial(block, axes, skipna)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / n
+    expanded_mean = mean
+    for a in sorted(axes):
+        expanded_mean = np.expand_dims(expanded_mean, a)
+    deviations = _fill_masked(block - expanded_mean, mask, 0)
+    m2 = np.sum(abs(deviations) ** 2, axis=axes)
+    return n, mean, m2
+
+
+def _moments_combine(a, b, skipna):
+    # pairwise update of the count, mean and sum of squared deviations from
+    # the mean (Chan et al., 1979)
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = mean_b - mean_a
+        frac_b = n_b / np.asarray(n, dtype=float)
+        mean = np.where(n_a == 0, mean_b,
+                        np.where(n_b == 0, mean_a, mean_a + delta * frac_b))
+        m2 = np.where(n_a == 0, m2_b,
+                      np.where(n_b == 0, m2_a,
+                               m2_a + m2_b + abs(delta) ** 2 * n_a * frac_b))
+    return n, mean, m2
+
+
+def _var_finalize(state, dtype, ddof):
+    n, _, m2 = state
+    dof = n - ddof
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = np.where(dof > 0, m2 / dof, np.nan)
+    return np.asarray(variance, dtype=_result_dtype(dtype))
+
+
+def _std_finalize(state, dtype, ddof):
+    return np.sqrt(_var_finalize(state, dtype, ddof))
+
+
+# (partial, combine, finalize) functions for reductions that can be computed
+# one block at a time
+_BLOCKWISE_REDUCTIONS = {
+    'sum': (_ufunc_partial(np.add, None, 0), _sum_combine,
+            _first_finalize),
+    'prod': (_ufunc_partial(np.multiply, None, 1),
+             _ufunc_combine(np.multiply), _first_finalize),
+    'max': (_ufunc_partial(np.maximum, np.fmax, None),
+            _ufunc_combine(np.maximum, np.fmax), _first_finalize),
+    'min': (_ufunc_partial(np.minimum, np.fmin, None),
+            _ufunc_combine(np.minimum, np.fmin), _first_finalize),
+    'count': (_count_block_partial, _sum_combine, _first_finalize),
+    'mean': (_mean_partial, _sum_combine, _mean_finalize),
+    'var': (_moments_partial, _moments_combine, _var_finalize),
+    'std': (_moments_partial, _moments_combine, _std_finalize),
+}
+
+
+def _blockwise_reduce(name, blocked, axis=None, skipna=False, ddof=0):
+    """Reduce a BlockedArray by loading and reducing one block at a time.
+
+    Blocks are reduced in parallel if enabled with
+    `xray.core.parallel.set_num_threads`, and the partial results for each
+    block of the output are combined with a tree reduction. Blocks that are
+    not already in memory are read one at a time.
+    """
+    partial, combine, finalize = _BLOCKWISE_REDUCTIONS[name]
+    ndim = blocked.ndim
+    axes = (tuple(range(ndim)) if axis is None
+            else tuple(int(a) % ndim for a in np.atleast_1d(axis)))
+    kept = [n for n in range(ndim) if n not in axes]
+    kept_keys = list(itertools.product(*[blocked.block_slices(n)
+                                         for n in kept]))
+    reduced_keys = list(itertools.product(*[blocked.block_slices(n)
+                                            for n in axes]))
+
+    def block_key(kept_key, reduced_key):
+        key = [None] * ndim
+        for n, k in zip(kept, kept_key):
+            key[n] = k
+        for n, k in zip(axes, reduced_key):
+            key[n] = k
+        return tuple(key)
+
+    def reduce_block(key):
+        return partial(blocked.load_block(key), axes, skipna)
+
+    def combine_states(a, b):
+        return combine(a, b, skipna)
+
+    keys = (block_key(kept_key, reduced_key) for kept_key in kept_keys
+            for reduced_key in reduced_keys)
+    states = parallel.imap(reduce_block, keys)
+
+    result = None
+    for kept_key in kept_keys:
+        region_states = itertools.islice(states, len(reduced_keys))
+        state = parallel.tree_reduce(combine_states, region_states)
+        value = np.asarray(finalize(state, blocked.dtype, ddof))
+        if result is None:
+            shape = tuple(blocked.shape[n] for n in kept)
+            result = np.empty(shape, dtype=value.dtype)
+        result[kept_key] = value
+    return result[()] if result.ndim == 0 else result
+
+
+def _create_blockwise_method(name, func):
+    def f(blocked, axis=None, skipna=None, **kwargs):
+        kwargs.pop('dtype', None)
+        kwargs.pop('out', None)
+        ddof = kwargs.pop('ddof', 0)
+        if kwargs or blocked.dtype.kind not in ['b', 'i', 'u', 'f', 'c']:
+            # fall back to loading all the data into memory at once
+            if ddof:
+                kwargs['ddof'] = ddof
+            return func(np.asarray(blocked), axis=axis, skipna=skipna,
+                        **kwargs)
+        skipna = bool(skipna or (skipna is None
+                                 and blocked.dtype.kind == 'f'))
+        if skipna and blocked.dtype.kind not in ['i', 'f']:
+            raise NotImplementedError(
+                'skipna=True not yet implemented for %s with dtype %s'
+                % (name, blocked.dtype))
+        return _blockwise_reduce(name, blocked, axis, skipna, ddof)
+    return f
+
+
+def _count_blockwise(blocked, axis=None):
+    return _blockwise_reduce('count', blocked, axis)
+
+
+count.blockwise = _count_blockwise
+
+
+def _grouped_reduce(name, values, starts, axis, other_axes=(),
+                    skipna=False, ddof=0):
+    """Reduce every group of an array at once, without splitting it apart.
+
+    The groups must be contiguous along `axis`, beginning at the positions
+    given by `starts`. Each group is also reduced along `other_axes`. The
+    result has the group axis first, followed by the remaining axes of
+    `values` in order.
+    """
+    values = np.asarray(values)
+    ndim = values.ndim
+    other_axes = tuple(int(a) % ndim for a in other_axes)
+    kept = [n for n in range(ndim) if n != axis and n not in other_axes]
+    values = values.transpose([axis] + kept + list(other_axes))
+    other_size = 1
+    if other_axes:
+        # combine the other reduced axes into a single trailing axis
+        shape = values.shape[:1 + len(kept)]
+        other_size = int(np.prod(values.shape[1 + len(kept):]))
+        values = values.reshape(shape + (other_size,))
+
+    starts = np.asarray(starts, dtype=int)
+    sizes = np.diff(np.append(starts, values.shape[0]))
+
+    def group_reduce(ufunc, x, dtype=None):
+        if other_axes:
+            x = ufunc.reduce(x, axis=-1, dtype=dtype)
+        return ufunc.reduceat(x, starts, axis=0, dtype=dtype)
+
+    def group_count(mask):
+        if mask is None:
+            return sizes.reshape((-1,) + (1,) * len(kept)) * other_size
+        return group_reduce(np.add, ~mask, dtype=int)
+
+    if name in ['max', 'min']:
+        ufunc = {('max', False): np.maximum, ('max', True): np.fmax,
+                 ('min', False): np.minimum, ('min', True): np.fmin}[
+                     name, skipna]
+        return group_reduce(ufunc, values)
+
+    if name == 'count':
+        return group_count(pd.isnull(values))
+
+    mask = _skipna_mask(values, skipna)
+    if mask is not None and not mask.any():
+        mask = None
+    if name in ['sum', 'prod']:
+        ufunc, fill = (np.add, 0) if name == 'sum' else (np.multiply, 1)
+        # use the same dtype as np.sum and np.prod, which upcast integers
+        dtype = ufunc.reduce(np.zeros(1, values.dtype)).dtype
+        return group_reduce(ufunc, _fill_masked(values, mask, fill), dtype)
+
+    # mean, var and std
+    dtype = np.result_type(values.dtype, np.float64)
+    total = group_reduce(np.add, _fill_masked(values, mask, 0), dtype)
+    n = group_count(mask)
+    if name == 'mean':
+        return _mean_finalize((total, n), values.dtype, ddof)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / n
+    expanded_mean = np.repeat(mean, sizes, axis=0)
+    if other_axes:
+        expanded_mean = expanded_mean[..., np.newaxis]
+    deviations = _fill_masked(values - expanded_mean, mask, 0)
+    m2 = group_reduce(np.add, abs(deviations) ** 2)
+    finalize = _var_finalize if name == 'var' else _std_finalize
+    return finalize((n, mean, m2), values.dtype, ddof)
+
+
+def _create_grouped_method(name):
+    def f(values, starts, axis, other_axes=(), skipna=None, ddof=0):
+        skipna = bool(skipna or (skipna is None and values.dtype.kind == 'f'))
+        if skipna and name != 'count' and values.dtype.kind not in ['i', 'f']:
+            raise NotImplementedError(
+                'skipna=True not yet implemented for %s with dtype %s'
+                % (name, values.dtype))
+        return _grouped_reduce(name, values, starts, axis, other_axes,
+                               skipna, ddof)
+    return f
+
+
+# reductions that can be computed for all groups at once by GroupBy objects
+_GROUPED_REDUCTIONS = ['sum', 'prod', 'max', 'min', 'count', 'mean', 'var',
+                       'std']
+
+count.grouped = _create_grouped_method('count')
+
+
 def _create_nan_agg_method(name, numeric_only=False):
     def f(values, axis=None, skipna=None, **kwargs):
         # ignore keyword args inserted by np.mean and other numpy aggreagators
@@ -125,6 +420,10 @@ def _create_nan_agg_method(name, numeric_only=False):
             func = getattr(np, name)
         return func(values, axis=axis, **kwargs)
     f.numeric_only = numeric_only
+    if name in _BLOCKWISE_REDUCTIONS:
+        f.blockwise = _create_blockwise_method(name, f)
+    if name in _GROUPED_REDUCTIONS:
+        f.grouped = _create_grouped_method(name)
     return f
 
 
@@ -139,6 +438,295 @@ var = _create_nan_agg_method('var', numeric_only=True)
 median = _create_nan_agg_method('median', numeric_only=True)
 
 
+def _skip_missing(values, skipna):
+    return skipna or (skipna is None and values.dtype.kind == 'f')
+
+
+def _create_first_or_last_method(name):
+    def f(values, axis=None, skipna=None):
+        values = np.rollaxis(np.asarray(values), 0 if axis is None else axis)
+        if name == 'last':
+            values = values[::-1]
+        if not _skip_missing(values, skipna):
+            return values[0]
+        # the first non-missing value, or a missing value if all are missing
+        index = (~pd.isnull(values)).argmax(axis=0)
+        return values[(index,) + tuple(np.indices(index.shape))]
+
+    def grouped(values, starts, axis, other_axes=(), skipna=None):
+        if other_axes:
+            raise NotImplementedError(
+                '%s can only be applied along the grouped dimension' % name)
+        values = np.rollaxis(np.asarray(values), axis)
+        n = values.shape[0]
+        starts = np.asarray(starts, dtype=int)
+        stops = np.append(starts[1:], n)
+        if not _skip_missing(values, skipna):
+            return values[starts if name == 'first' else stops - 1]
+        shape = (-1,) + (1,) * (values.ndim - 1)
+        positions = np.arange(n).reshape(shape)
+        valid = ~pd.isnull(values)
+        if name == 'first':
+            index = np.minimum.reduceat(np.where(valid, positions, n),
+                                        starts, axis=0)
+            found = index < n
+        else:
+            index = np.maximum.reduceat(np.where(valid, positions, -1),
+                                        starts, axis=0)
+            found = index >= 0
+        # groups without any valid values select their (missing) first value
+        index = np.where(found, index, starts.reshape(shape))
+        return values[(index,) + tuple(np.indices(index.shape))[1:]]
+
+    f.__name__ = name
+    f.grouped = grouped
+    return f
+
+
+# select the first or last value along an axis, like pandas.GroupBy.first
+first = _create_first_or_last_method('first')
+last = _create_first_or_last_method('last')
+
+
+_CUM_UFUNCS = {'cumsum': (np.add, 0), 'cumprod': (np.multiply, 1)}
+
+
+def _group_offsets(accumulated, starts):
+    # the accumulated value just before the start of each element's group
+    sizes = np.diff(np.append(starts, len(accumulated)))
+    before = np.concatenate([np.zeros_like(accumulated[:1]),
+                             accumulated[starts[1:] - 1]])
+    return np.repeat(before, sizes, axis=0)
+
+
+def _segmented_scan(ufunc, values, starts):
+    # inclusive scan along the first axis that restarts at each position in
+    # starts, computed in a logarithmic number of vectorized steps
+    n = len(values)
+    sizes = np.diff(np.append(starts, n))
+    group_start = np.repeat(starts, sizes)
+    positions = np.arange(n)
+    result = values.copy()
+    shift = 1
+    while shift < n:
+        index = positions[positions - shift >= group_start]
+        if not index.size:
+            break
+        result[index] = ufunc(result[index], result[index - shift])
+        shift *= 2
+    return result
+
+
+def _grouped_accumulate(name, values, codes, axis, skipna=False):
+    """Accumulate every group of an array at once, without splitting it
+    apart.
+
+    `codes` gives the group of each element along `axis`. Values are
+    accumulated in order within each group, and the result has the same shape
+    as `values`.
+    """
+    values = np.rollaxis(np.asarray(values), axis)
+    codes = np.asarray(codes)
+    order = np.argsort(codes, kind='mergesort')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.concatenate(
+        [[True], sorted_codes[1:] != sorted_codes[:-1]]))[:len(codes)]
+    ufunc, identity = _CUM_UFUNCS[name]
+
+    values = values.take(order, axis=0)
+    mask = pd.isnull(values) if values.dtype.kind == 'f' else None
+    if mask is not None and not mask.any():
+        mask = None
+    values = _fill_masked(values, mask, identity)
+    # accumulate in the same dtype numpy would (e.g., small ints are
+    # promoted), restarting at each group so errors don't build up across
+    # groups
+    dtype = getattr(np, name)(values[:0], axis=0).dtype
+    accumulated = _segmented_scan(ufunc, values.astype(dtype), starts)
+    if mask is not None and not skipna:
+        # missing values propagate to the end of their group
+        seen = np.cumsum(mask, axis=0)
+        accumulated[seen - _group_offsets(seen, starts) > 0] = np.nan
+
+    result = np.empty_like(accumulated)
+    result[order] = accumulated
+    return np.rollaxis(result, 0, axis + 1)
+
+
+def _create_cum_blockwise_method(name, f):
+    ufunc, _ = _CUM_UFUNCS[name]
+
+    def blockwise(blocked, axis, **kwargs):
+        # accumulate one block at a time, carrying over the last values of
+        # the preceding block along the axis
+        result = None
+        for key, block in blocked.iter_blocks():
+            accumulated = f(block, axis=axis, **kwargs)
+            if result is None:
+                result = np.empty(blocked.shape, accumulated.dtype)
+            start = key[axis].start
+            if start > 0:
+                previous = list(key)
+                previous[axis] = slice(start - 1, start)
+                accumulated = ufunc(accumulated, result[tuple(previous)])
+            result[key] = accumulated
+        return result
+    return blockwise
+
+
+def _create_cum_method(name):
+    _, identity = _CUM_UFUNCS[name]
+
+    def f(values, axis=None, skipna=None, **kwargs):
+        kwargs.pop('out', None)
+        values = np.asarray(values)
+        if skipna or (skipna is None and values.dtype.kind == 'f'):
+            if values.dtype.kind not in ['i', 'f']:
+                raise NotImplementedError(
+                    'skipna=True not yet implemented for %s with dtype %s'
+                    % (name, values.dtype))
+            if values.dtype.kind == 'f':
+                values = _fill_masked(values, pd.isnull(values), identity)
+        return getattr(np, name)(values, axis=axis, **kwargs)
+
+    def grouped(values, codes, axis, skipna=None):
+        skipna = bool(skipna or (skipna is None and values.dtype.kind == 'f'))
+        if skipna and values.dtype.kind not in ['i', 'f']:
+            raise NotImplementedError(
+                'skipna=True not yet implemented for %s with dtype %s'
+                % (name, values.dtype))
+        return _grouped_accumulate(name, values, codes, axis, skipna)
+
+    f.numeric_only = True
+    f.blockwise = _create_cum_blockwise_method(name, f)
+    f.grouped = grouped
+    f.__name__ = name
+    return f
+
+
+cumsum = _create_cum_method('cumsum')
+cumprod = _create_cum_method('cumprod')
+
+
+def _move_sums(values, window):
+    # moving window sums along the last axis, from differences of cumulative
+    # sums; windows at the start of the axis are truncated
+    cumsum = np.cumsum(values, axis=-1)
+    sums = cumsum.copy()
+    sums[..., window:] -= cumsum[..., :-window]
+    return sums
+
+
+def _move_extreme(values, window, ufunc, fill):
+    # moving window max or min along the last axis in linear time (the van
+    # Herk/Gil-Werman algorithm): divide the axis into blocks of size window,
+    # so every window spans the tail of one block and the head of the next
+    n = values.shape[-1]
+    num_blocks = -(-n // window)
+    padding = np.empty(values.shape[:-1] + (num_blocks * window - n,))
+    padding.fill(fill)
+    blocks = np.concatenate([values, padding], axis=-1).reshape(
+        values.shape[:-1] + (num_blocks, window))
+    shape = values.shape[:-1] + (-1,)
+    head = ufunc.accumulate(blocks, axis=-1).reshape(shape)[..., :n]
+    tail = ufunc.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    tail = tail.reshape(shape)[..., :n]
+    result = head.copy()
+    result[..., window - 1:] = ufunc(tail[..., :n - window + 1],
+                                     head[..., window - 1:])
+    return result
+
+
+def _move_reduce_bottleneck(name, values, window, min_periods, ddof):
+    func = getattr(bn, 'move_' + name, None)
+    if func is None or bn is np:
+        return None
+    kwargs = {'ddof': ddof} if name in ['std', 'var'] else {}
+    try:
+        return func(values, window, axis=-1, min_count=min_periods, **kwargs)
+    except TypeError:
+        # versions of bottleneck before 1.0 do not skip NaN or support
+        # min_count
+        return None
+
+
+def _move_reduce(name, values, window, axis, min_periods=None,
+                 center=False, ddof=0):
+    """Reduce every window of `window` consecutive values along an axis of an
+    array, skipping missing values.
+
+    Each result is labeled by the position of the last value in its window,
+    or by the central position if `center` is True. Windows with fewer than
+    `min_periods` (by default, `window`) valid values are NaN. Uses
+    bottleneck's moving window functions when available; otherwise, every
+    reduction is computed in linear time with vectorized numpy operations.
+    """
+    if min_periods is None:
+        min_periods = window
+    values = np.asarray(values)
+    if values.dtype.kind not in 'biuf':
+        raise TypeError('moving window %s is not supported for dtype %s'
+                        % (name, values.dtype))
+    if values.dtype.kind != 'f':
+        values = values.astype(float)
+    values = np.swapaxes(values, axis, -1)
+
+    offset = (window - 1) // 2 if center else 0
+    if offset:
+        # extend the array with missing values, so the windows centered on
+        # the last values are all computed
+        padding = np.empty(values.shape[:-1] + (offset,), values.dtype)
+        padding.fill(np.nan)
+        values = np.concatenate([values, padding], axis=-1)
+    # windows longer than the array are truncated to its length
+    if window > values.shape[-1]:
+        window = values.shape[-1] or 1
+
+    result = _move_reduce_bottleneck(name, values, window, min_periods, ddof)
+    if result is None:
+        mask = np.isnan(values)
+        counts = _move_sums(~mask, window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if name == 'count':
+                result = counts.astype(float)
+            elif name in ['max', 'min']:
+                ufunc, fill = ((np.maximum, -np.inf) if name == 'max'
+                               else (np.minimum, np.inf))
+                result = _move_extreme(_fill_masked(values, mask, fill),
+                                       window, ufunc, fill)
+            else:
+                # subtract the mean of each series, to limit the loss of
+                # precision from differencing cumulative sums
+                total = _fill_masked(values, mask, 0).sum(
+                    axis=-1, keepdims=True)
+                count = (~mask).sum(axis=-1, keepdims=True)
+                shift = total / np.maximum(count, 1)
+                deviations = _fill_masked(values - shift, mask, 0)
+                sums = _move_sums(deviations, window)
+                if name == 'sum':
+                    result = sums + shift * counts
+                elif name == 'mean':
+                    result = sums / counts + shift
+                else:
+                    m2 = (_move_sums(deviations ** 2, window)
+                          - sums ** 2 / counts)
+                    # single values have no deviation, but rounding errors
+                    # could make them appear to
+                    m2[counts == 1] = 0
+                    result = np.maximum(m2, 0) / (counts - ddof)
+                    result[counts <= ddof] = np.nan
+                    if name == 'std':
+                        result = np.sqrt(result)
+        result[counts < min_periods] = np.nan
+
+    result = result[..., offset:]
+    return np.swapaxes(result, axis, -1)
+
+
+# reductions that can be computed for every window at once by Rolling objects
+_MOVE_REDUCTIONS = ['sum', 'mean', 'std', 'var', 'max', 'min', 'count']
+
+
 def numeric_only(f):
     f.numeric_only = True
     return f
@@ -172,6 +760,10 @@ def prod(values, axis=None, skipna=None, **kwargs):
     return np.prod(values, axis=axis, **kwargs)
 
 
+prod.blockwise = _create_blockwise_method('prod', prod)
+prod.grouped = _create_grouped_method('prod')
+
+
 def _ensure_bool_is_ndarray(result, *args):
     # numpy will sometimes return a scalar value from binary comparisons if it
     # can't handle the comparison instead of broadcasting, e.g.,
@@ -210,6 +802,41 @@ def inject_reduce_methods(cls):
         setattr(cls, name, func)
 
 
+_CUM_DOCSTRING_TEMPLATE = \
+        """Apply `{name}` along some dimension(s) of this {cls}'s data.
+
+        Parameters
+        ----------
+        {extra_args}
+        skipna : bool, optional
+            If True, skip missing values (as marked by NaN), which are treated
+            like zero for `cumsum` or one for `cumprod`. By default, only
+            skips missing values for float dtypes.
+        keep_attrs : bool, optional
+            If True, the attributes (`attrs`) will be copied from the original
+            object to the new one.  If False (default), the new object will be
+            returned without attributes.
+        **kwargs : dict
+            Additional keyword arguments passed on to `{name}`.
+
+        Returns
+        -------
+        cumulative : {cls}
+            New {cls} object with `{name}` applied to its data along the
+            indicated dimension(s), with the same shape and coordinates.
+        """
+
+
+def inject_cum_methods(cls):
+    for name in NAN_CUM_METHODS:
+        func = cls._cum_method(globals()[name])
+        func.__name__ = name
+        func.__doc__ = _CUM_DOCSTRING_TEMPLATE.format(
+            name=name, cls=cls.__name__,
+            extra_args=cls._cum_extra_args_docstring.format(name=name))
+        setattr(cls, name, func)
+
+
 def op_str(name):
     return '__%s__' % name
 
@@ -218,6 +845,11 @@ def op(name):
     return getattr(operator, op_str(name))
 
 
+# unary operators that act element-wise, which can safely be applied to each
+# block of an array separately
+ELEMENTWISE_UNARY_OPS = frozenset(op(name) for name in UNARY_OPS)
+
+
 def inject_binary_ops(cls, inplace=False):
     for name in CMP_BINARY_OPS + NUM_BINARY_OPS:
         setattr(cls, op_str(name), cls._binary_op(op(name)))
@@ -252,3 +884,4 @@ def inject_all_ops_and_reduce_methods(cls, priority=50, array_only=True):
         for name in NUMPY_SAME_METHODS:
             setattr(cls, name, _values_method_wrapper(name))
     inject_reduce_methods(cls)
+    inject_cum_methods(cls)
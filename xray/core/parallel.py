@@ -0,0 +1,164 @@
+"""Execution of array operations block by block on a pool of threads.
+
+Most of the numpy (and bottleneck) routines used by xray release the GIL, so
+splitting large arrays into blocks and processing them on a thread pool can
+make use of all available cores. By default, everything is run serially; call
+`set_num_threads` to enable parallel execution.
+"""
+import threading
+
+import numpy as np
+
+from . import utils
+
+
+# only split arrays into blocks with at least this many elements, since
+# dispatching very small blocks to threads is slower than not bothering
+MIN_BLOCK_SIZE = 2 ** 16
+
+_state = threading.local()
+_lock = threading.Lock()
+_num_threads = 1
+_pool = None
+
+
+def get_num_threads():
+    """Number of threads used for executing array operations blockwise."""
+    return _num_threads
+
+
+def set_num_threads(num_threads):
+    """Set the number of threads used for executing array operations
+    blockwise.
+
+    Parameters
+    ----------
+    num_threads : int
+        Number of threads to use. If 1 (the default), all operations are
+        executed serially in the calling thread.
+    """
+    global _num_threads, _pool
+    num_threads = int(num_threads)
+    if num_threads < 1:
+        raise ValueError('num_threads must be at least 1')
+    with _lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+        _num_threads = num_threads
+
+
+def _in_worker():
+    return getattr(_state, 'in_worker', False)
+
+
+def _is_parallel():
+    # never submit work to the pool from one of its own threads, which could
+    # deadlock if all the threads end up waiting on each other
+    return _num_threads > 1 and not _in_worker()
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            from multiprocessing.pool import ThreadPool
+            _pool = ThreadPool(_num_threads)
+        return _pool
+
+
+def _run_in_worker(func):
+    def wrapper(arg):
+        _state.in_worker = True
+        try:
+            return func(arg)
+        finally:
+            _state.in_worker = False
+    return wrapper
+
+
+def imap(func, iterable):
+    """Lazily apply a function to each item of an iterable, on the thread pool
+    if parallel execution is enabled. Results are returned in order.
+    """
+    if not _is_parallel():
+        return (func(item) for item in iterable)
+    return _get_pool().imap(_run_in_worker(func), iterable)
+
+
+def tree_reduce(func, iterable):
+    """Combine the items of a non-empty iterable with a binary function, using
+    a balanced tree of calls instead of a sequential fold.
+
+    Items are consumed one at a time, so only a logarithmic number of partial
+    results are held in memory at once.
+    """
+    # stack of (level, value) pairs, where each value combines 2 ** level items
+    stack = []
+    for value in iterable:
+        level = 0
+        while stack and stack[-1][0] == level:
+            _, previous = stack.pop()
+            value = func(previous, value)
+            level += 1
+        stack.append((level, value))
+    if not stack:
+        raise ValueError('cannot reduce an empty iterable')
+    _, value = stack.pop()
+    while stack:
+        _, previous = stack.pop()
+        value = func(previous, value)
+    return value
+
+
+def auto_chunks(shape):
+    """Block sizes for dividing an array of the given shape along its first
+    axis into one block per thread, or None if the array is too small to be
+    worth dividing.
+    """
+    size = int(np.prod(shape))
+    if not _is_parallel() or not shape or size < 2 * MIN_BLOCK_SIZE:
+        return None
+    num_blocks = min(_num_threads, shape[0], size // MIN_BLOCK_SIZE)
+    if num_blocks < 2:
+        return None
+    chunk = -(-shape[0] // num_blocks)
+    return (chunk,) + (None,) * (len(shape) - 1)
+
+
+def _block_arg(arg, key, ndim, length):
+    if (isinstance(arg, np.ndarray) and arg.ndim == ndim
+            and arg.shape[0] == length):
+        return arg[key]
+    # this argument is broadcast along the first axis
+    return arg
+
+
+def apply_elementwise(func, *args):
+    """Apply an element-wise function to numpy arrays (or scalars), dividing
+    them into blocks along the first axis of the broadcast result that are
+    processed in parallel.
+    """
+    if not all(isinstance(arg, np.ndarray) or utils.is_scalar(arg)
+               for arg in args):
+        return func(*args)
+    shape = np.broadcast(*args).shape
+    chunks = auto_chunks(shape)
+    if chunks is None:
+        return func(*args)
+
+    ndim = len(shape)
+    length = shape[0]
+    keys = [slice(start, min(start + chunks[0], length))
+            for start in range(0, length, chunks[0])]
+
+    def apply_block(key):
+        return func(*[_block_arg(arg, key, ndim, length) for arg in args])
+
+    results = list(imap(apply_block, keys))
+    for key, result in zip(keys, results):
+        if (not isinstance(result, np.ndarray)
+                or result.shape != (key.stop - key.start,) + shape[1:]):
+            # func did not act element-wise; fall back to applying it once
+            return func(*args)
+    return np.concatenate(results, axis=0)
@@ -0,0 +1,126 @@
+from . import ops
+from .pycompat import iteritems, OrderedDict
+from .variable import Variable
+
+
+_ROLLING_DOCSTRING_TEMPLATE = \
+        """Compute the moving window {name} of this object's data.
+
+        Missing values (as marked by NaN) are skipped. Windows with fewer
+        than `min_periods` valid values are NaN.
+        {extra_args}
+        Returns
+        -------
+        rolling : same type as the rolled object
+            New object with the moving window {name} of every variable along
+            the rolled dimension. Data variables that are not numeric are
+            dropped from Dataset objects.
+        """
+
+_DDOF_DOCSTRING = """
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom: the divisor used in calculations is
+            ``N - ddof``, where ``N`` is the number of valid values in each
+            window. By default, `ddof` is zero.
+        """
+
+
+class Rolling(object):
+    """A object that implements moving window aggregations.
+
+    Each window contains `window` consecutive values along a dimension, and
+    the result for each window is labeled by the position of its last value
+    (or its central value, if `center` is True). The built-in aggregations
+    (``sum``, ``mean``, ``std``, ``var``, ``max``, ``min`` and ``count``) are
+    computed for every window at once in linear time, with bottleneck's
+    moving window functions if it is installed.
+
+    You should create a Rolling object by using the `DataArray.rolling` or
+    `Dataset.rolling` methods.
+
+    See Also
+    --------
+    Dataset.rolling
+    DataArray.rolling
+    """
+    def __init__(self, obj, min_periods=None, center=False, **windows):
+        """Create a Rolling object
+
+        Parameters
+        ----------
+        obj : Dataset or DataArray
+            Object to compute moving window aggregations of.
+        min_periods : int, optional
+            Minimum number of valid values in a window for its aggregation to
+            be computed; otherwise, the result is NaN. By default, this is the
+            size of the window.
+        center : bool, optional
+            If True, label each window by its central position instead of by
+            its last position.
+        **windows : {dim: window}
+            Name of the dimension to roll along and the size of the window.
+        """
+        if len(windows) != 1:
+            raise ValueError('exactly one dimension must be given to roll '
+                             'along, as a keyword argument')
+        (dim, window), = windows.items()
+        if dim not in obj.dims:
+            raise ValueError('%r is not a dimension' % dim)
+        window = int(window)
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        if min_periods is not None and not 1 <= min_periods <= window:
+            raise ValueError('min_periods must be between 1 and the window '
+                             'size %s' % window)
+        self.obj = obj
+        self.dim = dim
+        self.window = window
+        self.min_periods = min_periods
+        self.center = center
+
+    def __repr__(self):
+        return ('%s [%s->%s, min_periods=%s, center=%s]'
+                % (type(self).__name__, self.dim, self.window,
+                   self.min_periods, self.center))
+
+    def _reduce(self, name, **kwargs):
+        from .dataarray import DataArray
+
+        is_array = isinstance(self.obj, DataArray)
+        ds = self.obj._dataset if is_array else self.obj
+        variables = OrderedDict()
+        for k, v in iteritems(ds._variables):
+            if k not in ds._coord_names and self.dim in v.dims:
+                if not is_array and v.dtype.kind not in 'biuf':
+                    continue
+                data = ops._move_reduce(name, v.values, self.window,
+                                        v.get_axis_num(self.dim),
+                                        self.min_periods, self.center,
+                                        **kwargs)
+                v = Variable(v.dims, data, fastpath=True)
+            variables[k] = v
+        result = ds._replace_vars_and_dims(variables, attrs=OrderedDict())
+        if is_array:
+            result = self.obj._with_replaced_dataset(result)
+        return result
+
+
+def _create_rolling_method(name):
+    if name in ['std', 'var']:
+        def func(self, ddof=0):
+            return self._reduce(name, ddof=ddof)
+        extra_args = _DDOF_DOCSTRING
+    else:
+        def func(self):
+            return self._reduce(name)
+        extra_args = ''
+    func.__name__ = name
+    func.__doc__ = _ROLLING_DOCSTRING_TEMPLATE.format(name=name,
+                                                      extra_args=extra_args)
+    return func
+
+
+for _name in ops._MOVE_REDUCTIONS:
+    setattr(Rolling, _name, _create_rolling_method(_name))
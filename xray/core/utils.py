@@ -3,6 +3,7 @@
 import datetime
 import functools
 import itertools
+import threading
 import warnings
 from collections import Mapping, MutableMapping
 
@@ -318,6 +319,90 @@ class SortedKeysDict(MutableMapping, SingleSlotPickleMixin):
         return type(self)(self.mapping.copy())
 
 
+class LRUCache(MutableMapping):
+    """A thread-safe dictionary-like cache holding items with a total size of
+    at most `maxsize`, which discards the least recently used items when full.
+
+    By default, each item has a size of one, so `maxsize` is the maximum
+    number of items. Items larger than `maxsize` are not cached at all.
+    """
+    def __init__(self, maxsize, sizeof=None):
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum total size of the items in the cache.
+        sizeof : callable, optional
+            Function called with each value to return its size, e.g., its
+            number of bytes.
+        """
+        if maxsize < 0:
+            raise ValueError('maxsize must be non-negative')
+        self._cache = OrderedDict()
+        self._sizes = {}
+        self._size = 0
+        self._sizeof = sizeof
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        if value < 0:
+            raise ValueError('maxsize must be non-negative')
+        with self._lock:
+            self._maxsize = value
+            self._shrink()
+
+    @property
+    def size(self):
+        """Total size of the items in the cache."""
+        return self._size
+
+    def _shrink(self):
+        while self._size > self._maxsize:
+            key, _ = self._cache.popitem(last=False)
+            self._size -= self._sizes.pop(key)
+
+    def __getitem__(self, key):
+        with self._lock:
+            # move the item to the most recently used position
+            value = self._cache.pop(key)
+            self._cache[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        size = 1 if self._sizeof is None else self._sizeof(value)
+        with self._lock:
+            if key in self._cache:
+                del self[key]
+            if size <= self._maxsize:
+                self._cache[key] = value
+                self._sizes[key] = size
+                self._size += size
+                self._shrink()
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._cache[key]
+            self._size -= self._sizes.pop(key)
+
+    def __iter__(self):
+        return iter(list(self._cache))
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __repr__(self):
+        return '%s(maxsize=%r)' % (type(self).__name__, self._maxsize)
+
+
 class ChainMap(MutableMapping, SingleSlotPickleMixin):
     """Partial backport of collections.ChainMap from Python>=3.3
 
@@ -7,6 +7,7 @@ import pandas as pd
 from . import common
 from . import indexing
 from . import ops
+from . import parallel
 from . import utils
 from .pycompat import basestring, OrderedDict, zip
 
@@ -146,7 +147,10 @@ class NumpyArrayAdapter(utils.NDArrayMixin):
         return key
 
     def __getitem__(self, key):
-        key = self._convert_key(key)
+        key = indexing.expanded_indexer(key, self.ndim)
+        if any(not isinstance(k, (int, np.integer, slice)) for k in key):
+            # index one axis at a time, instead of using fancy indexing
+            return indexing.orthogonally_index(self.array, key)
         return self.array[key]
 
     def __setitem__(self, key, value):
@@ -312,6 +316,31 @@ class Variable(common.AbstractArray):
         self._data_cached()
         return self
 
+    def chunk(self, chunks):
+        """Return a new variable whose data is divided into blocks.
+
+        Reductions such as ``mean`` or ``sum`` over a chunked variable load
+        and combine one block at a time, so they can be applied to variables
+        that are larger than memory. Indexing a chunked variable is lazy.
+
+        Parameters
+        ----------
+        chunks : int, tuple or dict
+            Block size along each dimension, given as an integer for all
+            dimensions, a tuple with one entry per dimension or a dictionary
+            mapping dimension names to block sizes. Dimensions not included
+            in a dictionary are not divided.
+
+        Returns
+        -------
+        chunked : Variable
+        """
+        if utils.is_dict_like(chunks):
+            chunks = tuple(chunks.get(dim) for dim in self.dims)
+        data = indexing.BlockedArray(self._data, chunks)
+        return type(self)(self.dims, data, self._attrs, self._encoding,
+                          fastpath=True)
+
     def __getstate__(self):
         """Always cache data as an in-memory array before pickling"""
         self._data_cached()
@@ -480,6 +509,48 @@ class Variable(common.AbstractArray):
                 key[i] = indexers[dim]
         return self[tuple(key)]
 
+    def isel_points(self, dim='points', **indexers):
+        """Return a new variable with values selected at points given by
+        integer positions along the specified dimension(s).
+
+        Unlike `isel`, the indexers are not applied orthogonally: the i-th
+        point is given by the i-th position of every indexer.
+
+        Parameters
+        ----------
+        dim : str, optional
+            Name of the new dimension along the points, which replaces the
+            indexed dimensions. It is the first dimension of the result.
+        **indexers : {dim: indexer, ...}
+            Keyword arguments with names matching dimensions and values given
+            by 1d arrays of integers, all of the same length.
+
+        Returns
+        -------
+        obj : Variable
+            A new Variable with the selected points. If this variable's data
+            has not been loaded into memory, selecting points is deferred
+            until its values are needed, and only the part of the data
+            spanned by the points is loaded.
+        """
+        invalid = [k for k in indexers if not k in self.dims]
+        if invalid:
+            raise ValueError("dimensions %r do not exist" % invalid)
+        if dim in self.dims and dim not in indexers:
+            raise ValueError('dimension %r already exists' % dim)
+
+        key = tuple(indexers.get(d, slice(None)) for d in self.dims)
+        key = indexing.canonicalize_points_key(key, self.shape)
+        data = self._data
+        if isinstance(data, indexing.BlockedArray):
+            data = data.array
+        if self._in_memory or isinstance(data, indexing.LazyIntegerRange):
+            data = indexing.gather_points(np.asarray(data), key)
+        else:
+            data = indexing.PointwiseIndexedArray(data, key)
+        dims = (dim,) + tuple(d for d in self.dims if d not in indexers)
+        return Variable(dims, data, self._attrs, fastpath=True)
+
     def transpose(self, *dims):
         """Return a new Variable object with transposed dimensions.
 
@@ -608,7 +679,19 @@ class Variable(common.AbstractArray):
 
         if dim is not None:
             axis = self.get_axis_num(dim)
-        data = func(self.values, axis=axis, **kwargs)
+        blockwise = getattr(func, 'blockwise', None)
+        blocked = self._data
+        if (blockwise is not None and self._in_memory
+                and parallel.auto_chunks(self.shape) is not None):
+            # divide large arrays into blocks to reduce them in parallel
+            blocked = indexing.BlockedArray(
+                self._data, parallel.auto_chunks(self.shape))
+        if (blockwise is not None
+                and isinstance(blocked, indexing.BlockedArray)):
+            # stream over blocks instead of loading all the data at once
+            data = blockwise(blocked, axis=axis, **kwargs)
+        else:
+            data = func(self.values, axis=axis, **kwargs)
 
         removed_axes = (range(self.ndim) if axis is None
                         else np.atleast_1d(axis) % self.ndim)
@@ -619,6 +702,58 @@ class Variable(common.AbstractArray):
 
         return Variable(dims, data, attrs=attrs)
 
+    def accumulate(self, func, dim=None, axis=None, keep_attrs=False,
+                   **kwargs):
+        """Accumulate this array by applying `func` along some dimension(s).
+
+        Parameters
+        ----------
+        func : function
+            Function which can be called in the form
+            `func(x, axis=axis, **kwargs)` to return the result of
+            accumulating an np.ndarray along an integer valued axis, with the
+            same shape as `x`.
+        dim : str or sequence of str, optional
+            Dimension(s) along which to apply `func`.
+        axis : int or sequence of int, optional
+            Axis(es) along which to apply `func`. Only one of the 'dim'
+            and 'axis' arguments can be supplied. If neither are supplied, then
+            `func` is applied along each axis in turn.
+        keep_attrs : bool, optional
+            If True, the variable's attributes (`attrs`) will be copied from
+            the original object to the new one.  If False (default), the new
+            object will be returned without attributes.
+        **kwargs : dict
+            Additional keyword arguments passed on to `func`.
+
+        Returns
+        -------
+        accumulated : Variable
+            Variable with the same dimensions and shape as this one.
+        """
+        if dim is not None and axis is not None:
+            raise ValueError("cannot supply both 'axis' and 'dim' arguments")
+
+        if dim is not None:
+            axis = self.get_axis_num(dim)
+        axes = (range(self.ndim) if axis is None
+                else np.atleast_1d(axis) % max(self.ndim, 1))
+
+        blockwise = getattr(func, 'blockwise', None)
+        if (blockwise is not None and len(axes)
+                and isinstance(self._data, indexing.BlockedArray)):
+            # stream over blocks instead of loading all the data at once
+            data = blockwise(self._data, axis=axes[0], **kwargs)
+            axes = axes[1:]
+        else:
+            data = self.values
+        for n in axes:
+            data = func(data, axis=n, **kwargs)
+
+        attrs = self._attrs if keep_attrs else None
+
+        return Variable(self.dims, data, attrs=attrs)
+
     @classmethod
     def concat(cls, variables, dim='concat_dim', indexers=None, length=None,
                shortcut=False):
@@ -775,7 +910,11 @@ class Variable(common.AbstractArray):
     def _unary_op(f):
         @functools.wraps(f)
         def func(self, *args, **kwargs):
-            return self.__array_wrap__(f(self.values, *args, **kwargs))
+            if f in ops.ELEMENTWISE_UNARY_OPS and not args and not kwargs:
+                values = parallel.apply_elementwise(f, self.values)
+            else:
+                values = f(self.values, *args, **kwargs)
+            return self.__array_wrap__(values)
         return func
 
     @staticmethod
@@ -785,9 +924,10 @@ class Variable(common.AbstractArray):
             if isinstance(other, (xray.DataArray, xray.Dataset)):
                 return NotImplemented
             self_data, other_data, dims = _broadcast_variable_data(self, other)
-            new_data = (f(self_data, other_data)
+            new_data = (parallel.apply_elementwise(f, self_data, other_data)
                         if not reflexive
-                        else f(other_data, self_data))
+                        else parallel.apply_elementwise(f, other_data,
+                                                        self_data))
             return Variable(dims, new_data)
         return func
 
@@ -826,6 +966,29 @@ class Coordinate(Variable):
         if self.ndim != 1:
             raise ValueError('%s objects must be 1-dimensional' %
                              type(self).__name__)
+        if isinstance(self._data, PandasIndexAdapter):
+            self._data = self._named_index_adapter(self._data)
+
+    @Variable.dims.setter
+    def dims(self, value):
+        Variable.dims.fset(self, value)
+        if isinstance(self._data, PandasIndexAdapter):
+            self._data = self._named_index_adapter(self._data)
+
+    def _named_index_adapter(self, adapter):
+        # store the pandas.Index under this coordinate's name, so to_index can
+        # return it as is; the index of the original adapter (which may be
+        # shared with other coordinates) is never modified
+        if adapter.array.name != self.name:
+            adapter = PandasIndexAdapter(adapter.array.rename(self.name),
+                                         dtype=adapter.dtype)
+        return adapter
+
+    def _data_cached(self):
+        if not isinstance(self._data, PandasIndexAdapter):
+            self._data = self._named_index_adapter(
+                PandasIndexAdapter(self._data))
+        return self._data
 
     def __getitem__(self, key):
         key = self._item_key_to_tuple(key)
@@ -859,11 +1022,18 @@ class Coordinate(Variable):
         return self
 
     def to_index(self):
-        """Convert this variable to a pandas.Index"""
-        # n.b. creating a new pandas.Index from an old pandas.Index is
-        # basically free as pandas.Index objects are immutable
+        """Convert this variable to a pandas.Index.
+
+        The returned index is the one stored on this coordinate (and possibly
+        shared with other coordinates), so it must not be modified, e.g., by
+        setting its name.
+        """
+        # n.b. the pandas.Index is returned as is, because pandas caches the
+        # hash table and other lookup structures it builds for label based
+        # indexing on the Index object; a new Index would need to rebuild
+        # them for every lookup
         assert self.ndim == 1
-        return pd.Index(self._data_cached().array, name=self.dims[0])
+        return self._data_cached().array
 
     # pandas.Index like properties:
 
@@ -9,8 +9,13 @@ import sys
 import numpy as np
 import pandas as pd
 
-from xray import Dataset, open_dataset, backends, decode_cf
+from xray import Dataset, open_dataset, open_mfdataset, backends, decode_cf
+from xray.backends.common import (_slab_shape, iter_slabs, BlockCachedArray,
+                                  is_remote_uri)
+from xray.backends.file_manager import FilePool, FileManager
+from xray.core import indexing
 from xray.core.pycompat import iteritems, PY3
+from xray.core.utils import NDArrayMixin, LRUCache
 
 from . import TestCase, requires_scipy, requires_netCDF4, requires_pydap
 from .test_dataset import create_test_data
@@ -70,6 +75,19 @@ class DatasetIOTestCases(object):
             actual = decode_cf(store)
             self.assertDatasetAllClose(expected, actual)
 
+    def test_store_metadata_cache(self):
+        expected = create_test_data()
+        with self.create_store() as store:
+            expected.dump_to_store(store)
+            # repeated lookups should not reload the store
+            variables = store.variables
+            self.assertIs(variables, store.variables)
+            self.assertIn('var1', store)
+            # but writing to the store should invalidate the cache
+            store.set_attribute('foo', 'bar')
+            self.assertIsNot(variables, store.variables)
+            self.assertEqual(store.attrs['foo'], 'bar')
+
     def test_roundtrip_test_data(self):
         expected = create_test_data()
         with self.roundtrip(expected) as actual:
@@ -288,6 +306,18 @@ class NetCDF4DataTest(CFEncodedDataTest, TestCase):
             with open_dataset(tmp_file, **kwargs) as ds:
                 yield ds
 
+    def test_open_chunks(self):
+        expected = create_test_data()
+        with create_tmp_file() as tmp_file:
+            expected.dump(tmp_file)
+            with open_dataset(tmp_file, chunks={'dim1': 3}) as actual:
+                self.assertIsInstance(actual['var1'].variable._data,
+                                      indexing.BlockedArray)
+                self.assertIsNotNone(actual._file_obj)
+                self.assertDatasetAllClose(expected.mean('dim1'),
+                                           actual.mean('dim1'))
+                self.assertDatasetAllClose(expected, actual)
+
     def test_open_encodings(self):
         # Create a netCDF file with explicit time units
         # and make sure it makes it into the encodings
@@ -552,6 +582,12 @@ class ScipyDataTest(CFEncodedDataTest, CastsUnicodeToBytes, TestCase):
         with open_dataset(BytesIO(serialized), **kwargs) as ds:
             yield ds
 
+    def test_out_of_range_values(self):
+        data = Dataset({'x': ('t', np.array([0, 2 ** 40]))})
+        with self.create_store() as store:
+            with self.assertRaisesRegexp(ValueError, 'safely cast'):
+                data.dump_to_store(store)
+
 
 @requires_netCDF4
 class NetCDF3ViaNetCDF4DataTest(CFEncodedDataTest, CastsUnicodeToBytes, TestCase):
@@ -569,6 +605,268 @@ class NetCDF3ViaNetCDF4DataTest(CFEncodedDataTest, CastsUnicodeToBytes, TestCase
                 yield ds
 
 
+class TestWriteSlabs(TestCase):
+    def test_slab_shape(self):
+        self.assertEqual(_slab_shape((10, 20), 8, buffer_size=1600),
+                         (10, 20))
+        self.assertEqual(_slab_shape((10, 20), 8, buffer_size=800), (5, 20))
+        self.assertEqual(_slab_shape((10, 20), 8, buffer_size=100), (1, 12))
+        self.assertEqual(_slab_shape((10, 20), 8, buffer_size=1), (1, 1))
+        self.assertEqual(_slab_shape((10, 20), 8, (4, 5), buffer_size=800),
+                         (4, 20))
+        self.assertEqual(_slab_shape((10, 20), 8, (4, 5), buffer_size=100),
+                         (4, 5))
+
+    def test_iter_slabs(self):
+        x = np.zeros((7, 5))
+        for key in iter_slabs(x.shape, 8, (3, 2), buffer_size=40):
+            x[key] += 1
+        self.assertTrue((x == 1).all())
+        self.assertEqual(list(iter_slabs((0, 5), 8)), [])
+        self.assertEqual(list(iter_slabs((3,), 8)), [(slice(0, 3),)])
+
+    @requires_netCDF4
+    def test_to_netcdf_in_slabs(self):
+        test = self
+
+        class SlabSizeCheckingArray(NDArrayMixin):
+            def __init__(self, array):
+                self.array = array
+
+            def __getitem__(self, key):
+                values = self.array[key]
+                test.assertLessEqual(values.size, 25)
+                return values
+
+        values = np.random.randn(10, 20)
+        data = indexing.LazilyIndexedArray(SlabSizeCheckingArray(values))
+        original = Dataset({'x': (('a', 'b'), data)})
+        expected = Dataset({'x': (('a', 'b'), values)})
+        with create_tmp_file() as tmp_file:
+            original.to_netcdf(tmp_file, buffer_size=200)
+            with open_dataset(tmp_file) as actual:
+                self.assertDatasetIdentical(expected, actual)
+
+
+class TestBlockCache(TestCase):
+    def setUp(self):
+        test = self
+        self.keys = []
+
+        class SliceOnlyArray(NDArrayMixin):
+            def __init__(self, array):
+                self.array = array
+
+            def __getitem__(self, key):
+                for k in key:
+                    test.assertIsInstance(k, slice)
+                test.keys.append(key)
+                return self.array[key]
+
+        self.values = np.arange(60.0).reshape(6, 10)
+        self.cache = LRUCache(maxsize=100)
+        self.array = BlockCachedArray(SliceOnlyArray(self.values), 'foo',
+                                      cache=self.cache, block_size=80)
+
+    def test_is_remote_uri(self):
+        self.assertTrue(is_remote_uri('http://example.com'))
+        self.assertTrue(is_remote_uri('https://example.com'))
+        self.assertFalse(is_remote_uri(' http://example.com'))
+        self.assertFalse(is_remote_uri('example.nc'))
+
+    def test_indexing(self):
+        self.assertEqual(self.array.block_shape, (1, 10))
+        lazy = indexing.LazilyIndexedArray(self.array)
+        for key in [0, -1, (1, 2), (slice(None), 3), slice(1, 4),
+                    (slice(None, None, -2), slice(8, 1, -3)),
+                    ([0, 5, 2], slice(2, 4)), (slice(None), [-1, 0, 0]),
+                    (slice(2, 2), 0), (np.array([], int), [1, 2]), Ellipsis]:
+            expected = self.values[indexing.orthogonal_indexer(
+                key, self.values.shape)]
+            self.assertArrayEqual(expected, self.array[key])
+            self.assertArrayEqual(expected, lazy[key])
+
+    def test_caching(self):
+        self.assertArrayEqual(self.values[1:3], self.array[1:3])
+        self.assertEqual(len(self.keys), 2)
+        self.assertEqual(len(self.cache), 2)
+        # overlapping and repeated requests only fetch missing blocks
+        self.assertArrayEqual(self.values[2:4, :2], self.array[2:4, :2])
+        self.assertEqual(len(self.keys), 3)
+        self.assertArrayEqual(self.values[1, 5], self.array[1, 5])
+        self.assertEqual(len(self.keys), 3)
+
+        # blocks are evicted from a full cache
+        self.cache.maxsize = 1
+        self.assertEqual(len(self.cache), 1)
+        self.assertArrayEqual(self.values[:, 0], self.array[:, 0])
+        self.assertEqual(len(self.keys), 9)
+
+        other = BlockCachedArray(self.array.array, 'bar', cache=self.cache,
+                                 block_size=80)
+        other[-1]
+        self.assertEqual(len(self.keys), 10)
+
+    def test_sparse_and_strided_reads(self):
+        # only the blocks containing requested values are read
+        self.assertArrayEqual(self.values[[0, 5], 1], self.array[[0, 5], 1])
+        self.assertEqual(self.keys, [(slice(0, 1), slice(0, 10)),
+                                     (slice(5, 6), slice(0, 10))])
+        self.assertArrayEqual(self.values[[5, 0]], self.array[[5, 0]])
+        self.assertEqual(len(self.keys), 2)
+
+        # strided slices touching most blocks are read directly
+        del self.keys[:]
+        self.cache.clear()
+        values = np.arange(120.0).reshape(12, 10)
+        array = BlockCachedArray(type(self.array.array)(values), 'bar',
+                                 cache=self.cache, block_size=160)
+        self.assertEqual(array.block_shape, (2, 10))
+        self.assertArrayEqual(values[::3, 3], array[::3, 3])
+        self.assertArrayEqual(values[::-3, -1], array[::-3, -1])
+        self.assertEqual(self.keys, [(slice(None, None, 3), slice(3, 4)),
+                                     (slice(None, None, -3), slice(9, 10))])
+        self.assertEqual(len(self.cache), 0)
+        # but not if they only touch a few blocks
+        self.assertArrayEqual(values[:5:2], array[:5:2])
+        self.assertEqual(len(self.cache), 3)
+
+    def test_cache_size_in_bytes(self):
+        cache = LRUCache(maxsize=250, sizeof=lambda block: block.nbytes)
+        array = BlockCachedArray(self.array.array, 'foo', cache=cache,
+                                 block_size=80)
+        self.assertArrayEqual(self.values[:3], array[:3])
+        # only three blocks of 80 bytes fit in the cache
+        self.assertEqual(len(cache), 3)
+        self.assertArrayEqual(self.values[3], array[3])
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.size, 240)
+
+    def test_mutating_reads(self):
+        expected = self.values.copy()
+        for key in [(1, slice(None, 5)), (slice(1, 3), 0), 3]:
+            read = self.array[key]
+            read[...] = -1
+            other = BlockCachedArray(self.array.array, 'foo',
+                                     cache=self.cache, block_size=80)
+            self.assertArrayEqual(expected[key], other[key])
+            self.assertArrayEqual(expected[key], self.array[key])
+        self.assertArrayEqual(expected, self.array[:])
+
+
+class TestFilePool(TestCase):
+    def test_lru_eviction(self):
+        opened = []
+        closed = []
+
+        def make_manager(name):
+            def opener():
+                opened.append(name)
+                return name
+            return FileManager(opener, closed.append, pooled=True, pool=pool)
+
+        pool = FilePool(maxsize=2)
+        a, b, c = [make_manager(name) for name in 'abc']
+        self.assertEqual(opened, [])
+        self.assertEqual(a.acquire(), 'a')
+        self.assertEqual(b.acquire(), 'b')
+        self.assertEqual(a.acquire(), 'a')
+        self.assertEqual(opened, ['a', 'b'])
+        # b is the least recently used
+        self.assertEqual(c.acquire(), 'c')
+        self.assertEqual(closed, ['b'])
+        self.assertEqual(len(pool), 2)
+        # b is transparently reopened
+        self.assertEqual(b.acquire(), 'b')
+        self.assertEqual(opened, ['a', 'b', 'c', 'b'])
+        self.assertEqual(closed, ['b', 'a'])
+
+        c.close()
+        self.assertEqual(closed, ['b', 'a', 'c'])
+        self.assertNotIn(c, pool)
+
+        pool.maxsize = 1
+        self.assertEqual(len(pool), 1)
+        with self.assertRaisesRegexp(ValueError, 'at least 1'):
+            pool.maxsize = 0
+
+    def test_lease(self):
+        closed = []
+        pool = FilePool(maxsize=1)
+        a, b = [FileManager(lambda name=name: name, closed.append,
+                            pooled=True, pool=pool) for name in 'ab']
+        with a.lease() as handle:
+            self.assertEqual(handle, 'a')
+            # leased handles are not evicted
+            self.assertEqual(b.acquire(), 'b')
+            self.assertEqual(closed, ['b'])
+            self.assertIn(a, pool)
+            # or closed until the lease is released
+            a.close()
+            self.assertEqual(closed, ['b'])
+        self.assertEqual(closed, ['b', 'a'])
+        self.assertEqual(len(pool), 0)
+
+        with a.lease():
+            with b.lease():
+                self.assertEqual(len(pool), 2)
+            self.assertEqual(len(pool), 1)
+        self.assertEqual(closed, ['b', 'a', 'b'])
+
+    def test_unpooled(self):
+        manager = FileManager(BytesIO)
+        handle = manager.acquire()
+        self.assertIs(handle, manager.acquire())
+        manager.close()
+        self.assertTrue(handle.closed)
+        with self.assertRaisesRegexp(ValueError, 'closed file'):
+            manager.acquire()
+
+    @requires_netCDF4
+    def test_many_open_files(self):
+        original = create_test_data()
+        max_open_files = backends.file_manager.FILE_POOL.maxsize
+        backends.set_max_open_files(2)
+        try:
+            with create_tmp_file() as tmp1:
+                with create_tmp_file() as tmp2:
+                    with create_tmp_file() as tmp3:
+                        original.dump(tmp1)
+                        original.dump(tmp2)
+                        original.dump(tmp3)
+                        datasets = [open_dataset(f)
+                                    for f in [tmp1, tmp2, tmp3]]
+                        pool = backends.file_manager.FILE_POOL
+                        for ds in datasets + datasets:
+                            self.assertDatasetAllClose(original, ds)
+                            self.assertLessEqual(len(pool), 2)
+                        for ds in datasets:
+                            ds.close()
+        finally:
+            backends.set_max_open_files(max_open_files)
+
+
+@requires_netCDF4
+class OpenMFDatasetTest(TestCase):
+    def test_open_mfdataset(self):
+        original = create_test_data()
+        with create_tmp_file() as tmp1:
+            with create_tmp_file() as tmp2:
+                original.isel(dim1=slice(5)).to_netcdf(tmp1)
+                original.isel(dim1=slice(5, None)).to_netcdf(tmp2)
+                with open_mfdataset([tmp1, tmp2], 'dim1') as actual:
+                    self.assertFalse(actual['var1']._in_memory)
+                    for indexers in [{}, {'dim1': 2}, {'dim1': slice(3, 7)},
+                                     {'dim1': [7, 0, 5, 6], 'dim2': [1, 2]},
+                                     {'dim1': slice(None, None, -3)}]:
+                        expected = original.isel(**indexers)
+                        self.assertDatasetAllClose(
+                            expected, actual.isel(**indexers))
+
+                with self.assertRaisesRegexp(ValueError, 'not found'):
+                    open_mfdataset([tmp1, tmp2], 'foo')
+
+
 @requires_netCDF4
 @requires_pydap
 class PydapTest(TestCase):
@@ -95,6 +95,86 @@ class TestCharToStringArray(TestCase):
 
 
 class TestDatetime(TestCase):
+    def test_encode_cf_datetime_vectorized(self):
+        dates = pd.to_datetime(['2000-01-01T06:00', '2000-01-03', 'NaT',
+                                '1999-12-31T12:00']).values
+        num, units, calendar = conventions.encode_cf_datetime(
+            dates, 'days since 2000-01-01')
+        self.assertArrayEqual(num, [0.25, 2, np.nan, -0.5])
+        self.assertEqual(units, 'days since 2000-01-01')
+        self.assertEqual(calendar, 'proleptic_gregorian')
+
+        num, _, _ = conventions.encode_cf_datetime(
+            dates.reshape(2, 2), 'hours since 2000-01-01', 'standard')
+        self.assertArrayEqual(num, [[6, 48], [np.nan, -12]])
+
+    def test_decoded_cf_datetime_array_cache(self):
+        num_dates = np.arange(5.0) + 1234.5
+        units = 'days since 1900-01-01'
+        array = conventions.DecodedCFDatetimeArray(num_dates, units)
+        expected = conventions.decode_cf_datetime(num_dates, units)
+        conventions.DECODED_TIMES_CACHE.clear()
+        actual = array[:]
+        self.assertArrayEqual(expected, actual)
+        self.assertEqual(len(conventions.DECODED_TIMES_CACHE), 1)
+        # modifying the result does not modify the cached values
+        actual[0] = np.datetime64('2000-01-01')
+        self.assertArrayEqual(expected, array[:])
+        self.assertEqual(len(conventions.DECODED_TIMES_CACHE), 1)
+        # different values, units or calendars are cached separately
+        self.assertArrayEqual(expected[1:], array[1:])
+        other = conventions.DecodedCFDatetimeArray(num_dates,
+                                                   'hours since 1900-01-01')
+        self.assertArrayEqual(
+            conventions.decode_cf_datetime(num_dates, other.units), other[:])
+        self.assertEqual(len(conventions.DECODED_TIMES_CACHE), 3)
+
+        # the cache is bounded by the size of the decoded values
+        cache = conventions.DECODED_TIMES_CACHE
+        maxsize = cache.maxsize
+        try:
+            cache.maxsize = 100
+            # the least recently used entry (of 40 bytes) was dropped
+            self.assertEqual(cache.size, 72)
+            self.assertEqual(len(cache), 2)
+            array = conventions.DecodedCFDatetimeArray(np.arange(20.0), units)
+            self.assertArrayEqual(
+                conventions.decode_cf_datetime(np.arange(20.0), units),
+                array[:])
+            self.assertEqual(len(cache), 2)
+            array[0]
+            self.assertEqual(cache.size, 80)
+        finally:
+            cache.maxsize = maxsize
+
+    @requires_netCDF4
+    def test_encode_cf_datetime_matches_netcdf4(self):
+        dates = (np.datetime64('1990-01-01')
+                 + np.random.randint(0, 10 ** 9, 100) * np.timedelta64(1, 's'))
+        for units in ['days since 1990-01-01', 'hours since 2000-01-01 12:00',
+                      'seconds since 1970-01-01']:
+            for calendar in ['standard', 'gregorian', 'proleptic_gregorian']:
+                expected = conventions._encode_datetime_with_netcdf4(
+                    dates, units, calendar)
+                actual, _, _ = conventions.encode_cf_datetime(dates, units,
+                                                              calendar)
+                self.assertTrue(np.allclose(expected, actual, rtol=0,
+                                            atol=1e-6))
+
+    def test_encode_cf_datetime_coarse_units(self):
+        dates = np.array(['2000-01-03', 'NaT', '1999-12-31'], 'M8[D]')
+        num, _, _ = conventions.encode_cf_datetime(dates,
+                                                   'days since 2000-01-01')
+        self.assertArrayEqual(num, [2, np.nan, -1])
+
+    @requires_netCDF4
+    def test_encode_cf_datetime_out_of_bounds(self):
+        # dates outside the range of datetime64[ns] use netCDF4
+        dates = np.array(['1500-01-01', '2000-01-01'], 'M8[D]')
+        num, _, _ = conventions.encode_cf_datetime(
+            dates, 'days since 2000-01-01', 'proleptic_gregorian')
+        self.assertArrayEqual(num, [-182621, 0])
+
     @requires_netCDF4
     def test_cf_datetime(self):
         import netCDF4 as nc4
@@ -317,7 +397,8 @@ class TestDatetime(TestCase):
                                 (['1900-01-01', '1900-01-02',
                                   '1900-01-02 00:00:01'],
                                  'seconds since 1900-01-01 00:00:00'),
-                                (pd.to_datetime(['1900-01-01', '1900-01-02', 'NaT']),
+                                (pd.to_datetime(['1900-01-01', '1900-01-02',
+                                                 'NaT']),
                                  'days since 1900-01-01 00:00:00')]:
             self.assertEqual(expected, conventions.infer_datetime_units(dates))
 
@@ -327,7 +408,8 @@ class TestDatetime(TestCase):
                 (pd.to_timedelta(['1h', '1 day 1 hour']), 'hours'),
                 (pd.to_timedelta(['1m', '2m', np.nan]), 'minutes'),
                 (pd.to_timedelta(['1m3s', '1m4s']), 'seconds')]:
-            self.assertEqual(expected, conventions.infer_timedelta_units(deltas))
+            self.assertEqual(expected,
+                             conventions.infer_timedelta_units(deltas))
 
 
 @requires_netCDF4
@@ -344,6 +426,41 @@ class TestEncodeCFVariable(TestCase):
             with self.assertRaises(ValueError):
                 conventions.encode_cf_variable(var)
 
+    def test_lazy_encoding(self):
+        values = np.array([np.nan, 0.0, 1.5, 3.0])
+
+        class CountingArray(utils.NDArrayMixin):
+            def __init__(self, array):
+                self.array = array
+                self.accessed = 0
+
+            def __getitem__(self, key):
+                self.accessed += 1
+                return self.array[key]
+
+        counting = CountingArray(values)
+        var = Variable(['t'], indexing.LazilyIndexedArray(counting),
+                       encoding={'scale_factor': 0.5, 'add_offset': 1,
+                                 '_FillValue': -1, 'dtype': 'i2'})
+        encoded = conventions.encode_cf_variable(var)
+        self.assertEqual(counting.accessed, 0)
+        self.assertEqual(encoded.dtype, np.dtype('i2'))
+        self.assertEqual(encoded.attrs, {'scale_factor': 0.5, 'add_offset': 1,
+                                         '_FillValue': -1})
+        self.assertArrayEqual(encoded[1:].values, [-2, 1, 4])
+        self.assertEqual(counting.accessed, 1)
+        self.assertArrayEqual(encoded.values, [-1, -2, 1, 4])
+        # the original values are not modified
+        self.assertArrayEqual(values, [np.nan, 0.0, 1.5, 3.0])
+
+    def test_lazily_encoded_array(self):
+        x = np.arange(10.0)
+        encoded = conventions.LazilyEncodedArray(x, lambda v: v * 2, 'i4')
+        self.assertEqual(encoded.dtype, np.dtype('i4'))
+        self.assertEqual(encoded.shape, x.shape)
+        self.assertArrayEqual(encoded[:3], [0, 2, 4])
+        self.assertEqual(encoded[:3].dtype, np.dtype('i4'))
+
 
 @requires_netCDF4
 class TestDecodeCF(TestCase):
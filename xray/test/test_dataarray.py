@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 from copy import deepcopy
@@ -340,6 +342,37 @@ class TestDataArray(TestCase):
         self.assertDataArrayIdentical(da[1], da.sel(x=b))
         self.assertDataArrayIdentical(da[[1]], da.sel(x=slice(b, b)))
 
+    def test_sel_method(self):
+        data = DataArray(np.arange(5), [('time',
+                                         pd.date_range('2000-01-01',
+                                                       periods=5))])
+        self.assertDataArrayIdentical(
+            data[2], data.sel(time='2000-01-02T13', method='nearest'))
+        self.assertDataArrayIdentical(
+            data[[1, 4]], data.sel(time=['2000-01-02T13', '2000-01-10'],
+                                   method='pad'))
+        with self.assertRaises(KeyError):
+            data.sel(time='2000-01-02T13', method='nearest', tolerance='1h')
+
+    def test_isel_points(self):
+        self.ds['x'] = ('x', np.array(list('abcdefghij')))
+        da = self.ds['foo']
+        actual = da.isel_points(x=[0, 2, 2], y=[1, 0, 5])
+        expected = DataArray(self.x[[0, 2, 2], [1, 0, 5]], dims='points',
+                             coords={'x': ('points', list('acc')),
+                                     'y': ('points', [1, 0, 5])},
+                             name='foo', attrs=da.attrs)
+        self.assertDataArrayIdentical(expected, actual)
+        self.assertDataArrayIdentical(expected,
+                                      da.sel_points(x=list('acc'),
+                                                    y=[1, 0, 5]))
+        actual = da.isel_points(x=[3, 1], dim=DataArray(['a', 'b'],
+                                                        dims='station',
+                                                        name='station'))
+        self.assertEqual(actual.dims, ('station', 'y'))
+        self.assertArrayEqual(actual['station'], ['a', 'b'])
+        self.assertArrayEqual(actual, self.x[[3, 1]])
+
     def test_loc(self):
         self.ds['x'] = ('x', np.array(list('abcdefghij')))
         da = self.ds['foo']
@@ -763,6 +796,23 @@ class TestDataArray(TestCase):
         self.assertEqual(len(vm.attrs), len(self.attrs))
         self.assertEqual(vm.attrs, self.attrs)
 
+    def test_cumulative(self):
+        array = DataArray([[1, 2], [3, np.nan]], [('x', ['a', 'b']),
+                                                  ('y', [-1, -2])],
+                          name='foo', attrs={'units': 'm'})
+        array.coords['c'] = 0
+        expected = DataArray([[1, 2], [4, 2]], array.coords, name='foo')
+        actual = array.cumsum('x')
+        self.assertDataArrayIdentical(expected, actual)
+
+        expected = DataArray([[1, 3], [4, 6]], array.coords, name='foo')
+        self.assertDataArrayIdentical(expected, array.cumsum())
+
+        expected = DataArray([[1, 2], [3, np.nan]], array.coords, name='foo',
+                             attrs={'units': 'm'})
+        actual = array.cumprod('y', skipna=False, keep_attrs=True)
+        self.assertDataArrayIdentical(expected, actual)
+
     def test_groupby_iter(self):
         for ((act_x, act_dv), (exp_x, exp_ds)) in \
                 zip(self.dv.groupby('y'), self.ds.groupby('y')):
@@ -893,6 +943,78 @@ class TestDataArray(TestCase):
         with self.assertRaisesRegexp(TypeError, 'only support arithmetic'):
             grouped + grouped
 
+    def test_resample(self):
+        times = pd.date_range('2000-01-01', freq='6H', periods=10)
+        array = DataArray(np.arange(10), [('time', times)])
+
+        actual = array.resample('6H', dim='time')
+        self.assertDataArrayIdentical(array, actual)
+
+        days = pd.date_range('2000-01-01', periods=3)
+        bins = [array.values[i:i + 4] for i in range(0, 10, 4)]
+
+        actual = array.resample('24H', dim='time')
+        expected = DataArray([b.mean() for b in bins], [('time', days)])
+        self.assertDataArrayIdentical(expected, actual)
+
+        actual = array.resample('24H', dim='time', how=np.mean)
+        self.assertDataArrayIdentical(expected, actual)
+
+        for how, func in [('sum', np.sum), ('max', np.max), ('count', len),
+                          ('first', lambda b: b[0]),
+                          ('last', lambda b: b[-1])]:
+            actual = array.resample('24H', dim='time', how=how)
+            expected = DataArray([func(b) for b in bins], [('time', days)])
+            self.assertDataArrayIdentical(expected, actual)
+
+        with self.assertRaisesRegexp(ValueError, 'index must be monotonic'):
+            array[[2, 0, 1]].resample('1D', dim='time')
+
+    def test_resample_skipna_and_empty_bins(self):
+        times = pd.date_range('2000-01-01', freq='6H', periods=10)
+        times = times[[0, 1, 2, 3, 8, 9]]
+        x = np.random.randn(6, 3)
+        x[1, 0] = np.nan
+        array = DataArray(x, [('time', times), ('x', [1, 2, 3])])
+
+        actual = array.resample('1D', dim='time')
+        expected = np.array([np.nanmean(x[:4], axis=0),
+                             [np.nan] * 3,
+                             x[4:].mean(axis=0)])
+        np.testing.assert_allclose(expected, actual.values)
+        self.assertEqual(actual.dims, ('time', 'x'))
+        self.assertArrayEqual(pd.date_range('2000-01-01', periods=3),
+                              actual['time'])
+
+        actual = array.resample('1D', dim='time', skipna=False)
+        self.assertTrue(np.isnan(actual.values[0, 0]))
+        self.assertFalse(np.isnan(actual.values[0, 1]))
+
+        # like pandas, empty bins have a count of zero
+        actual = array.resample('1D', dim='time', how='count')
+        self.assertArrayEqual([[3, 4, 4], [0, 0, 0], [2, 2, 2]], actual)
+        self.assertEqual(actual.dtype.kind, 'i')
+
+        # and first and last skip missing values
+        x[3, 1] = np.nan
+        x[4:, 2] = np.nan
+        array = DataArray(x.T, [('x', [1, 2, 3]), ('time', times)])
+        actual = array.resample('1D', dim='time', how='first')
+        self.assertEqual(actual.dims, ('x', 'time'))
+        expected = [[x[0, 0], np.nan, x[4, 0]],
+                    [x[0, 1], np.nan, x[4, 1]],
+                    [x[0, 2], np.nan, np.nan]]
+        self.assertArrayEqual(expected, actual)
+
+        actual = array.resample('1D', dim='time', how='last')
+        expected = [[x[3, 0], np.nan, x[5, 0]],
+                    [x[2, 1], np.nan, x[5, 1]],
+                    [x[3, 2], np.nan, np.nan]]
+        self.assertArrayEqual(expected, actual)
+
+        actual = array.resample('1D', dim='time', how='last', skipna=False)
+        self.assertTrue(np.isnan(actual.values[1, 0]))
+
     def test_concat(self):
         self.ds['bar'] = Variable(['x', 'y'], np.random.randn(10, 20))
         foo = self.ds['foo']
@@ -1073,3 +1195,8 @@ class TestDataArray(TestCase):
         actual = named.to_dataset('bar')
         expected = Dataset({'bar': ('x', [1, 2])})
         self.assertDatasetIdentical(expected, actual)
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            roundtripped = pickle.loads(pickle.dumps(self.dv, protocol))
+            self.assertDataArrayIdentical(self.dv, roundtripped)
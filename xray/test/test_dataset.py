@@ -518,6 +518,34 @@ class TestDataset(TestCase):
         self.assertItemsEqual(data.indexes,
                               list(ret.indexes) + ['dim1', 'time'])
 
+    def test_isel_many_variables(self):
+        data = Dataset(dict(('v%s' % i, ('x', np.arange(5.0) + i))
+                            for i in range(20)),
+                       coords={'y': ('y', list('ab')), 'z': 0})
+        data['w'] = (('y', 'x'), np.arange(10).reshape(2, 5))
+        actual = data.isel(x=[0, 2])
+        self.assertEqual({'x': 2, 'y': 2}, actual.dims)
+        for k in data.data_vars:
+            self.assertVariableIdentical(data[k].variable[..., [0, 2]],
+                                         actual[k].variable)
+        # variables that are not indexed share data with the original
+        self.assertIs(data._variables['y']._data, actual._variables['y']._data)
+        self.assertVariableIdentical(data._variables['z'],
+                                     actual._variables['z'])
+        self.assertIsNot(data._variables['x'], actual._variables['x'])
+
+        # but modifying their attributes does not affect the original
+        actual['y'].attrs['units'] = 'm'
+        actual['v0'].attrs['units'] = 'm'
+        self.assertNotIn('units', data['y'].attrs)
+        self.assertNotIn('units', data['v0'].attrs)
+
+        actual = data.isel(x=slice(1, None), y=0)
+        self.assertEqual({'x': 4}, actual.dims)
+        self.assertVariableIdentical(data['w'].variable[0, 1:],
+                                     actual['w'].variable)
+        self.assertEqual(actual['y'].dims, ())
+
     def test_sel(self):
         data = create_test_data()
         int_slicers = {'dim1': slice(None, None, 2),
@@ -550,6 +578,97 @@ class TestDataset(TestCase):
         self.assertDatasetEqual(data.isel(td=slice(1, 3)),
                                 data.sel(td=slice('1 days', '2 days')))
 
+    def test_isel_points(self):
+        data = create_test_data()
+        pdim1 = [1, 2, 3]
+        pdim2 = [4, 5, 1]
+        pdim3 = [1, 2, 3]
+        actual = data.isel_points(dim1=pdim1, dim2=pdim2, dim3=pdim3,
+                                  dim='test_coord')
+        self.assertEqual(actual.dims, {'test_coord': 3, 'time': 20})
+        self.assertArrayEqual(actual['test_coord'], [0, 1, 2])
+        self.assertArrayEqual(actual['dim2'], data['dim2'][pdim2])
+        self.assertArrayEqual(actual['var1'],
+                              data['var1'].values[pdim1, pdim2])
+        self.assertArrayEqual(actual['var3'],
+                              data['var3'].values[pdim3, pdim1])
+        for n in range(3):
+            self.assertDatasetIdentical(
+                data.isel(dim1=pdim1[n], dim2=pdim2[n], dim3=pdim3[n]),
+                actual.isel(test_coord=n).drop_vars('test_coord'))
+
+        stations = pd.Index(['a', 'b'], name='stations')
+        actual = data.isel_points(time=[1, 2], dim=stations)
+        self.assertArrayEqual(actual['stations'], ['a', 'b'])
+        self.assertVariableIdentical(data['var1'].variable,
+                                     actual['var1'].variable)
+
+        # variables that are not indexed don't share attributes
+        actual['var1'].attrs['units'] = 'm'
+        self.assertNotIn('units', data['var1'].attrs)
+
+        actual = data.isel_points(dim1=[], dim2=[])
+        self.assertEqual(actual.dims['points'], 0)
+        self.assertEqual(actual['var1'].shape, (0,))
+
+        with self.assertRaisesRegexp(ValueError, 'same length'):
+            data.isel_points(dim1=[1, 2], dim2=[1, 2, 3])
+        with self.assertRaisesRegexp(ValueError, 'do not exist'):
+            data.isel_points(not_a_dim=[1, 2])
+        with self.assertRaisesRegexp(ValueError, 'already exists'):
+            data.isel_points(dim1=[1, 2], dim='dim2')
+        with self.assertRaisesRegexp(ValueError, 'integers'):
+            data.isel_points(dim1=[1.5, 2])
+        with self.assertRaisesRegexp(ValueError, 'at least one'):
+            data.isel_points()
+
+        # pointwise indexing is lazy
+        store = InaccessibleVariableDataStore()
+        create_test_data().dump_to_store(store)
+        lazy = Dataset.load_store(store).isel_points(dim1=pdim1, dim2=pdim2)
+        with self.assertRaises(UnexpectedDataAccess):
+            lazy['var1'].values
+
+    def test_sel_points(self):
+        data = create_test_data()
+        pdim1 = [1, 2, 3]
+        pdim2 = [4, 5, 1]
+        pdim3 = [1, 2, 3]
+        expected = data.isel_points(dim1=pdim1, dim2=pdim2, dim3=pdim3)
+        actual = data.sel_points(dim1=data.dim1[pdim1],
+                                 dim2=data.dim2[pdim2],
+                                 dim3=data.dim3[pdim3])
+        self.assertDatasetIdentical(expected, actual)
+
+    def test_sel_method(self):
+        data = Dataset({'foo': (('lat', 'lon'), np.arange(12).reshape(3, 4))},
+                       {'lat': [80.0, 70.0, 60.0],
+                        'lon': [0.0, 10.0, 20.0, 30.0]})
+        expected = data.sel(lat=70.0, lon=10.0)
+        actual = data.sel(lat=71, lon=14, method='nearest')
+        self.assertDatasetIdentical(expected, actual)
+        actual = data.sel(lat=71, lon=14, method='nearest', tolerance=5)
+        self.assertDatasetIdentical(expected, actual)
+
+        expected = data.sel(lon=[10.0, 20.0])
+        actual = data.sel(lon=[11, 20], method='pad')
+        self.assertDatasetIdentical(expected, actual)
+        actual = data.sel(lon=[9, 20], method='backfill')
+        self.assertDatasetIdentical(expected, actual)
+
+        expected = data.isel_points(lat=[2, 0], lon=[3, 0])
+        actual = data.sel_points(lat=[61, 79], lon=[29, 1], method='nearest')
+        self.assertDatasetIdentical(expected, actual)
+
+        with self.assertRaises(KeyError):
+            data.sel(lon=14, method='nearest', tolerance=3)
+        with self.assertRaisesRegexp(ValueError, 'not all values found'):
+            data.sel(lon=[14, 20], method='nearest', tolerance=3)
+        with self.assertRaisesRegexp(ValueError, 'only be used with method'):
+            data.sel(lon=[14], tolerance=3)
+        with self.assertRaisesRegexp(NotImplementedError, 'slice'):
+            data.sel(lon=slice(0, 10), method='nearest')
+
     def test_loc(self):
         data = create_test_data()
         expected = data.sel(dim3='a')
@@ -1134,6 +1253,20 @@ class TestDataset(TestCase):
                            {'t': ds['t'], 't.day': ds['t.day']})
         self.assertDatasetIdentical(actual, expected)
 
+    def test_groupby_math_dim_order(self):
+        ds = Dataset({'bar': (('time', 'y'), np.arange(12).reshape(6, 2))},
+                     {'time': pd.date_range('2000-01-01', periods=6,
+                                            freq='M')})
+        clim = ds.groupby('time.month').mean('time')
+        clim = clim.transpose('y', 'time.month')
+        expected = Dataset({'bar': (('time', 'y'), np.zeros((6, 2)))},
+                           {'time': ds['time'],
+                            'time.month': ds['time.month']})
+        actual = ds.groupby('time.month') - clim
+        self.assertDatasetIdentical(expected, actual)
+        actual = clim - ds.groupby('time.month')
+        self.assertDatasetIdentical(expected, actual)
+
     def test_groupby_nan(self):
         # nan should be excluded from groupby
         ds = Dataset({'foo': ('x', [1, 2, 3, 4])},
@@ -1142,6 +1275,42 @@ class TestDataset(TestCase):
         expected = Dataset({'foo': ('bar', [1.5, 3]), 'bar': [1, 2]})
         self.assertDatasetIdentical(actual, expected)
 
+    def test_resample(self):
+        times = pd.date_range('2000-01-01', freq='6H', periods=10)
+        ds = Dataset({'foo': (['time', 'x'], np.random.randn(10, 3)),
+                      'bar': ('time', np.arange(10)),
+                      'baz': ('x', [1.0, 2.0, 3.0]),
+                      'time': times},
+                     attrs={'units': 'm'})
+
+        actual = ds.resample('1D', dim='time', how='mean')
+        expected = ds.isel(time=slice(0, 10, 4)).copy()
+        for name in ['foo', 'bar']:
+            values = [ds[name].isel(time=slice(i, i + 4)).mean('time').values
+                      for i in range(0, 10, 4)]
+            expected[name] = (ds[name].dims, values)
+        expected['time'] = pd.date_range('2000-01-01', periods=3)
+        self.assertDatasetAllClose(expected, actual)
+        self.assertEqual(ds.attrs, actual.attrs)
+
+        actual = ds.resample('1D', dim='time', how='first')
+        expected = ds.isel(time=[0, 4, 8])
+        expected['time'] = pd.date_range('2000-01-01', periods=3)
+        self.assertDatasetIdentical(expected, actual)
+
+        actual = ds.resample('1D', dim=ds['time'], how=np.max)
+        expected = ds.resample('1D', dim='time', how='max')
+        self.assertDatasetIdentical(expected, actual)
+
+        # variables keep their original dimension order
+        transposed = ds.transpose('x', 'time')
+        for how in ['mean', 'first', np.max]:
+            actual = transposed.resample('1D', dim='time', how=how)
+            self.assertEqual(actual['foo'].dims, ('x', 'time'))
+            expected = ds.resample('1D', dim='time', how=how)
+            self.assertDatasetAllClose(expected.transpose('x', 'time'),
+                                       actual)
+
     def test_concat(self):
         data = create_test_data()
 
@@ -1455,6 +1624,26 @@ class TestDataset(TestCase):
         self.assertEqual(len(ds.attrs), len(_attrs))
         self.assertTrue(ds.attrs, attrs)
 
+    def test_cumulative(self):
+        data = create_test_data()
+        data['var4'] = ('dim1', np.array(['a'] * 8))
+        data.attrs['foo'] = 'bar'
+        actual = data.cumsum('dim1')
+        self.assertNotIn('var4', actual)
+        self.assertEqual(actual.attrs, {})
+        for k in data.coords:
+            self.assertVariableIdentical(data[k].variable, actual[k].variable)
+        for k in ['var1', 'var2', 'var3']:
+            self.assertDataArrayIdentical(data[k].cumsum('dim1'), actual[k])
+
+        actual = data.cumprod(keep_attrs=True)
+        self.assertEqual(actual.attrs, data.attrs)
+        for k in ['var1', 'var2', 'var3']:
+            self.assertDataArrayIdentical(data[k].cumprod(), actual[k])
+
+        with self.assertRaisesRegexp(ValueError, 'does not contain'):
+            data.cumsum('foo')
+
     def test_reduce_argmin(self):
         # regression test for #205
         ds = Dataset({'a': ('x', [0, 1])})
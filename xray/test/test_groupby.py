@@ -0,0 +1,244 @@
+from multiprocessing.pool import Pool, ThreadPool
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from xray import Dataset, DataArray
+from xray.core import ops, parallel
+from xray.core.groupby import unique_value_groups
+from . import TestCase
+
+
+def _demean(obj, offset=0):
+    return obj - obj.mean() + offset
+
+
+class TestGroupBy(TestCase):
+    def assertGroupsEqual(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for e, a in zip(expected, actual):
+            self.assertEqual(type(e), type(a))
+            if isinstance(e, slice):
+                self.assertEqual(e, a)
+            else:
+                self.assertArrayEqual(e, a)
+
+    def test_unique_value_groups(self):
+        values, groups = unique_value_groups(['b', 'a', 'b', 'c', 'a', 'a'])
+        self.assertArrayEqual(values, ['a', 'b', 'c'])
+        self.assertGroupsEqual([np.array([1, 4, 5]), np.array([0, 2]),
+                                slice(3, 4)], groups)
+
+        # missing values are not included in any group
+        values, groups = unique_value_groups([1, np.nan, 1, 2, 2, np.nan])
+        self.assertArrayEqual(values, [1, 2])
+        self.assertGroupsEqual([np.array([0, 2]), slice(3, 5)], groups)
+
+        values, groups = unique_value_groups([])
+        self.assertEqual(len(values), 0)
+        self.assertEqual(groups, [])
+
+    def test_unique_value_groups_matches_pandas(self):
+        times = pd.date_range('2000-01-01', periods=1000, freq='6H')
+        for ar in [times.dayofyear, times.hour,
+                   np.random.RandomState(0).randint(10, size=1000)]:
+            values, groups = unique_value_groups(ar)
+            expected = pd.Series(ar).groupby(ar).indices
+            self.assertArrayEqual(sorted(expected), values)
+            for value, group in zip(values, groups):
+                self.assertArrayEqual(expected[value],
+                                      np.arange(1000)[group])
+
+    def test_grouped_reduce(self):
+        x = np.random.RandomState(0).randn(10, 3, 4)
+        x[2, 1, 0] = np.nan
+        x[5:7] = np.nan
+        starts = [0, 3, 4, 8]
+        stops = starts[1:] + [10]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for name in ['sum', 'prod', 'max', 'min', 'count', 'mean', 'var',
+                         'std']:
+                f = getattr(ops, name)
+                for values in [x, x > 0, np.arange(120).reshape(10, 3, 4)]:
+                    for kwargs in [{}, {'skipna': False}]:
+                        if name == 'count' and kwargs:
+                            continue
+                        for other_axes in [(), (2,), (1, 2)]:
+                            axes = (0,) + other_axes
+                            expected = [f(values[start:stop], axis=axes,
+                                          **kwargs)
+                                        for start, stop in zip(starts, stops)]
+                            actual = f.grouped(values, starts, 0, other_axes,
+                                               **kwargs)
+                            self.assertArrayEqual(np.isnan(expected),
+                                                  np.isnan(actual))
+                            self.assertTrue(np.allclose(
+                                expected, actual, equal_nan=True))
+                            self.assertEqual(np.asarray(expected).dtype,
+                                             actual.dtype)
+            actual = ops.std.grouped(x, starts, 0, ddof=1)
+            expected = [np.nanstd(x[start:stop], axis=0, ddof=1)
+                        for start, stop in zip(starts, stops)]
+            self.assertTrue(np.allclose(expected, actual, equal_nan=True))
+
+    def test_fused_reduce_matches_apply(self):
+        times = pd.date_range('2000-01-01', periods=40, freq='11D')
+        x = np.random.RandomState(0).randn(40, 3)
+        x[3, 1] = np.nan
+        ds = Dataset({'a': (('time', 'x'), x), 'b': ('x', [1.0, 2, 3]),
+                      'c': ('time', np.arange(40)), 'd': 1.5},
+                     {'time': times, 'x': [10, 20, 30],
+                      'lab': ('time', np.arange(40) % 3)},
+                     attrs={'foo': 'bar'})
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for group in ['time.month', 'lab']:
+                for name in ['sum', 'mean', 'std', 'max', 'count']:
+                    for dim in [None, 'time']:
+                        grouped = ds.groupby(group)
+                        actual = getattr(grouped, name)(dim)
+                        expected = grouped.apply(
+                            lambda d: getattr(d, name)(dim))
+                        self.assertDatasetAllClose(expected, actual)
+                        self.assertEqual(set(expected.coords),
+                                         set(actual.coords))
+
+                        grouped = ds['a'].groupby(group)
+                        actual = getattr(grouped, name)(dim)
+                        expected = grouped.apply(
+                            lambda d: getattr(d, name)(dim))
+                        self.assertDataArrayAllClose(expected, actual)
+
+    def test_binary_op_by_group(self):
+        times = pd.date_range('2000-01-01', periods=40, freq='11D')
+        x = np.random.RandomState(0).randn(40, 3)
+        ds = Dataset({'a': (('time', 'x'), x), 'b': ('x', [1.0, 2, 3])},
+                     {'time': times, 'x': [10, 20, 30]})
+        grouped = ds.groupby('time.month')
+        clim = grouped.mean('time')
+        months = ds['time.month'].values
+
+        actual = grouped - clim
+        expected = x - clim['a'].sel(**{'time.month': months}).values
+        self.assertArrayEqual(expected, actual['a'].values)
+        self.assertEqual(actual['a'].dims, ('time', 'x'))
+        # like concatenating the result for each group, variables that are
+        # the same for every group are not stacked
+        self.assertEqual(actual['b'].dims, ('x',))
+        self.assertArrayEqual([0, 0, 0], actual['b'])
+        self.assertArrayEqual(months, actual['time.month'])
+
+        actual = clim['a'] - ds['a'].groupby('time.month')
+        self.assertArrayEqual(-expected, actual.values)
+        self.assertEqual(actual.dims, ('time', 'x'))
+
+        # elements that are not in any group are missing in the result
+        array = DataArray([1, 2, 3, 4], [('x', range(4))])
+        array.coords['lab'] = ('x', [1, 1, np.nan, 2])
+        other = DataArray([10, 20], [('lab', [1, 2])])
+        actual = array.groupby('lab') + other
+        self.assertArrayEqual([11, 12, np.nan, 24], actual)
+
+        with self.assertRaisesRegexp(ValueError, 'not all values found'):
+            array.groupby('lab') + DataArray([10], [('lab', [1])])
+
+    def test_dataset_apply_shortcut(self):
+        times = pd.date_range('2000-01-01', periods=20)
+        ds = Dataset({'a': (('time', 'x'), np.random.randn(20, 3)),
+                      'b': ('x', [1.0, 2, 3])},
+                     {'time': times, 'x': [10, 20, 30],
+                      'lab': ('time', np.arange(20) % 3)},
+                     attrs={'foo': 'bar'})
+        ds['a'].attrs['units'] = 'm'
+        for group in ['lab', 'time.dayofweek', 'x']:
+            for squeeze in [True, False]:
+                grouped = ds.groupby(group, squeeze=squeeze)
+                for func in [lambda d: d, lambda d: 2 * d,
+                             lambda d: d.mean('time')]:
+                    expected = grouped.apply(func)
+                    actual = grouped.apply(func, shortcut=True)
+                    self.assertDatasetIdentical(expected, actual)
+
+    def test_apply_in_parallel(self):
+        times = pd.date_range('2000-01-01', periods=20)
+        ds = Dataset({'a': (('time', 'x'), np.random.randn(20, 3))},
+                     {'time': times, 'x': [10, 20, 30]})
+        parallel.set_num_threads(2)
+        try:
+            for obj in [ds, ds['a']]:
+                grouped = obj.groupby('time.dayofweek')
+                expected = grouped.apply(_demean, offset=1)
+                actual = grouped.apply(_demean, parallel=True, offset=1)
+                self.assertTrue(expected.identical(actual))
+                for pool in [ThreadPool(2), Pool(2)]:
+                    try:
+                        for shortcut in [False, True]:
+                            expected = grouped.apply(
+                                _demean, shortcut=shortcut, offset=1)
+                            actual = grouped.apply(_demean, shortcut=shortcut,
+                                                   executor=pool, offset=1)
+                            self.assertTrue(expected.identical(actual))
+                    finally:
+                        pool.close()
+                        pool.join()
+        finally:
+            parallel.set_num_threads(1)
+
+    def test_grouped_accumulate(self):
+        x = np.random.RandomState(0).randn(12, 3)
+        x[2, 1] = np.nan
+        codes = np.array([0, 1, 0, 2, 1, 1, 0, 2, 2, 0, 1, 2])
+        for name, fill in [('cumsum', 0), ('cumprod', 1)]:
+            func = getattr(ops, name)
+            for skipna in [True, False]:
+                filled = np.where(np.isnan(x), fill, x) if skipna else x
+                expected = pd.DataFrame(filled).groupby(codes).transform(
+                    lambda s: getattr(np, name)(s.values)).values
+                actual = func.grouped(x, codes, 0, skipna=skipna)
+                np.testing.assert_allclose(expected, actual)
+                actual = func.grouped(x.T, codes, 1, skipna=skipna)
+                np.testing.assert_allclose(expected, actual.T)
+
+    def test_grouped_cumsum_precision(self):
+        # large offsets from preceding groups shouldn't cost any precision
+        n = 200000
+        x = np.random.RandomState(0).uniform(0, 10, n).astype(np.float32)
+        codes = np.repeat(np.arange(20), n // 20)
+        actual = ops.cumsum.grouped(x, codes, 0)
+        self.assertEqual(actual.dtype, np.float32)
+        for code in [0, 11, 19]:
+            index = codes == code
+            expected = np.cumsum(x[index].astype(np.float64))
+            self.assertEqual(x[index][0], actual[index][0])
+            np.testing.assert_allclose(expected, actual[index], rtol=1e-5)
+
+    def test_groupby_cumulative(self):
+        times = pd.date_range('2000-01-01', periods=20)
+        ds = Dataset({'a': (('time', 'x'), np.random.randn(20, 3)),
+                      'b': ('x', [1.0, 2, 3])},
+                     {'time': times, 'x': [10, 20, 30],
+                      'lab': ('time', [0, 1, 2, np.nan] * 5)})
+        for group in ['lab', 'time.dayofweek']:
+            labels = ds[group].values
+            for name in ['cumsum', 'cumprod']:
+                expected = np.empty((20, 3))
+                expected.fill(np.nan)
+                for label in np.unique(labels[~pd.isnull(labels)]):
+                    index = labels == label
+                    expected[index] = getattr(np, name)(
+                        ds['a'].values[index], axis=0)
+
+                actual = getattr(ds['a'].groupby(group), name)()
+                self.assertDataArrayAllClose(
+                    DataArray(expected, ds['a'].coords, name='a'), actual)
+
+                actual = getattr(ds.groupby(group), name)()
+                expected_ds = ds.copy()
+                expected_ds['a'] = (('time', 'x'), expected)
+                self.assertDatasetAllClose(expected_ds, actual)
+
+        # accumulating along other dimensions is the same for every group
+        actual = ds['a'].groupby('time.dayofweek').cumsum('x')
+        self.assertDataArrayAllClose(ds['a'].cumsum('x'), actual)
@@ -1,7 +1,11 @@
+import time
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
+import pandas as pd
 
 from xray import Dataset, Variable, Coordinate
-from xray.core import indexing, variable
+from xray.core import indexing, utils, variable
 from . import TestCase, ReturnItem
 
 
@@ -65,6 +69,24 @@ class TestIndexers(TestCase):
         with self.assertRaisesRegexp(ValueError, 'invalid subkey'):
             print(indexing.orthogonal_indexer((1.5 * y, 1.5 * y), x.shape))
 
+    def test_orthogonally_index(self):
+        x = np.random.randn(10, 11, 12, 13)
+        y = np.array([4, 0, -1, 4])
+        I = ReturnItem()
+        for i in [I[:], I[0], I[y], I[:, y], I[0, y], I[y, 0], I[y, :, y],
+                  I[::-2, y, 3:8, 1], I[y, 1:2, y, ::3],
+                  I[np.arange(10) > 6, :, y, np.array([], int)],
+                  I[..., y, 0], I[y, y, y, y]]:
+            expected = x[indexing.orthogonal_indexer(i, x.shape)]
+            actual = indexing.orthogonally_index(x, i)
+            self.assertEqual(expected.shape, actual.shape)
+            self.assertArrayEqual(expected, actual)
+        # basic indexing still returns a view
+        view = indexing.orthogonally_index(x, I[1:3, 0])
+        self.assertIs(view.base, x)
+        with self.assertRaises(IndexError):
+            indexing.orthogonally_index(x, I[[10]])
+
     def test_convert_label_indexer(self):
         # TODO: add tests that aren't just for edge cases
         coord = Coordinate('x', [1, 2, 3])
@@ -73,6 +95,70 @@ class TestIndexers(TestCase):
         with self.assertRaises(KeyError):
             indexing.convert_label_indexer(coord, 0)
 
+    def test_get_indexer(self):
+        for index in [pd.Index([1, 3, 5, 7]), pd.Index([7, 1, 5, 3]),
+                      pd.Index([1.0, 3.0, 5.0, 7.0]), pd.Index([1, 3, 3, 5]),
+                      pd.Index([]), Coordinate('x', [1, 3, 5, 7])]:
+            for labels in [[1, 5], [7, 1, 5, 5], [0, 2, 8], [3.0, 3.5],
+                           np.array([], int)]:
+                labels = np.asarray(labels)
+                try:
+                    expected = index.get_indexer(labels)
+                except Exception as e:
+                    with self.assertRaises(type(e)):
+                        indexing._get_indexer(index, labels)
+                else:
+                    actual = indexing._get_indexer(index, labels)
+                    self.assertArrayEqual(expected, actual)
+        times = pd.date_range('2000-01-01', periods=5)
+        self.assertArrayEqual(indexing._get_indexer(times, times.values[::-2]),
+                              [4, 2, 0])
+        self.assertArrayEqual(
+            indexing._get_indexer(times, np.array(['2000-01-02'], 'M8[D]')),
+            [1])
+
+    def test_get_fill_indexer(self):
+        index = pd.Index([0.0, 1.0, 2.0, 4.0])
+        labels = np.array([-1, 0, 0.4, 0.5, 1.6, 3.5, 4, 7])
+        for method in ['pad', 'backfill']:
+            self.assertArrayEqual(
+                index.get_indexer(labels, method=method),
+                indexing._get_fill_indexer(index, labels, method))
+        self.assertArrayEqual(
+            [0, 0, 0, 1, 2, 3, 3, 3],
+            indexing._get_fill_indexer(index, labels, 'nearest'))
+        self.assertArrayEqual(
+            [0, 0, 0, 1, 2, 3, 3, -1],
+            indexing._get_fill_indexer(index, labels, 'nearest', 1.0))
+        # decreasing indexes
+        index = index[::-1]
+        self.assertArrayEqual(
+            [3, 3, 3, 2, 1, 0, 0, 0],
+            indexing._get_fill_indexer(index, labels, 'nearest'))
+        self.assertArrayEqual(
+            [3, 3, 2, 2, 1, 0, 0, -1],
+            indexing._get_fill_indexer(index, labels, 'pad'))
+        self.assertArrayEqual(
+            [-1, 3, 3, 3, 2, 1, 0, 0],
+            indexing._get_fill_indexer(index, labels, 'bfill'))
+        # datetimes
+        times = pd.date_range('2000-01-01', periods=3)
+        self.assertArrayEqual(
+            [1, -1],
+            indexing._get_fill_indexer(times, np.array(['2000-01-02T06',
+                                                        '2000-01-05']),
+                                       'nearest', tolerance='12h'))
+        empty = pd.Float64Index([])
+        actual = indexing._get_fill_indexer(empty, np.array([1.0]), 'nearest')
+        self.assertArrayEqual([-1], actual)
+        with self.assertRaisesRegexp(ValueError, 'monotonic'):
+            indexing._get_fill_indexer(pd.Index([1, 0, 2]), labels, 'pad')
+        with self.assertRaisesRegexp(ValueError, 'invalid method'):
+            indexing._get_fill_indexer(index, labels, 'foo')
+        with self.assertRaisesRegexp(TypeError, 'numeric'):
+            indexing._get_fill_indexer(pd.Index(['a', 'b']),
+                                       np.array(['a']), 'nearest')
+
     def test_remap_label_indexers(self):
         # TODO: fill in more tests!
         data = Dataset({'x': ('x', [1, 2, 3])})
@@ -119,3 +205,193 @@ class TestLazyArray(TestCase):
             actual = lazy[i][j]
             self.assertEqual(expected.shape, actual.shape)
             self.assertArrayEqual(expected, actual)
+
+    def test_concatenated_array(self):
+        x = np.random.rand(10, 20, 30)
+        pieces = [variable.NumpyArrayAdapter(x[:, :5]),
+                  variable.NumpyArrayAdapter(x[:, 5:6]),
+                  variable.NumpyArrayAdapter(x[:, 6:])]
+        concatenated = indexing.ConcatenatedArray(pieces, axis=1)
+        self.assertEqual(concatenated.shape, x.shape)
+        self.assertEqual(concatenated.dtype, x.dtype)
+        I = ReturnItem()
+        orthogonal = variable.NumpyArrayAdapter(x)
+        for i in [I[:], I[0], I[:, 5], I[:, -1], I[2, 3:8], I[:, ::-1],
+                  I[:, 4:-4:3], I[:, [7, 0, 5, 19]], I[:, 7:7],
+                  I[[1, 2], [0, 15], :4], I[..., 0]]:
+            expected = orthogonal[i]
+            actual = concatenated[i]
+            self.assertEqual(expected.shape, actual.shape)
+            self.assertArrayEqual(expected, actual)
+        with self.assertRaisesRegexp(ValueError, 'matching shapes'):
+            indexing.ConcatenatedArray([x, x[:2]], axis=1)
+
+    def test_blocked_array(self):
+        x = np.arange(60).reshape(6, 10)
+        blocked = indexing.BlockedArray(variable.NumpyArrayAdapter(x), (4, 5))
+        self.assertEqual(blocked.shape, x.shape)
+        self.assertEqual(blocked.block_slices(0), [slice(0, 4), slice(4, 6)])
+        self.assertEqual(blocked.block_slices(1), [slice(0, 5), slice(5, 10)])
+        blocks = list(blocked.iter_blocks())
+        self.assertEqual(len(blocks), 4)
+        for key, block in blocks:
+            self.assertArrayEqual(x[key], block)
+        self.assertArrayEqual(x, blocked)
+
+        subset = blocked[1:, 3]
+        self.assertIsInstance(subset, indexing.BlockedArray)
+        self.assertEqual(subset.chunks, (4,))
+        self.assertArrayEqual(x[1:, 3], subset)
+
+        with self.assertRaisesRegexp(ValueError, 'same length'):
+            indexing.BlockedArray(x, (1, 2, 3))
+
+    def test_blocked_array_load_block(self):
+        reading = []
+        overlapped = []
+
+        class OnDiskArray(utils.NDArrayMixin):
+            def __init__(self, values):
+                self._values = values
+
+            @property
+            def dtype(self):
+                return self._values.dtype
+
+            @property
+            def shape(self):
+                return self._values.shape
+
+            def __getitem__(self, key):
+                if reading:
+                    overlapped.append(key)
+                reading.append(key)
+                time.sleep(0.001)
+                reading.pop()
+                return self._values[key]
+
+        x = np.arange(60).reshape(6, 10)
+        self.assertTrue(indexing._is_in_memory(
+            indexing.LazilyIndexedArray(variable.NumpyArrayAdapter(x))))
+        blocked = indexing.BlockedArray(OnDiskArray(x), (1, 10))
+        self.assertFalse(indexing._is_in_memory(blocked.array))
+        keys = [(k, slice(None)) for k in blocked.block_slices(0)]
+        pool = ThreadPool(4)
+        try:
+            blocks = pool.map(blocked.load_block, keys)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertArrayEqual(x, np.concatenate(blocks))
+        self.assertEqual(overlapped, [])
+
+    def test_pointwise_indexed_array(self):
+        keys = []
+
+        class KeyRecordingArray(variable.NumpyArrayAdapter):
+            def __getitem__(self, key):
+                keys.append(key)
+                return super(KeyRecordingArray, self).__getitem__(key)
+
+        x = np.random.rand(10, 20, 30)
+        key = indexing.canonicalize_points_key(([0, 9, -1, 0], Ellipsis,
+                                                [5, 2, 3, 29]), x.shape)
+        self.assertArrayEqual(key[0], [0, 9, 9, 0])
+        self.assertEqual(key[1], slice(None))
+        expected = x[[0, 9, 9, 0], :, [5, 2, 3, 29]]
+        self.assertArrayEqual(expected, indexing.gather_points(x, key))
+
+        lazy = indexing.PointwiseIndexedArray(KeyRecordingArray(x), key)
+        self.assertEqual(lazy.shape, (4, 20))
+        self.assertEqual(keys, [])
+        self.assertArrayEqual(expected, lazy)
+        # only the block spanned by the points is read, in a single call
+        self.assertEqual(keys, [(slice(0, 10, 1), slice(None),
+                                 slice(2, 30, 1))])
+        self.assertArrayEqual(expected[1:, :3], lazy[1:, :3])
+
+        # with a smaller buffer, the points are read in smaller blocks
+        del keys[:]
+        lazy = indexing.PointwiseIndexedArray(KeyRecordingArray(x), key,
+                                              buffer_size=320)
+        self.assertArrayEqual(expected, lazy)
+        self.assertEqual(len(keys), 2)
+        self.assertEqual([k[0] for k in keys],
+                         [slice(0, 1, 1), slice(9, 10, 1)])
+
+        # scattered points never read the whole block spanned by them
+        i, j = np.random.RandomState(0).randint(0, 20, size=(2, 100))
+        y = np.random.rand(20, 20, 10)
+        key = indexing.canonicalize_points_key((i, j), y.shape)
+        del keys[:]
+        lazy = indexing.PointwiseIndexedArray(KeyRecordingArray(y), key,
+                                              buffer_size=800)
+        self.assertArrayEqual(y[i, j], lazy)
+        self.assertGreater(len(keys), 1)
+        for k in keys:
+            self.assertLess(y[k].nbytes, y.nbytes // 10)
+
+        empty = indexing.canonicalize_points_key(([], []), (2, 2, 10))
+        self.assertEqual(empty[0].dtype.kind, 'i')
+        lazy = indexing.PointwiseIndexedArray(KeyRecordingArray(y[:2, :2]),
+                                              empty)
+        self.assertEqual(np.asarray(lazy).shape, (0, 10))
+
+        with self.assertRaisesRegexp(ValueError, 'same length'):
+            indexing.canonicalize_points_key(([0, 1], [0]), (2, 2))
+        with self.assertRaisesRegexp(ValueError, 'integers'):
+            indexing.canonicalize_points_key(([0.5],), (2,))
+        with self.assertRaisesRegexp(ValueError, 'full slices'):
+            indexing.canonicalize_points_key(([0], slice(1)), (2, 2))
+        with self.assertRaises(IndexError):
+            indexing.canonicalize_points_key(([2],), (2,))
+
+    def test_plan_orthogonal_reads(self):
+        x = np.arange(1000)
+        key = (np.array([7, 3, 4, 5, 500, 502, 504, 3]),)
+        # a cheap request: read the bounding slab
+        pieces, local_key = indexing.plan_orthogonal_reads(key, x.shape, 1)
+        self.assertEqual(pieces, [[slice(3, 505, 1)]])
+        self.assertArrayEqual(x[3:505][local_key], key[0])
+        # expensive gaps are skipped
+        pieces, local_key = indexing.plan_orthogonal_reads(key, x.shape,
+                                                           2 ** 10)
+        self.assertEqual(pieces, [[slice(3, 8, 1), slice(500, 505, 2)]])
+        region = np.concatenate([x[3:8], x[500:505:2]])
+        self.assertArrayEqual(region[local_key], key[0])
+        # integers and slices are unchanged
+        key = (2, slice(None), np.arange(0, 20, 5))
+        pieces, local_key = indexing.plan_orthogonal_reads(key, (3, 4, 20), 8)
+        self.assertEqual(pieces, [2, slice(None), [slice(0, 16, 5)]])
+        self.assertEqual(local_key[0], slice(None))
+        self.assertArrayEqual(local_key[1], range(4))
+
+    def test_orthogonal_read(self):
+        keys = []
+
+        class SliceOnlyArray(variable.NumpyArrayAdapter):
+            def __getitem__(self, key):
+                for k in key:
+                    assert isinstance(k, (int, slice)), key
+                keys.append(key)
+                return super(SliceOnlyArray, self).__getitem__(key)
+
+        x = np.random.rand(300, 4, 500)
+        array = SliceOnlyArray(x)
+        lazy = indexing.LazilyIndexedArray(array)
+        I = ReturnItem()
+        for key in [I[[0, 299, 5], 1, ::-3], I[-1, [3, 0, 0], 100:0:-7],
+                    I[:, :, [499, 0, 250, 251, 252, 253]],
+                    I[[1, 2, 200, 201], [1, 2], [5, 405, 3]],
+                    I[np.array([], int), :, 0], I[np.arange(300) % 3 == 0]]:
+            expected = x[indexing.orthogonal_indexer(key, x.shape)]
+            actual = np.asarray(lazy[key])
+            self.assertEqual(expected.shape, actual.shape)
+            self.assertArrayEqual(expected, actual)
+
+        # sparse keys are read with a bounded number of requests
+        key = (np.arange(0, 300, 2), 0, np.arange(0, 500, 3) ** 2 % 500)
+        del keys[:]
+        self.assertArrayEqual(x[indexing.orthogonal_indexer(key, x.shape)],
+                              indexing.orthogonal_read(array, key))
+        self.assertLessEqual(len(keys), indexing.MAX_READ_CALLS)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from xray import Variable
+from xray.core import parallel
+from . import TestCase
+
+
+class TestParallel(TestCase):
+    def setUp(self):
+        self.min_block_size = parallel.MIN_BLOCK_SIZE
+        parallel.MIN_BLOCK_SIZE = 10
+        parallel.set_num_threads(3)
+
+    def tearDown(self):
+        parallel.MIN_BLOCK_SIZE = self.min_block_size
+        parallel.set_num_threads(1)
+
+    def test_set_num_threads(self):
+        self.assertEqual(parallel.get_num_threads(), 3)
+        with self.assertRaisesRegexp(ValueError, 'at least 1'):
+            parallel.set_num_threads(0)
+
+    def test_imap(self):
+        self.assertEqual(list(parallel.imap(lambda x: 2 * x, range(10))),
+                         list(range(0, 20, 2)))
+        # nested calls are executed serially
+        actual = list(parallel.imap(
+            lambda x: list(parallel.imap(lambda y: x * y, range(3))),
+            range(4)))
+        self.assertEqual(actual, [[0, x, 2 * x] for x in range(4)])
+
+    def test_tree_reduce(self):
+        for n in range(1, 20):
+            items = [[i] for i in range(n)]
+            actual = parallel.tree_reduce(lambda a, b: a + b, items)
+            self.assertEqual(actual, list(range(n)))
+        self.assertEqual(parallel.tree_reduce(lambda a, b: (a, b), 'abcd'),
+                         (('a', 'b'), ('c', 'd')))
+        with self.assertRaisesRegexp(ValueError, 'empty'):
+            parallel.tree_reduce(lambda a, b: a + b, [])
+
+    def test_auto_chunks(self):
+        self.assertEqual(parallel.auto_chunks((10, 4)), (4, None))
+        self.assertEqual(parallel.auto_chunks((2, 20)), (1, None))
+        self.assertIsNone(parallel.auto_chunks((1, 100)))
+        self.assertIsNone(parallel.auto_chunks((5,)))
+        self.assertIsNone(parallel.auto_chunks(()))
+        parallel.set_num_threads(1)
+        self.assertIsNone(parallel.auto_chunks((10, 4)))
+
+    def test_apply_elementwise(self):
+        x = np.random.randn(10, 4)
+        y = np.random.randn(4)
+        self.assertArrayEqual(x + y, parallel.apply_elementwise(np.add, x, y))
+        self.assertArrayEqual(
+            x[:1] * x, parallel.apply_elementwise(np.multiply, x[:1], x))
+        self.assertArrayEqual(-x, parallel.apply_elementwise(np.negative, x))
+        self.assertArrayEqual(x > 0, parallel.apply_elementwise(np.greater,
+                                                                x, 0))
+        # functions that do not act element-wise fall back to a single call
+        self.assertArrayEqual(
+            x.sum(axis=0), parallel.apply_elementwise(lambda a: a.sum(0), x))
+
+    def test_variable_ops(self):
+        x = np.random.randn(20, 5)
+        x[3, 2] = np.nan
+        v = Variable(['x', 'y'], x)
+        w = Variable(['y'], np.arange(5.0))
+        parallel.set_num_threads(1)
+        serial = [v + w, w - v, -v, abs(v), v > 0, v.mean('x'),
+                  v.std(), v.sum('y'), v.max(), v.min('x', skipna=False)]
+        parallel.set_num_threads(3)
+        actual = [v + w, w - v, -v, abs(v), v > 0, v.mean('x'),
+                  v.std(), v.sum('y'), v.max(), v.min('x', skipna=False)]
+        for expected, actual in zip(serial, actual):
+            self.assertVariableAllClose(expected, actual)
+            self.assertEqual(expected.dtype, actual.dtype)
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+from xray import Dataset, DataArray
+from xray.core import ops
+from . import TestCase
+
+
+class TestRolling(TestCase):
+    def setUp(self):
+        rs = np.random.RandomState(0)
+        self.x = 3 * rs.randn(50, 4) + 100
+        self.x[3, 1] = np.nan
+        self.x[10:20, 2] = np.nan
+
+    def test_move_reduce_matches_pandas(self):
+        df = pd.DataFrame(self.x)
+        for window in [1, 2, 3, 7, 60]:
+            for min_periods in [None, 1]:
+                for center in [False, True]:
+                    for name in ['sum', 'mean', 'std', 'var', 'max', 'min']:
+                        kwargs = ({'ddof': 1} if name in ['std', 'var']
+                                  else {})
+                        expected = getattr(pd, 'rolling_' + name)(
+                            df, window, min_periods=min_periods or window,
+                            center=center, **kwargs).values
+                        actual = ops._move_reduce(name, self.x, window, 0,
+                                                  min_periods, center,
+                                                  **kwargs)
+                        self.assertArrayEqual(np.isnan(expected),
+                                              np.isnan(actual))
+                        np.testing.assert_allclose(expected, actual,
+                                                   atol=1e-6)
+                        # rolling along the last axis is equivalent
+                        actual = ops._move_reduce(name, self.x.T, window, 1,
+                                                  min_periods, center,
+                                                  **kwargs)
+                        np.testing.assert_allclose(expected, actual.T,
+                                                   atol=1e-6)
+
+    def test_move_reduce_count(self):
+        x = np.array([1, np.nan, 2, 3, np.nan, np.nan, np.nan, 4])
+        actual = ops._move_reduce('count', x, 3, 0, min_periods=1)
+        expected = [1, 1, 2, 2, 2, 1, np.nan, 1]
+        self.assertArrayEqual(expected, actual)
+
+    def test_move_reduce_edge_cases(self):
+        self.assertArrayEqual([np.nan, np.nan, 2, 3, 4],
+                              ops._move_reduce('max', np.arange(5), 3, 0))
+        self.assertArrayEqual([0, 0, 0, 1, 2],
+                              ops._move_reduce('min', np.arange(5), 3, 0,
+                                               min_periods=1))
+        self.assertArrayEqual([np.nan] * 3,
+                              ops._move_reduce('sum', np.arange(3), 5, 0))
+        self.assertEqual(ops._move_reduce('mean', np.zeros(0), 3, 0).shape,
+                         (0,))
+        with self.assertRaisesRegexp(TypeError, 'not supported'):
+            ops._move_reduce('mean', np.array(['a', 'b']), 1, 0)
+
+    def test_dataarray_rolling(self):
+        array = DataArray(self.x, [('time', pd.date_range('2000-01-01',
+                                                          periods=50)),
+                                   ('x', list('abcd'))],
+                          attrs={'units': 'm'})
+        rolling = array.rolling(time=5)
+        self.assertIn('time->5', repr(rolling))
+
+        actual = rolling.mean()
+        expected = array.copy()
+        expected.attrs = {}
+        expected.values = pd.rolling_mean(array.to_pandas(), 5).values
+        self.assertDataArrayAllClose(expected, actual)
+        self.assertEqual(actual.attrs, {})
+
+        actual = array.rolling(x=2, min_periods=1, center=True).max()
+        expected = array.copy()
+        expected.attrs = {}
+        expected.values = pd.rolling_max(array.to_pandas().T, 2,
+                                         min_periods=1, center=True).T.values
+        self.assertDataArrayIdentical(expected, actual)
+
+        with self.assertRaisesRegexp(ValueError, 'exactly one dimension'):
+            array.rolling(time=2, x=2)
+        with self.assertRaisesRegexp(ValueError, 'not a dimension'):
+            array.rolling(y=2)
+        with self.assertRaisesRegexp(ValueError, 'at least 1'):
+            array.rolling(time=0)
+        with self.assertRaisesRegexp(ValueError, 'min_periods'):
+            array.rolling(time=2, min_periods=3)
+
+    def test_dataset_rolling(self):
+        ds = Dataset({'foo': (('time', 'x'), self.x),
+                      'bar': ('x', np.arange(4)),
+                      'baz': ('time', np.arange(50)),
+                      'qux': ('time', ['a'] * 50),
+                      'time': pd.date_range('2000-01-01', periods=50)},
+                     attrs={'title': 'test'})
+        actual = ds.rolling(time=3).std(ddof=1)
+        self.assertItemsEqual(['foo', 'bar', 'baz'], actual.data_vars)
+        self.assertEqual(actual.attrs, {})
+        self.assertVariableIdentical(ds['bar'].variable,
+                                     actual['bar'].variable)
+        self.assertVariableIdentical(ds['time'].variable,
+                                     actual['time'].variable)
+        for name in ['foo', 'baz']:
+            self.assertDataArrayAllClose(ds[name].rolling(time=3).std(ddof=1),
+                                         actual[name])
@@ -139,3 +139,46 @@ class TestDictionaries(TestCase):
         self.assertEqual(m['x'], 100)
         self.assertEqual(m.maps[0]['x'], 100)
         self.assertItemsEqual(['x', 'y', 'z'], m)
+
+
+class TestLRUCache(TestCase):
+    def test_lru(self):
+        cache = utils.LRUCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+        # 'b' was the least recently used item
+        self.assertNotIn('b', cache)
+        self.assertEqual(list(cache), ['a', 'c'])
+        cache['a'] = 4
+        self.assertEqual(list(cache), ['c', 'a'])
+        cache.maxsize = 1
+        self.assertEqual(dict(cache), {'a': 4})
+        del cache['a']
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(KeyError):
+            cache['a']
+        with self.assertRaisesRegexp(ValueError, 'non-negative'):
+            utils.LRUCache(-1)
+
+    def test_sizeof(self):
+        cache = utils.LRUCache(maxsize=10, sizeof=len)
+        cache['a'] = 'xxxx'
+        cache['b'] = 'xxxx'
+        self.assertEqual(cache.size, 8)
+        cache['c'] = 'xxx'
+        self.assertEqual(list(cache), ['b', 'c'])
+        self.assertEqual(cache.size, 7)
+        # items larger than the cache are not stored
+        cache['d'] = 'x' * 11
+        self.assertNotIn('d', cache)
+        cache['b'] = 'x'
+        self.assertEqual(cache.size, 4)
+        del cache['c']
+        self.assertEqual(cache.size, 1)
+
+    def test_zero_size(self):
+        cache = utils.LRUCache(maxsize=0)
+        cache['a'] = 1
+        self.assertNotIn('a', cache)
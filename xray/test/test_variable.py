@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 
 from xray import Variable, Dataset, DataArray
-from xray.core import indexing
+from xray.core import indexing, utils
 from xray.core.variable import (Coordinate, as_variable, NumpyArrayAdapter,
                                 PandasIndexAdapter, _as_compatible_data)
 from xray.core.pycompat import PY3, OrderedDict
@@ -313,11 +313,14 @@ class VariableSubclassTestCases(object):
             Variable.concat([v, Variable(['c'], y)], 'b')
         # test concatenating along a dimension
         v = Variable(['time', 'x'], np.random.random((10, 8)))
-        self.assertVariableIdentical(v, Variable.concat([v[:5], v[5:]], 'time'))
-        self.assertVariableIdentical(v, Variable.concat([v[:5], v[5], v[6:]], 'time'))
+        self.assertVariableIdentical(v,
+                                     Variable.concat([v[:5], v[5:]], 'time'))
+        self.assertVariableIdentical(
+            v, Variable.concat([v[:5], v[5], v[6:]], 'time'))
         self.assertVariableIdentical(v, Variable.concat([v[0], v[1:]], 'time'))
         # test dimension order
-        self.assertVariableIdentical(v, Variable.concat([v[:, :5], v[:, 5:]], 'x'))
+        self.assertVariableIdentical(
+            v, Variable.concat([v[:, :5], v[:, 5:]], 'x'))
         self.assertVariableIdentical(v.transpose(),
                                      Variable.concat([v[:, 0], v[:, 1:]], 'x'))
 
@@ -566,6 +569,29 @@ class TestVariable(TestCase, VariableSubclassTestCases):
         with self.assertRaisesRegexp(ValueError, 'do not exist'):
             v.isel(not_a_dim=0)
 
+    def test_isel_points(self):
+        v = Variable(['time', 'x'], self.d, {'foo': 'bar'})
+        actual = v.isel_points(time=[0, 5, -1], x=[1, 0, 2])
+        expected = Variable(['points'], self.d[[0, 5, -1], [1, 0, 2]],
+                            {'foo': 'bar'})
+        self.assertVariableIdentical(expected, actual)
+        actual = v.isel_points('station', x=[2, 2])
+        self.assertVariableIdentical(
+            Variable(['station', 'time'], self.d[:, [2, 2]].T, {'foo': 'bar'}),
+            actual)
+        # lazily loaded data is indexed lazily
+        lazy = Variable(['time', 'x'],
+                        indexing.LazilyIndexedArray(self.d)).chunk(3)
+        actual = lazy.isel_points(time=[0, 5, -1], x=[1, 0, 2])
+        self.assertIsInstance(actual._data, indexing.PointwiseIndexedArray)
+        self.assertArrayEqual(expected.values, actual.values)
+        with self.assertRaisesRegexp(ValueError, 'do not exist'):
+            v.isel_points(not_a_dim=[0])
+        with self.assertRaisesRegexp(ValueError, 'already exists'):
+            v.isel_points('x', time=[0])
+        with self.assertRaisesRegexp(ValueError, 'same length'):
+            v.isel_points(time=[0, 1], x=[0])
+
     def test_index_0d_numpy_string(self):
         # regression test to verify our work around for indexing 0d strings
         v = Variable([], np.string_('asdf'))
@@ -744,6 +770,28 @@ class TestVariable(TestCase, VariableSubclassTestCases):
         self.assertEqual(len(vm.attrs), len(_attrs))
         self.assertEqual(vm.attrs, _attrs)
 
+    def test_cumulative(self):
+        v = Variable(['x', 'y'], [[1, np.nan, 3], [4, 5, 6]], {'foo': 'bar'})
+        expected = Variable(['x', 'y'], [[1, 1, 4], [4, 9, 15]])
+        self.assertVariableIdentical(expected, v.cumsum('y'))
+        self.assertVariableIdentical(expected, v.cumsum(axis=1))
+        expected = Variable(['x', 'y'], [[1, np.nan, 3], [5, np.nan, 9]])
+        self.assertVariableIdentical(expected, v.cumsum('x', skipna=False))
+        expected = Variable(['x', 'y'], [[1, 1, 3], [4, 20, 360]])
+        self.assertVariableIdentical(expected, v.cumprod())
+        expected = Variable(['x', 'y'], [[1, 1, 3], [4, 5, 18]],
+                            {'foo': 'bar'})
+        self.assertVariableIdentical(expected,
+                                     v.cumprod('x', keep_attrs=True))
+        with self.assertRaisesRegexp(ValueError, 'cannot supply both'):
+            v.cumsum('x', axis=0)
+
+        ints = Variable(['x'], np.arange(1, 5))
+        self.assertVariableIdentical(Variable(['x'], [1, 3, 6, 10]),
+                                     ints.cumsum())
+        self.assertVariableIdentical(Variable(['x'], [1, 2, 6, 24]),
+                                     ints.cumprod())
+
     def test_count(self):
         expected = Variable([], 3)
         actual = Variable(['x'], [1, 2, 3, np.nan]).count()
@@ -761,6 +809,66 @@ class TestVariable(TestCase, VariableSubclassTestCases):
         actual = Variable(['x', 'y'], [[1, 0, np.nan], [1, 1, 1]]).count('y')
         self.assertVariableIdentical(expected, actual)
 
+    def test_chunk(self):
+        v = Variable(['x', 'y'], self.d)
+        chunked = v.chunk({'x': 3})
+        self.assertIsInstance(chunked._data, indexing.BlockedArray)
+        self.assertFalse(chunked._in_memory)
+        self.assertEqual(chunked._data.chunks, (3, 3))
+        self.assertEqual(v.chunk(2)._data.chunks, (2, 2))
+        self.assertEqual(v.chunk((2, None))._data.chunks, (2, 3))
+        # indexing is lazy and preserves chunks
+        self.assertEqual(chunked[1:, 0]._data.chunks, (3,))
+        self.assertVariableIdentical(v[[0, 2], 1:], chunked[[0, 2], 1:])
+        self.assertVariableIdentical(v, chunked)
+        with self.assertRaisesRegexp(ValueError, 'positive'):
+            v.chunk(0)
+
+    def test_chunk_reduce(self):
+        class BlockSizeCheckingArray(utils.NDArrayMixin):
+            def __init__(test_array, array):
+                test_array.array = array
+
+            def __getitem__(test_array, key):
+                values = test_array.array[key]
+                self.assertLessEqual(values.size, 6)
+                return values
+
+        data = np.random.RandomState(0).randn(10, 3)
+        data[2, 1] = np.nan
+        v = Variable(['x', 'y'], data)
+        chunked = Variable(['x', 'y'], BlockSizeCheckingArray(data))
+        chunked = chunked.chunk({'x': 2})
+        for name in ['sum', 'mean', 'std', 'var', 'min', 'max', 'count',
+                     'prod']:
+            for dim in [None, 'x', 'y']:
+                expected = getattr(v, name)(dim)
+                actual = getattr(chunked, name)(dim)
+                self.assertVariableAllClose(expected, actual)
+                self.assertEqual(expected.dtype, actual.dtype)
+        self.assertVariableAllClose(v.mean(skipna=False),
+                                    chunked.mean(skipna=False))
+        self.assertVariableAllClose(v.max('x', skipna=False),
+                                    chunked.max('x', skipna=False))
+        self.assertVariableAllClose(v.std('x', ddof=1),
+                                    chunked.std('x', ddof=1))
+
+        ints = Variable(['x'], np.arange(10)).chunk(3)
+        self.assertVariableIdentical(ints.sum(), Variable([], 45))
+        self.assertVariableIdentical(ints.mean(), Variable([], 4.5))
+
+    def test_chunk_cumulative(self):
+        data = np.random.RandomState(0).randn(10, 3)
+        data[2, 1] = np.nan
+        v = Variable(['x', 'y'], data)
+        chunked = v.chunk({'x': 3, 'y': 2})
+        for name in ['cumsum', 'cumprod']:
+            for dim in [None, 'x', 'y']:
+                for skipna in [True, False]:
+                    expected = getattr(v, name)(dim, skipna=skipna)
+                    actual = getattr(chunked, name)(dim, skipna=skipna)
+                    self.assertVariableAllClose(expected, actual)
+
 
 class TestCoordinate(TestCase, VariableSubclassTestCases):
     cls = staticmethod(Coordinate)
@@ -774,6 +882,30 @@ class TestCoordinate(TestCase, VariableSubclassTestCases):
         v = Coordinate(['time'], data, {'foo': 'bar'})
         self.assertTrue(pd.Index(data, name='time').identical(v.to_index()))
 
+    def test_to_index_cached(self):
+        index = pd.Index([10, 20, 30], name='x')
+        x = Coordinate('x', index)
+        # the same index (and its lookup caches) is reused
+        self.assertIs(x.to_index(), index)
+        self.assertIs(x.to_index(), x.to_index())
+        # coordinates sharing data with other names get their own index
+        y = Coordinate('y', x._data, fastpath=True)
+        data = y._data
+        self.assertEqual(y.to_index().name, 'y')
+        self.assertIs(y.to_index(), y.to_index())
+        self.assertIs(y._data, data)
+        self.assertIs(x.to_index(), index)
+        self.assertEqual(y.get_loc(20), 1)
+        # as do renamed coordinates
+        z = x.copy(deep=False)
+        z.dims = 'z'
+        self.assertEqual(z.to_index().name, 'z')
+        self.assertEqual(x.to_index().name, 'x')
+        # lazily loaded data is named once it is cached
+        w = Coordinate('w', np.array([1, 2]))
+        self.assertEqual(w.to_index().name, 'w')
+        self.assertIs(w.to_index(), w.to_index())
+
     def test_data(self):
         x = Coordinate('x', np.arange(3.0))
         # data should be initially saved as an ndarray